@@ -1,12 +1,61 @@
-from flask import Flask
-from flask_sqlalchemy import SQLAlchemy
+""" Server Management Tool.
 
-from app.config import Config
-from flask_migrate import Migrate
+    Application is created with create_app factory, which binds
+    extensions (see app.extensions) to it. Models and operations use
+    the unbound extensions, so they are imported without creating
+    the application and without importing Flask-Migrate.
+"""
 
 
-APP = Flask(__name__)
-APP.config.from_object(Config)
-APP.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
-DB = SQLAlchemy(APP)
-MIGRATE = Migrate(APP, DB)
+def create_app(config=None, **settings):
+    """ Create the application.
+
+        Usage:
+            app = create_app(SQLALCHEMY_DATABASE_URI="sqlite://")
+            with app.app_context():
+                ServerOp.get(name="web01")
+
+        Args:
+            config(object): configuration object, chosen with SMT_CONFIG
+                            environment variable by default (see get_config)
+            settings: configuration values overriding the config object
+
+        Returns:
+            app(Flask): application
+    """
+    from flask import Flask
+    from flask_migrate import Migrate
+
+    from app.config import get_config
+    from app.db.instrumentation import INSTRUMENTATION
+    from app.db.pool import engine_options
+    from app.db.slow_queries import SLOW_QUERIES
+    from app.extensions import DB
+    from app.metrics.prometheus import init_metrics
+    from app.views import DEBUG_VIEWS
+    from app.views import VIEWS
+
+    app = Flask(__name__)
+    app.config.from_object(config or get_config())
+    app.config["SQLALCHEMY_TRACK_MODIFICATIONS"] = False
+    app.config.update(settings)
+    app.config.setdefault("SQLALCHEMY_ENGINE_OPTIONS", engine_options(app.config))
+
+    DB.init_app(app)
+    Migrate(app, DB)
+    app.register_blueprint(VIEWS)
+    if app.config["DEBUG"] or app.config["DEBUG_ENDPOINTS"]:
+        app.register_blueprint(DEBUG_VIEWS)
+    init_metrics(app)
+
+    if app.config["OP_INSTRUMENTATION"]:
+        INSTRUMENTATION.enable()
+    if app.config["SLOW_QUERY_THRESHOLD"] > 0:
+        SLOW_QUERIES.configure(
+            app.config["SLOW_QUERY_THRESHOLD"],
+            redact_parameters=app.config["SLOW_QUERY_REDACT"],
+            explain=app.config["SLOW_QUERY_EXPLAIN"],
+            analyze=app.config["SLOW_QUERY_EXPLAIN_ANALYZE"],
+            size=app.config["SLOW_QUERY_TOP"],
+        )
+    return app
@@ -0,0 +1,167 @@
+""" In-process caches for database lookup tables."""
+import threading
+import time
+
+from flask import current_app
+from flask import has_app_context
+
+from app.extensions import DB
+from app.db.versions import get_versions
+from app.db.versions import version_column
+
+
+class CatalogCache:
+    """ Cache of small lookup table (e.g. ServerStatus), mapping row name
+        into row ID.
+
+        Whole table is loaded with one query on first use. It is loaded
+        again after invalidation by this process (every invalidation
+        increases generation counter), after the table is changed by any
+        process (its change version, see app.db.versions, is checked
+        at most every check_interval seconds), when loaded data is older
+        than ttl seconds, or when looked up name is not found - the row
+        could be added by other process since the last load.
+    """
+
+    def __init__(self, model, ttl=None, check_interval=None):
+        """ Constructor for CatalogCache.
+
+            Args:
+                model(DB.Model): lookup table model, with id and name columns
+                ttl(int): maximum age of loaded data in seconds, by default
+                          CATALOG_CACHE_TTL of application config, None
+                          without application if data never expires
+                check_interval(float): minimal time between checks of table
+                                       change version in seconds, by default
+                                       CATALOG_CACHE_CHECK_INTERVAL of
+                                       application config, None without
+                                       application if version is not checked
+        """
+        self.model = model
+        self.ttl = ttl
+        self.check_interval = check_interval
+        self.lock = threading.Lock()
+
+        self.ids = None
+        self.loaded_at = None
+        self.loaded_generation = None
+        self.loaded_version = None
+        self.checked_at = None
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.loads = 0
+
+    def settings(self):
+        """ Get ttl and check interval, from application config
+            if they are not given to constructor.
+
+            Returns:
+                ttl(int): maximum age of loaded data in seconds
+                check_interval(float): time between version checks
+        """
+        ttl, check_interval = self.ttl, self.check_interval
+        if has_app_context():
+            config = current_app.config
+            if ttl is None:
+                ttl = config.get("CATALOG_CACHE_TTL")
+            if check_interval is None:
+                check_interval = config.get("CATALOG_CACHE_CHECK_INTERVAL")
+        return ttl, check_interval
+
+    def shared_version(self):
+        """ Get change version of the table, shared by all processes."""
+        table_name = self.model.__tablename__
+        return get_versions([table_name])[table_name][0]
+
+    def is_stale(self):
+        """ Check if loaded data can not be used anymore.
+
+            Returns:
+                stale(bool): True if data must be loaded again
+        """
+        if self.ids is None or self.loaded_generation != self.generation:
+            return True
+
+        ttl, check_interval = self.settings()
+        now = time.monotonic()
+        if ttl is not None and now - self.loaded_at > ttl:
+            return True
+
+        if check_interval is not None and now - self.checked_at >= check_interval:
+            self.checked_at = now
+            return self.shared_version() != self.loaded_version
+
+        return False
+
+    def load(self):
+        """ Load all rows of the lookup table, with its change version
+            read in the same query. Version of empty table is read with
+            separate query, table without version row has version 0
+            (like in shared_version).
+        """
+        _, check_interval = self.settings()
+        columns = [self.model.id, self.model.name]
+        if check_interval is not None:
+            columns.append(version_column(self.model.__tablename__))
+
+        ids = dict()
+        version = None
+        for row in DB.session.query(*columns):
+            ids.setdefault(row[1], list()).append(row[0])
+            if check_interval is not None:
+                version = row[2] or 0
+        if check_interval is not None and not ids:
+            version = self.shared_version()
+
+        self.ids = ids
+        self.loaded_at = self.checked_at = time.monotonic()
+        self.loaded_generation = self.generation
+        self.loaded_version = version
+        self.loads += 1
+
+    def get_id(self, name):
+        """ Find ID of the row with given name.
+
+            Args:
+                name(str): row name
+
+            Returns:
+                row_id(int): row ID, or None if there is no row
+                             or more than one row with given name
+        """
+        with self.lock:
+            if not self.is_stale() and name in self.ids:
+                self.hits += 1
+            else:
+                self.misses += 1
+                self.load()
+
+            row_ids = self.ids.get(name, list())
+
+        if len(row_ids) != 1:
+            return None
+        return row_ids[0]
+
+    def invalidate(self):
+        """ Mark loaded data as outdated, after the lookup table change."""
+        with self.lock:
+            self.generation += 1
+
+    def stats(self):
+        """ Get cache metrics.
+
+            Returns:
+                stats(dict): hits and misses counts, number of table loads,
+                             current generation and number of cached names
+        """
+        with self.lock:
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "loads": self.loads,
+                "generation": self.generation,
+                "size": len(self.ids) if self.ids is not None else 0,
+            }
+        return stats
@@ -61,6 +61,14 @@ class IpAddressNotValidError(IpError):
     pass
 
 
+class IpNetworkNotValidError(IpError):
+    """ Exception for use in case of invalid Network parameter
+        in Ip model operations.
+    """
+
+    pass
+
+
 class ServerStatusError(DbError):
     """ Custom database operations exception for use
         in ServerStatus model operations.
@@ -177,6 +185,30 @@ class ServerDescriptionNotValidError(ServerError):
     pass
 
 
+class ServerLoadNotValidError(ServerError):
+    """ Exception for use in case of invalid Load parameter
+        in Server model operations.
+    """
+
+    pass
+
+
+class ServerLimitNotValidError(ServerError):
+    """ Exception for use in case of invalid Limit parameter
+        in Server model operations.
+    """
+
+    pass
+
+
+class ServerFieldsNotValidError(ServerError):
+    """ Exception for use in case of invalid Fields parameter
+        in Server model operations.
+    """
+
+    pass
+
+
 class ServerStatusNotFoundError(ServerError):
     """ Exception for use in case if ServerStatus not found
         during resolving parameter.
@@ -215,3 +247,44 @@ class ServerAdminNotFoundError(ServerError):
     """
 
     pass
+
+
+class ServerNotFoundError(ServerError):
+    """ Exception for use in case if Server with given ID not found."""
+
+    pass
+
+
+# Batch operations exceptions
+
+
+class BatchError(DbError):
+    """ Custom database operations exception for use
+        in batch operations.
+    """
+
+    pass
+
+
+class BatchModeNotValidError(BatchError):
+    """ Exception for use in case of invalid Mode parameter
+        in batch operations.
+    """
+
+    pass
+
+
+class BatchOperationNotValidError(BatchError):
+    """ Exception for use in case of invalid operation
+        in batch operations.
+    """
+
+    pass
+
+
+class BatchRowNotFoundError(BatchError):
+    """ Exception for use in case if row changed by operation
+        not found.
+    """
+
+    pass
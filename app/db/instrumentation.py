@@ -0,0 +1,380 @@
+""" Opt-in instrumentation of Op classes methods.
+
+    When enabled, every classmethod of the Op classes is wrapped with
+    a function recording its calls: latency histogram, number of calls,
+    errors by exception class and SQL statements executed by the call
+    (including calls of other methods made by it). When disabled,
+    original methods are restored, so there is no overhead at all.
+
+    Usage:
+        INSTRUMENTATION.enable()
+        ServerOp.get(tags=["web"])
+        INSTRUMENTATION.stats()["ServerOp.get"]["latency_us"]["p99"]
+        INSTRUMENTATION.dump("op_metrics.json")
+"""
+import functools
+import inspect
+import json
+import threading
+import time
+from array import array
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+from app.db.statements import TRANSACTION_CONTROL
+
+
+class LatencyHistogram:
+    """ Histogram of latencies in microseconds, with HDR-style log-linear
+        buckets: every power of two range is split into 64 linear buckets,
+        so recorded values keep relative precision of 1/64 (~1.6%), and
+        values below 128 us are exact. Memory is fixed - values above
+        the highest trackable value (about 71 minutes) are clamped.
+    """
+
+    SUB_BUCKET_BITS = 6
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+    MAX_VALUE = (1 << 32) - 1
+    PERCENTILES = (50, 90, 95, 99, 99.9)
+
+    def __init__(self):
+        """ Constructor for LatencyHistogram."""
+        self.counts = array("Q", [0]) * (self.bucket_index(self.MAX_VALUE) + 1)
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    @classmethod
+    def bucket_index(cls, value):
+        """ Get index of the bucket counting the value.
+
+            Args:
+                value(int): recorded value, 0 - MAX_VALUE
+
+            Returns:
+                index(int): bucket index
+        """
+        shift = max(0, value.bit_length() - cls.SUB_BUCKET_BITS - 1)
+        return shift * cls.SUB_BUCKETS + (value >> shift)
+
+    @classmethod
+    def bucket_range(cls, index):
+        """ Get range of values counted by the bucket.
+
+            Args:
+                index(int): bucket index
+
+            Returns:
+                lowest(int): lowest value of the bucket
+                highest(int): highest value of the bucket
+        """
+        shift = max(0, index // cls.SUB_BUCKETS - 1)
+        sub_bucket = index - shift * cls.SUB_BUCKETS
+        return sub_bucket << shift, ((sub_bucket + 1) << shift) - 1
+
+    def record(self, value):
+        """ Record value.
+
+            Args:
+                value(int): latency in microseconds
+        """
+        value = min(max(int(value), 0), self.MAX_VALUE)
+        self.counts[self.bucket_index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    def percentile(self, percent):
+        """ Get percentile of recorded values.
+
+            Args:
+                percent(float): percentile to get, 0-100
+
+            Returns:
+                value(int): highest value of the bucket holding percentile,
+                            (not higher than maximum recorded value),
+                            None if nothing is recorded
+        """
+        if not self.count:
+            return None
+
+        rank = max(1, -(-self.count * percent // 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if count and seen >= rank:
+                return min(self.bucket_range(index)[1], self.max)
+        return self.max
+
+    def buckets(self):
+        """ Get not empty buckets.
+
+            Returns:
+                buckets(list): tuples (highest value of the bucket, count)
+        """
+        return [
+            (self.bucket_range(index)[1], count)
+            for index, count in enumerate(self.counts)
+            if count
+        ]
+
+    def stats(self):
+        """ Get histogram summary.
+
+            Returns:
+                stats(dict): count, mean, minimum, maximum
+                             and percentiles of recorded values
+        """
+        stats = {
+            "count": self.count,
+            "mean": round(self.total / self.count, 1) if self.count else None,
+            "min": self.min,
+            "max": self.max,
+        }
+        for percent in self.PERCENTILES:
+            stats[f"p{percent:g}"] = self.percentile(percent)
+        return stats
+
+
+class OpMetrics:
+    """ Metrics of one Op method."""
+
+    def __init__(self, name):
+        """ Constructor for OpMetrics.
+
+            Args:
+                name(str): method name, e.g. ServerOp.get
+        """
+        self.name = name
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """ Forget recorded calls."""
+        self.latency = LatencyHistogram()
+        self.calls = 0
+        self.errors = dict()
+        self.statements = 0
+        self.statements_max = 0
+
+    def record(self, seconds, statements, error=None):
+        """ Record a call.
+
+            Args:
+                seconds(float): duration of the call
+                statements(int): number of SQL statements executed
+                error(Exception): exception raised by the call
+        """
+        with self.lock:
+            self.calls += 1
+            self.latency.record(seconds * 1000000)
+            self.statements += statements
+            self.statements_max = max(self.statements_max, statements)
+            if error is not None:
+                error_name = type(error).__name__
+                self.errors[error_name] = self.errors.get(error_name, 0) + 1
+
+    def stats(self):
+        """ Get method metrics.
+
+            Returns:
+                stats(dict): calls and errors counts, errors by exception
+                             class, statements per call (mean and max)
+                             and latency histogram summary (us)
+        """
+        with self.lock:
+            return {
+                "calls": self.calls,
+                "errors": sum(self.errors.values()),
+                "errors_by_class": dict(self.errors),
+                "statements_mean": round(self.statements / self.calls, 2)
+                if self.calls
+                else None,
+                "statements_max": self.statements_max,
+                "latency_us": self.latency.stats(),
+            }
+
+
+class OpInstrumentation:
+    """ Instrumentation of Op classes methods, see module docstring."""
+
+    def __init__(self):
+        """ Constructor for OpInstrumentation."""
+        self.lock = threading.Lock()
+        self.metrics = dict()
+        self.originals = list()
+        self.local = threading.local()
+
+    @property
+    def enabled(self):
+        return bool(self.originals)
+
+    @staticmethod
+    def op_classes():
+        """ Get instrumented Op classes."""
+        from app.db.operations.basic.admin import AdminOp
+        from app.db.operations.basic.ip import IpOp
+        from app.db.operations.basic.server import ServerOp
+        from app.db.operations.basic.server_status import ServerStatusOp
+        from app.db.operations.basic.server_type import ServerTypeOp
+        from app.db.operations.basic.tag import TagOp
+
+        return [AdminOp, IpOp, TagOp, ServerStatusOp, ServerTypeOp, ServerOp]
+
+    def statements(self):
+        """ Number of SQL statements executed by the current thread."""
+        return getattr(self.local, "statements", 0)
+
+    def before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        if not statement.lstrip().upper().startswith(TRANSACTION_CONTROL):
+            self.local.statements = self.statements() + 1
+
+    def get_metrics(self, name):
+        """ Get metrics of the method, created on first use."""
+        metrics = self.metrics.get(name)
+        if metrics is None:
+            with self.lock:
+                metrics = self.metrics.setdefault(name, OpMetrics(name))
+        return metrics
+
+    def instrument(self, name, function):
+        """ Wrap the method function with metrics recording.
+
+            Args:
+                name(str): method name, e.g. ServerOp.get
+                function(function): function of the classmethod
+
+            Returns:
+                wrapper(function): instrumented function
+        """
+        metrics = self.get_metrics(name)
+
+        if inspect.isgeneratorfunction(function):
+
+            @functools.wraps(function)
+            def generator_wrapper(*args, **kwargs):
+                # Only time spent inside the generator is recorded.
+                elapsed = 0.0
+                statements = 0
+                error = None
+                iterator = function(*args, **kwargs)
+                try:
+                    while True:
+                        start = time.perf_counter()
+                        start_statements = self.statements()
+                        try:
+                            item = next(iterator)
+                        finally:
+                            elapsed += time.perf_counter() - start
+                            statements += self.statements() - start_statements
+                        yield item
+                except StopIteration:
+                    return
+                except Exception as exc:
+                    error = exc
+                    raise
+                finally:
+                    iterator.close()
+                    metrics.record(elapsed, statements, error)
+
+            return generator_wrapper
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            start_statements = self.statements()
+            start = time.perf_counter()
+            try:
+                result = function(*args, **kwargs)
+            except Exception as exc:
+                metrics.record(
+                    time.perf_counter() - start,
+                    self.statements() - start_statements,
+                    exc,
+                )
+                raise
+            metrics.record(
+                time.perf_counter() - start, self.statements() - start_statements
+            )
+            return result
+
+        return wrapper
+
+    def enable(self, op_classes=None):
+        """ Start recording metrics of Op classes methods.
+
+            Args:
+                op_classes(list): instrumented classes, all Op classes
+                                  by default
+        """
+        if self.enabled:
+            return
+
+        for op_class in op_classes or self.op_classes():
+            for attr, value in list(vars(op_class).items()):
+                if not isinstance(value, classmethod):
+                    continue
+                name = f"{op_class.__name__}.{attr}"
+                wrapped = classmethod(self.instrument(name, value.__func__))
+                setattr(op_class, attr, wrapped)
+                self.originals.append((op_class, attr, value))
+
+        event.listen(Engine, "before_cursor_execute", self.before_cursor_execute)
+
+    def disable(self):
+        """ Stop recording metrics, restore original methods.
+            Recorded metrics are kept.
+        """
+        if not self.enabled:
+            return
+
+        event.remove(Engine, "before_cursor_execute", self.before_cursor_execute)
+        for op_class, attr, value in self.originals:
+            setattr(op_class, attr, value)
+        self.originals = list()
+
+    def reset(self):
+        """ Forget recorded metrics."""
+        with self.lock:
+            for metrics in self.metrics.values():
+                with metrics.lock:
+                    metrics.reset()
+
+    def stats(self):
+        """ Get metrics of called methods.
+
+            Returns:
+                stats(dict): method names mapped to their metrics,
+                             see OpMetrics.stats
+        """
+        return {
+            name: metrics.stats()
+            for name, metrics in sorted(self.metrics.items())
+            if metrics.calls
+        }
+
+    def dump(self, path=None):
+        """ Dump metrics as JSON.
+
+            Args:
+                path(str): file to write, None to only return JSON
+
+            Returns:
+                dump(str): metrics as JSON
+        """
+        dump = json.dumps(
+            {"enabled": self.enabled, "operations": self.stats()}, indent=4
+        )
+        if path is not None:
+            with open(path, "w") as dump_file:
+                dump_file.write(dump + "\n")
+        return dump
+
+
+INSTRUMENTATION = OpInstrumentation()
@@ -1,4 +1,4 @@
-from app import DB
+from app.extensions import DB
 
 
 class Admin(DB.Model):
@@ -0,0 +1,21 @@
+from app.extensions import DB
+
+
+class ChangeVersion(DB.Model):
+    """ ChangeVersion table model, see app.db.versions."""
+
+    __tablename__ = "change_version"
+
+    table_name = DB.Column(DB.String(), primary_key=True)
+    version = DB.Column(DB.Integer, nullable=False)
+    changed_at = DB.Column(DB.DateTime, nullable=False)
+
+    def __init__(self, table_name, version, changed_at):
+        """ Constructor for ChangeVersion model."""
+        self.table_name = table_name
+        self.version = version
+        self.changed_at = changed_at
+
+    def __repr__(self):
+        """ String representation of ChangeVersion model object."""
+        return f"{self.table_name}:{self.version}"
@@ -1,4 +1,5 @@
-from app import DB
+from app.extensions import DB
+from app.db.types import IpAddressType
 
 
 class Ip(DB.Model):
@@ -7,7 +8,7 @@ class Ip(DB.Model):
     __tablename__ = "ip"
 
     id = DB.Column(DB.Integer, primary_key=True)
-    address = DB.Column(DB.String(), nullable=False)
+    address = DB.Column(IpAddressType(), nullable=False, unique=True, index=True)
 
     def __init__(self, address):
         """ Constructor for Ip model."""
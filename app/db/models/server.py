@@ -1,4 +1,4 @@
-from app import DB
+from app.extensions import DB
 
 from app.db.models.server_status import ServerStatus
 from app.db.models.server_type import ServerType
@@ -8,6 +8,7 @@ server_ip = DB.Table(
     "server_ip",
     DB.Column("server_id", DB.Integer, DB.ForeignKey("server.id"), primary_key=True),
     DB.Column("ip_id", DB.Integer, DB.ForeignKey("ip.id"), primary_key=True),
+    DB.Index("ix_server_ip_ip_id_server_id", "ip_id", "server_id"),
 )
 
 
@@ -15,6 +16,7 @@ server_tag = DB.Table(
     "server_tag",
     DB.Column("server_id", DB.Integer, DB.ForeignKey("server.id"), primary_key=True),
     DB.Column("tag_id", DB.Integer, DB.ForeignKey("tag.id"), primary_key=True),
+    DB.Index("ix_server_tag_tag_id_server_id", "tag_id", "server_id"),
 )
 
 
@@ -22,6 +24,7 @@ server_admin = DB.Table(
     "server_admin",
     DB.Column("server_id", DB.Integer, DB.ForeignKey("server.id"), primary_key=True),
     DB.Column("admin_id", DB.Integer, DB.ForeignKey("admin.id"), primary_key=True),
+    DB.Index("ix_server_admin_admin_id_server_id", "admin_id", "server_id"),
 )
 
 
@@ -31,30 +34,34 @@ class Server(DB.Model):
     __tablename__ = "server"
 
     id = DB.Column(DB.Integer, primary_key=True)
-    name = DB.Column(DB.String(), nullable=False)
+    name = DB.Column(DB.String(), nullable=False, index=True)
     description = DB.Column(DB.String())
 
-    status_id = DB.Column(DB.Integer, DB.ForeignKey("server_status.id"), nullable=False)
-    type_id = DB.Column(DB.Integer, DB.ForeignKey("server_type.id"), nullable=False)
+    status_id = DB.Column(
+        DB.Integer, DB.ForeignKey("server_status.id"), nullable=False, index=True
+    )
+    type_id = DB.Column(
+        DB.Integer, DB.ForeignKey("server_type.id"), nullable=False, index=True
+    )
 
     ips = DB.relationship(
         "Ip",
         secondary=server_ip,
-        lazy="subquery",
+        lazy="select",
         backref=DB.backref("servers", lazy=True),
     )
 
     tags = DB.relationship(
         "Tag",
         secondary=server_tag,
-        lazy="subquery",
+        lazy="select",
         backref=DB.backref("servers", lazy=True),
     )
 
     admins = DB.relationship(
         "Admin",
         secondary=server_admin,
-        lazy="subquery",
+        lazy="select",
         backref=DB.backref("servers", lazy=True),
     )
 
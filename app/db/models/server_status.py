@@ -1,4 +1,4 @@
-from app import DB
+from app.extensions import DB
 from werkzeug.exceptions import NotFound
 
 
@@ -6,7 +6,7 @@ class ServerStatus(DB.Model):
     __tablename__ = "server_status"
 
     id = DB.Column(DB.Integer, primary_key=True)
-    name = DB.Column(DB.String(), nullable=False)
+    name = DB.Column(DB.String(), nullable=False, unique=True, index=True)
 
     servers = DB.relationship("Server", backref="status", lazy=True)
 
@@ -1,11 +1,11 @@
-from app import DB
+from app.extensions import DB
 
 
 class ServerType(DB.Model):
     __tablename__ = "server_type"
 
     id = DB.Column(DB.Integer, primary_key=True)
-    name = DB.Column(DB.String(), nullable=False)
+    name = DB.Column(DB.String(), nullable=False, unique=True, index=True)
     servers = DB.relationship("Server", backref="type", lazy=True)
 
     def __init__(self, name):
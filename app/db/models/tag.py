@@ -1,11 +1,11 @@
-from app import DB
+from app.extensions import DB
 
 
 class Tag(DB.Model):
     __tablename__ = "tag"
 
     id = DB.Column(DB.Integer, primary_key=True)
-    name = DB.Column(DB.String(), nullable=False)
+    name = DB.Column(DB.String(), nullable=False, unique=True, index=True)
 
     def __init__(self, name):
         """ Constructor for Tag model."""
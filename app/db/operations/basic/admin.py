@@ -1,6 +1,8 @@
 import re
 
-from app import DB
+from app.extensions import DB
+from app.db.transaction import commit
+from app.db.versions import bump_version
 from app.db.models.admin import Admin
 from app.db.exceptions import AdminIdNotValidError
 from app.db.exceptions import AdminNameNotValidError
@@ -9,6 +11,8 @@ from app.db.exceptions import AdminNameNotValidError
 class AdminOp:
     """ Operations for Admin model. """
 
+    TABLE = Admin.__tablename__
+
     @classmethod
     def validate_id(cls, id):
         """ Field: id validation.
@@ -70,6 +74,26 @@ class AdminOp:
 
         return result
 
+    @classmethod
+    def get_many(cls, names):
+        """ Get Admin rows which name field is one of given values,
+            using one query.
+
+            Args:
+                names(list): list of name fields (str) to find
+
+            Return:
+                result(list): list of row (Admin) objects
+        """
+        if not names:
+            return list()
+
+        for name in names:
+            cls.validate_name(name)
+
+        result = Admin.query.filter(Admin.name.in_(names)).all()
+        return result
+
     @classmethod
     def add(cls, name):
         """ Add new Admin row.
@@ -83,7 +107,8 @@ class AdminOp:
         cls.validate_name(name)
         new_admin = Admin(name)
         DB.session.add(new_admin)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
         return new_admin
 
     @classmethod
@@ -100,7 +125,8 @@ class AdminOp:
         cls.validate_name(name)
         admin_obj.name = name
         DB.session.add(admin_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
         return admin_obj
 
     @classmethod
@@ -111,4 +137,5 @@ class AdminOp:
                 admin_obj(Admin): existing Admin row object
         """
         DB.session.delete(admin_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
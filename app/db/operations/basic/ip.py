@@ -1,14 +1,19 @@
-import re
+import ipaddress
 
-from app import DB
+from app.extensions import DB
+from app.db.transaction import commit
+from app.db.versions import bump_version
 from app.db.models.ip import Ip
 from app.db.exceptions import IpIdNotValidError
 from app.db.exceptions import IpAddressNotValidError
+from app.db.exceptions import IpNetworkNotValidError
 
 
 class IpOp:
     """ Operations for Ip model. """
 
+    TABLE = Ip.__tablename__
+
     @classmethod
     def validate_id(cls, id):
         """ Field: id validation.
@@ -27,20 +32,88 @@ class IpOp:
         """ Field: address validation.
 
             Requirements:
-                - must consist of characters defined by regex:
-                  \d{1,3}.\d{1,3}.\d{1,3}
+                - must be valid IPv4 or IPv6 address
 
             Args:
-                address(str): Admin model name field
+                address(str): Ip model address field
         """
         if not isinstance(address, str):
             raise IpAddressNotValidError("Field: address must be String.")
 
-        if not re.match(r"\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}\Z", address):
+        try:
+            ipaddress.ip_address(address)
+        except ValueError:
             raise IpAddressNotValidError(
-                "Field: name does not match regex: " "\d{1,3}.\d{1,3}.\d{1,3}.\d{1,3}"
+                f"Field: address is not valid IP address: {address}."
             )
 
+    @classmethod
+    def normalize_address(cls, address):
+        """ Validate address and convert it into normalized form,
+            the same as addresses read from the database.
+
+            Args:
+                address(str): Ip model address field
+
+            Returns:
+                normalized(str): normalized address
+        """
+        cls.validate_address(address)
+        normalized = str(ipaddress.ip_address(address))
+        return normalized
+
+    @classmethod
+    def validate_network(cls, network):
+        """ Network parameter validation.
+
+            Requirements:
+                - must be valid IPv4 or IPv6 network in CIDR notation,
+                  host bits are ignored
+
+            Args:
+                network(str): network, e.g. 10.20.0.0/16
+        """
+        if not isinstance(network, str):
+            raise IpNetworkNotValidError("Field: network must be String.")
+
+        try:
+            ipaddress.ip_network(network, strict=False)
+        except ValueError:
+            raise IpNetworkNotValidError(
+                f"Field: network is not valid CIDR network: {network}."
+            )
+
+    @classmethod
+    def network_range(cls, network):
+        """ Get first and last address of the network.
+
+            Args:
+                network(str): network in CIDR notation
+
+            Returns:
+                first(str): first address of the network
+                last(str): last address of the network
+        """
+        cls.validate_network(network)
+        ip_network = ipaddress.ip_network(network, strict=False)
+        return str(ip_network.network_address), str(ip_network.broadcast_address)
+
+    @classmethod
+    def network_filter(cls, network):
+        """ Build clause matching Ip rows which address belongs to the network.
+            Clause compares address with network bounds, so the address
+            index is used for range scan.
+
+            Args:
+                network(str): network in CIDR notation
+
+            Returns:
+                clause(BinaryExpression): clause for use in Ip query filter
+        """
+        first, last = cls.network_range(network)
+        clause = Ip.address.between(first, last)
+        return clause
+
     @classmethod
     def get(cls, id=None, address=None):
         """ Get Ip rows filtered by parameters.
@@ -65,6 +138,40 @@ class IpOp:
 
         return result
 
+    @classmethod
+    def get_many(cls, addresses):
+        """ Get Ip rows which address field is one of given values,
+            using one query.
+
+            Args:
+                addresses(list): list of address fields (str) to find
+
+            Return:
+                result(list): list of row (Ip) objects
+        """
+        if not addresses:
+            return list()
+
+        for address in addresses:
+            cls.validate_address(address)
+
+        result = Ip.query.filter(Ip.address.in_(addresses)).all()
+        return result
+
+    @classmethod
+    def get_in_network(cls, network):
+        """ Get Ip rows which address belongs to the network.
+
+            Args:
+                network(str): network in CIDR notation, e.g. 10.20.0.0/16
+
+            Return:
+                result(list): list of row (Ip) objects, ordered by address
+        """
+        clause = cls.network_filter(network)
+        result = Ip.query.filter(clause).order_by(Ip.address).all()
+        return result
+
     @classmethod
     def add(cls, address):
         """ Add new Ip row.
@@ -75,10 +182,11 @@ class IpOp:
             Returns:
                 new_ip(Admin): Ip row object
         """
-        cls.validate_address(address)
+        address = cls.normalize_address(address)
         new_ip = Ip(address)
         DB.session.add(new_ip)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
         return new_ip
 
     @classmethod
@@ -92,10 +200,11 @@ class IpOp:
             Returns:
                 ip_obj(Ip): updated Ip row object
         """
-        cls.validate_address(address)
+        address = cls.normalize_address(address)
         ip_obj.address = address
         DB.session.add(ip_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
         return ip_obj
 
     @classmethod
@@ -106,13 +215,5 @@ class IpOp:
                 ip_obj(Ip): existing Ip row object
         """
         DB.session.delete(ip_obj)
-        DB.session.commit()
-
-
-if __name__ == "__main__":
-
-    fo = IpOp.get(id=2)
-    IpOp.delete(fo[0])
-
-    for i in IpOp.get():
-        print(i.id, i.address)
+        bump_version(cls.TABLE)
+        commit()
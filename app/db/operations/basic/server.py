@@ -1,13 +1,36 @@
 import re
 
-from app import DB
+from collections import namedtuple
+from functools import lru_cache
+
+from sqlalchemy import and_
+from sqlalchemy import exists
+from sqlalchemy import func
+from sqlalchemy import select
+from sqlalchemy.orm import joinedload
+from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import subqueryload
+
+from app.extensions import DB
+from app.db.transaction import commit
+from app.db.transaction import transaction
+from app.db.versions import bump_version
+from app.db.models.ip import Ip
+from app.db.models.tag import Tag
+from app.db.models.admin import Admin
 from app.db.models.server import Server
+from app.db.models.server import server_ip
+from app.db.models.server import server_tag
+from app.db.models.server import server_admin
+from app.db.models.server_status import ServerStatus
+from app.db.models.server_type import ServerType
 from app.db.operations.basic.server_status import ServerStatusOp
 from app.db.operations.basic.server_type import ServerTypeOp
 from app.db.operations.basic.ip import IpOp
 from app.db.operations.basic.tag import TagOp
 from app.db.operations.basic.admin import AdminOp
 
+from app.db.exceptions import DbError
 from app.db.exceptions import ServerStatusError
 from app.db.exceptions import ServerTypeError
 from app.db.exceptions import IpError
@@ -17,6 +40,9 @@ from app.db.exceptions import AdminError
 from app.db.exceptions import ServerIdNotValidError
 from app.db.exceptions import ServerNameNotValidError
 from app.db.exceptions import ServerDescriptionNotValidError
+from app.db.exceptions import ServerLoadNotValidError
+from app.db.exceptions import ServerLimitNotValidError
+from app.db.exceptions import ServerFieldsNotValidError
 from app.db.exceptions import ServerStatusNotFoundError
 from app.db.exceptions import ServerTypeNotFoundError
 from app.db.exceptions import ServerIpNotFoundError
@@ -27,6 +53,27 @@ from app.db.exceptions import ServerAdminNotFoundError
 class ServerOp:
     """ Operations for Server model."""
 
+    TABLE = Server.__tablename__
+    COLLECTIONS = ("ips", "tags", "admins")
+    LOAD_STRATEGIES = {
+        "selectin": selectinload,
+        "joined": joinedload,
+        "subquery": subqueryload,
+    }
+    ROW_COLUMNS = {
+        "id": Server.id,
+        "name": Server.name,
+        "description": Server.description,
+        "status": ServerStatus.name,
+        "type": ServerType.name,
+    }
+    ROW_COLLECTIONS = {
+        "ips": (server_ip.c.ip_id, Ip.id, Ip.address),
+        "tags": (server_tag.c.tag_id, Tag.id, Tag.name),
+        "admins": (server_admin.c.admin_id, Admin.id, Admin.name),
+    }
+    ROW_FIELDS = ("id", "name", "status", "type")
+
     @classmethod
     def validate_id(cls, id):
         """ Field: id validation.
@@ -64,6 +111,23 @@ class ServerOp:
                 "Field: name does not match regex: [A-Za-z0-9_]+"
             )
 
+    @classmethod
+    def validate_limit(cls, limit):
+        """ Field: limit validation.
+
+            Requirements:
+                - must be integer
+                - must be greater than 0
+
+            Args:
+                limit(int): maximum number of Server rows fetched at once
+        """
+        if not isinstance(limit, int):
+            raise ServerLimitNotValidError("Field: limit must be Integer.")
+
+        if limit < 1:
+            raise ServerLimitNotValidError("Field: limit must be greater than 0.")
+
     @classmethod
     def validate_description(cls, desc):
         """ Field: name validation.
@@ -88,10 +152,52 @@ class ServerOp:
                 "Field: name does not match regex: [A-Za-z0-9_ ]+"
             )
 
+    @classmethod
+    def load_options(cls, load):
+        """ Translate load parameter into query options loading
+            Server collections (ips, tags, admins) together with Server rows.
+
+            Requirements:
+                - must be None or "none" (collections loaded lazily on access),
+                  name of the strategy: "selectin", "joined", "subquery"
+                  (all collections loaded with the strategy),
+                  or list of collections names (loaded with "selectin")
+
+            Args:
+                load(str, list): loading strategy or collections to load
+
+            Returns:
+                options(list): list of query loader options
+        """
+        if load is None or load == "none":
+            return list()
+
+        if isinstance(load, str):
+            if load not in cls.LOAD_STRATEGIES:
+                raise ServerLoadNotValidError(
+                    f"Field: load must be one of: none, "
+                    f"{', '.join(cls.LOAD_STRATEGIES)} or list of collections."
+                )
+            strategy = cls.LOAD_STRATEGIES[load]
+            collections = cls.COLLECTIONS
+        elif isinstance(load, (list, tuple, set)):
+            unknown = [name for name in load if name not in cls.COLLECTIONS]
+            if unknown:
+                raise ServerLoadNotValidError(
+                    f"Field: load contains unknown collections: {', '.join(unknown)}."
+                )
+            strategy = selectinload
+            collections = [name for name in cls.COLLECTIONS if name in load]
+        else:
+            raise ServerLoadNotValidError("Field: load must be String or List.")
+
+        options = [strategy(getattr(Server, name)) for name in collections]
+        return options
+
     @classmethod
     def resolve_status(cls, status_name):
-        """ Find ServerStatus record according to given name.
-            Return ID of status row.
+        """ Find ServerStatus record according to given name,
+            in the ServerStatus cache. Return ID of status row.
 
             Args:
                 status_name(str): ServerStatus record name
@@ -99,18 +205,17 @@ class ServerOp:
             Returns:
                 status_id(int): ServerStatus record ID
         """
-        status_results = ServerStatusOp.get(name=status_name)
+        status_id = ServerStatusOp.get_id(status_name)
 
-        if len(status_results) is not 1:
+        if status_id is None:
             raise ServerStatusNotFoundError(f'Not found status name: "{status_name}".')
 
-        status_id = status_results[0].id
         return status_id
 
     @classmethod
     def resolve_type(cls, type_name):
-        """ Find ServerType record according to given name.
-            Return ID of type row.
+        """ Find ServerType record according to given name,
+            in the ServerType cache. Return ID of type row.
 
             Args:
                 type_name(str): ServerType record name
@@ -118,12 +223,11 @@ class ServerOp:
             Returns:
                 type_id(int): ServerType record ID
         """
-        type_results = ServerTypeOp.get(name=type_name)
+        type_id = ServerTypeOp.get_id(type_name)
 
-        if len(type_results) is not 1:
+        if type_id is None:
             raise ServerTypeNotFoundError(f'Not found type name: "{type_name}".')
 
-        type_id = type_results[0].id
         return type_id
 
     @classmethod
@@ -146,45 +250,137 @@ class ServerOp:
         return ip_obj
 
     @classmethod
-    def resolve_tag(cls, tag_name):
-        """ Find Tag record according to given address.
-            Return Tag model object.
+    def match_rows(cls, keys, rows, field):
+        """ Match rows to given keys by value of given field.
+            Key is matched only if exactly one row has its value,
+            duplicated keys are matched once.
 
             Args:
-                tag_name(str): tag to find
+                keys(list): values to match
+                rows(list): model objects to match against
+                field(str): name of compared model field
 
             Returns:
-                tag_obj(app.db.models.tag.Tag): Tag object
+                matched(list): matched objects, in order of given keys
+                missing(list): keys without exactly one matching row
         """
-        tag_results = TagOp.get(name=tag_name)
+        found = dict()
+        for row in rows:
+            found.setdefault(getattr(row, field), list()).append(row)
 
-        if len(tag_results) is not 1:
-            raise ServerTagNotFoundError(f"Not found Tag: {tag_name}.")
+        matched = list()
+        missing = list()
+        for key in dict.fromkeys(keys):
+            key_rows = found.get(key, list())
+            if len(key_rows) != 1:
+                missing.append(key)
+            else:
+                matched.append(key_rows[0])
 
-        tag_obj = tag_results[0]
-        return tag_obj
+        return matched, missing
 
     @classmethod
-    def resolve_admin(cls, admin_name):
-        """ Find Admin record according to given name.
-            Return Admin model object.
+    def resolve_ips(cls, ip_addresses):
+        """ Find Ip records according to given addresses, using one query.
+            Return Ip model objects.
 
             Args:
-                admin_name(str): name to find
+                ip_addresses(list): addresses (str) to find
 
             Returns:
-                admin_obj(app.db.models.admin.Admin): admin object
+                ip_objs(list): list of Ip objects
         """
-        admin_results = AdminOp.get(name=admin_name)
+        ip_addresses = [IpOp.normalize_address(ip) for ip in ip_addresses]
+        ip_results = IpOp.get_many(ip_addresses)
+        ip_objs, missing = cls.match_rows(ip_addresses, ip_results, "address")
 
-        if len(admin_results) is not 1:
-            raise ServerAdminNotFoundError(f"Not found Admin: {admin_name}.")
+        if missing:
+            raise ServerIpNotFoundError(
+                f"Not found IP addresses: {', '.join(missing)}."
+            )
 
-        admin_obj = admin_results[0]
-        return admin_obj
+        return ip_objs
 
     @classmethod
-    def get(
+    def resolve_tags(cls, tag_names):
+        """ Find Tag records according to given names, using one query.
+            Return Tag model objects.
+
+            Args:
+                tag_names(list): tags (str) to find
+
+            Returns:
+                tag_objs(list): list of Tag objects
+        """
+        tag_results = TagOp.get_many(tag_names)
+        tag_objs, missing = cls.match_rows(tag_names, tag_results, "name")
+
+        if missing:
+            raise ServerTagNotFoundError(f"Not found Tags: {', '.join(missing)}.")
+
+        return tag_objs
+
+    @classmethod
+    def resolve_admins(cls, admin_names):
+        """ Find Admin records according to given names, using one query.
+            Return Admin model objects.
+
+            Args:
+                admin_names(list): names (str) to find
+
+            Returns:
+                admin_objs(list): list of Admin objects
+        """
+        admin_results = AdminOp.get_many(admin_names)
+        admin_objs, missing = cls.match_rows(admin_names, admin_results, "name")
+
+        if missing:
+            raise ServerAdminNotFoundError(f"Not found Admins: {', '.join(missing)}.")
+
+        return admin_objs
+
+    @classmethod
+    def related_filter(cls, assoc_column, row_id):
+        """ Build EXISTS clause matching Server rows bounded
+            to given row through the association table.
+
+            Args:
+                assoc_column(Column): association table column
+                                      referencing related row
+                                      (e.g. server_tag.c.tag_id)
+                row_id(int): related row ID
+
+            Returns:
+                clause(Exists): clause for use in Server query filter
+        """
+        assoc_table = assoc_column.table
+        clause = exists().where(
+            and_(assoc_table.c.server_id == Server.id, assoc_column == row_id)
+        )
+        return clause
+
+    @classmethod
+    def network_filter(cls, network):
+        """ Build EXISTS clause matching Server rows bounded
+            to any Ip from the network.
+
+            Args:
+                network(str): network in CIDR notation, e.g. 10.20.0.0/16
+
+            Returns:
+                clause(Exists): clause for use in Server query filter
+        """
+        clause = exists().where(
+            and_(
+                server_ip.c.server_id == Server.id,
+                server_ip.c.ip_id == Ip.id,
+                IpOp.network_filter(network),
+            )
+        )
+        return clause
+
+    @classmethod
+    def build_query(
         cls,
         id=None,
         name=None,
@@ -193,8 +389,10 @@ class ServerOp:
         ip=None,
         tags=None,
         admins=None,
+        network=None,
+        load=None,
     ):
-        """ Get Server rows filtered by parameters.
+        """ Build Server query filtered by parameters.
 
             Args:
                 id(int): filter by id field
@@ -204,12 +402,17 @@ class ServerOp:
                 ip(str): filter by Ip address
                 tags(list): filter by list of tags
                 admins(list): filter by list of admins names
+                network(str): filter by network of Ip addresses (CIDR)
+                load(str, list): collections loading strategy,
+                                 see load_options method
 
             Returns:
-                result(list): list of row (Server) objects
+                query(Query): Server query
         """
+        options = cls.load_options(load)
+
         filters = dict()
-        if id:
+        if id is not None:
             cls.validate_id(id)
             filters.update({"id": id})
         if name:
@@ -222,24 +425,383 @@ class ServerOp:
             srv_type_id = cls.resolve_type(srv_type)
             filters.update({"type_id": srv_type_id})
 
-        result = Server.query.filter_by(**filters).all()
+        query = Server.query.filter_by(**filters)
 
         if ip:
             ip_obj = cls.resolve_ip(ip)
-            result = [srv for srv in result if ip_obj in srv.ips]
+            query = query.filter(cls.related_filter(server_ip.c.ip_id, ip_obj.id))
+
+        if network:
+            query = query.filter(cls.network_filter(network))
 
         if tags:
-            for tag in tags:
-                tag_obj = cls.resolve_tag(tag)
-                result = [srv for srv in result if tag_obj in srv.tags]
+            for tag_obj in cls.resolve_tags(tags):
+                query = query.filter(
+                    cls.related_filter(server_tag.c.tag_id, tag_obj.id)
+                )
 
         if admins:
-            for admin in admins:
-                adm_obj = cls.resolve_admin(admin)
-                result = [srv for srv in result if adm_obj in srv.admins]
+            for adm_obj in cls.resolve_admins(admins):
+                query = query.filter(
+                    cls.related_filter(server_admin.c.admin_id, adm_obj.id)
+                )
+
+        if options:
+            query = query.options(*options)
+
+        return query
+
+    @classmethod
+    def get(
+        cls,
+        id=None,
+        name=None,
+        srv_status=None,
+        srv_type=None,
+        ip=None,
+        tags=None,
+        admins=None,
+        network=None,
+        load=None,
+    ):
+        """ Get Server rows filtered by parameters.
+
+            Args:
+                id(int): filter by id field
+                name(str): filter by name field
+                srv_status(str): filter by ServerStatus name
+                srv_type(str): filter by ServerType name
+                ip(str): filter by Ip address
+                tags(list): filter by list of tags
+                admins(list): filter by list of admins names
+                network(str): filter by network of Ip addresses (CIDR)
+                load(str, list): collections loading strategy,
+                                 see load_options method
+
+            Returns:
+                result(list): list of row (Server) objects
+        """
+        query = cls.build_query(
+            id=id,
+            name=name,
+            srv_status=srv_status,
+            srv_type=srv_type,
+            ip=ip,
+            tags=tags,
+            admins=admins,
+            network=network,
+            load=load,
+        )
+        result = query.all()
+        return result
+
+    @classmethod
+    def keyset_page(cls, query, after_id, limit):
+        """ Get one page of Server rows from the query, ordered by id.
+            Page starts after the row with given ID (keyset pagination),
+            so no rows are skipped by the database like with OFFSET.
+
+            Args:
+                query(Query): Server query
+                after_id(int): ID of the last row of the previous page,
+                               None for the first page
+                limit(int): maximum number of rows on the page
+
+            Returns:
+                rows(list): list of row (Server) objects
+                cursor(int): after_id of the next page,
+                             None if there are no more rows
+        """
+        if after_id is not None:
+            query = query.filter(Server.id > after_id)
+
+        rows = query.order_by(Server.id).limit(limit + 1).all()
+
+        cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            cursor = rows[-1].id
+
+        return rows, cursor
+
+    @classmethod
+    def page(cls, after_id=None, limit=100, **filters):
+        """ Get one page of Server rows filtered by parameters.
+
+            Args:
+                after_id(int): cursor returned with the previous page,
+                               None for the first page
+                limit(int): maximum number of rows on the page
+                filters: filter parameters of get method
+
+            Returns:
+                rows(list): list of row (Server) objects
+                cursor(int): cursor of the next page,
+                             None if there are no more rows
+        """
+        if after_id is not None:
+            cls.validate_id(after_id)
+        cls.validate_limit(limit)
+
+        query = cls.build_query(**filters)
+        return cls.keyset_page(query, after_id, limit)
+
+    @classmethod
+    def iter(cls, batch_size=1000, **filters):
+        """ Iterate over Server rows filtered by parameters.
+            Rows are fetched in batches with keyset pagination,
+            so only one batch is held in memory at a time.
+            Parameters are validated when the method is called,
+            rows are fetched while they are iterated.
+
+            Args:
+                batch_size(int): number of rows fetched at once
+                filters: filter parameters of get method
+
+            Returns:
+                rows(generator): Server row objects, ordered by id
+        """
+        cls.validate_limit(batch_size)
+
+        query = cls.build_query(**filters)
+        return cls.iter_pages(query, batch_size)
+
+    @classmethod
+    def iter_pages(cls, query, batch_size):
+        """ Fetch rows of the query page by page, see iter method.
+
+            Args:
+                query(Query): Server query
+                batch_size(int): number of rows fetched at once
+
+            Yields:
+                row(Server): Server row object
+        """
+        cursor = None
+        while True:
+            rows, cursor = cls.keyset_page(query, cursor, batch_size)
+            yield from rows
+            if cursor is None:
+                break
+
+    @classmethod
+    def validate_fields(cls, fields):
+        """ Field: fields validation.
+
+            Requirements:
+                - must be list, tuple or set
+                - must contain only names of Server row fields:
+                  id, name, description, status, type, ips, tags, admins
+
+            Args:
+                fields(list): names of Server row fields
+        """
+        if not isinstance(fields, (list, tuple, set)) or not fields:
+            raise ServerFieldsNotValidError("Field: fields must be non-empty List.")
+
+        known = list(cls.ROW_COLUMNS) + list(cls.ROW_COLLECTIONS)
+        unknown = [field for field in fields if field not in known]
+        if unknown:
+            raise ServerFieldsNotValidError(
+                f"Field: fields contains unknown fields: {', '.join(unknown)}."
+            )
+
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def row_type(fields):
+        """ Get record type of Server rows with given fields.
+            Records are namedtuples, so they hold no per-instance
+            dict and are not tracked by the session.
+
+            Args:
+                fields(tuple): names of Server row fields
+
+            Returns:
+                row_type(type): namedtuple class
+        """
+        return namedtuple("ServerRow", fields)
+
+    @classmethod
+    def get_collection_values(cls, collection, server_ids):
+        """ Get values of related rows (Ip addresses, Tag or Admin names)
+            of many Server rows, with one query. Equal values are shared
+            between Server rows.
+
+            Args:
+                collection(str): name of Server collection: ips, tags, admins
+                server_ids(Select, list): statement selecting IDs
+                                          of Server rows, or list of IDs
+
+            Returns:
+                values(dict): Server row ID mapped to tuple of values
+        """
+        assoc_column, related_id, related_value = cls.ROW_COLLECTIONS[collection]
+        server_id = assoc_column.table.c.server_id
+
+        query = (
+            select([server_id, related_value])
+            .select_from(
+                assoc_column.table.join(related_id.table, related_id == assoc_column)
+            )
+            .where(server_id.in_(server_ids))
+            .order_by(server_id, related_value)
+        )
+
+        values = dict()
+        unique = dict()
+        for srv_id, value in DB.session.execute(query):
+            values.setdefault(srv_id, list()).append(unique.setdefault(value, value))
+        return {srv_id: tuple(srv_values) for srv_id, srv_values in values.items()}
+
+    @classmethod
+    def row_fields(cls, fields):
+        """ Validate fields of Server row records.
+
+            Args:
+                fields(list): names of fields, None for ROW_FIELDS
+
+            Returns:
+                fields(tuple): names of fields, without duplicates
+        """
+        if fields is None:
+            fields = cls.ROW_FIELDS
+        cls.validate_fields(fields)
+        return tuple(dict.fromkeys(fields))
+
+    @classmethod
+    def row_statement(cls, query, fields):
+        """ Build statement selecting Server row ID and columns of fields,
+            with status and type names joined, ordered by id.
+
+            Args:
+                query(Query): Server query
+                fields(tuple): names of Server row fields
+
+            Returns:
+                statement(Select): statement selecting row ID and columns
+        """
+        columns = [
+            cls.ROW_COLUMNS[field] for field in fields if field in cls.ROW_COLUMNS
+        ]
+        row_query = query.with_entities(Server.id.label("row_id"), *columns)
+        if "status" in fields:
+            row_query = row_query.join(
+                ServerStatus, ServerStatus.id == Server.status_id
+            )
+        if "type" in fields:
+            row_query = row_query.join(ServerType, ServerType.id == Server.type_id)
+        return row_query.order_by(Server.id).statement
+
+    @classmethod
+    def make_rows(cls, fields, rows, collection_values):
+        """ Make records of selected Server rows.
+
+            Args:
+                fields(tuple): names of Server row fields
+                rows(list): rows selected by row_statement
+                collection_values(dict): collection names mapped to values
+                                         of Server rows, see
+                                         get_collection_values method
 
+            Returns:
+                result(list): list of records (namedtuples)
+        """
+        column_fields = [field for field in fields if field in cls.ROW_COLUMNS]
+        row_type = cls.row_type(fields)
+        result = list()
+        for row in rows:
+            values = dict(zip(column_fields, row[1:]))
+            for collection, srv_values in collection_values.items():
+                values[collection] = srv_values.get(row[0], ())
+            result.append(row_type(**values))
         return result
 
+    @classmethod
+    def get_rows(cls, fields=None, **filters):
+        """ Get Server rows filtered by parameters, as lightweight records
+            with chosen fields only. Only needed columns are selected,
+            status and type names are joined, collections are fetched
+            with one query each. No Server objects are created.
+
+            Args:
+                fields(list): names of fields of the records: id, name,
+                              description, status, type (names of
+                              ServerStatus and ServerType), ips, tags,
+                              admins (tuples of Ip addresses, Tag
+                              and Admin names); by default ROW_FIELDS
+                filters: filter parameters of get method, except load
+
+            Returns:
+                result(list): list of records (namedtuples), ordered by id
+        """
+        fields = cls.row_fields(fields)
+
+        query = cls.build_query(**filters)
+        rows = DB.session.execute(cls.row_statement(query, fields))
+
+        id_query = query.with_entities(Server.id).statement
+        collection_values = {
+            collection: cls.get_collection_values(collection, id_query)
+            for collection in fields
+            if collection in cls.ROW_COLLECTIONS
+        }
+        return cls.make_rows(fields, rows, collection_values)
+
+    @classmethod
+    def stream_rows(cls, fields=None, batch_size=1000, **filters):
+        """ Get Server rows filtered by parameters, as records like
+            get_rows method, in batches read from server side cursor.
+            Parameters are validated when the method is called, rows
+            are fetched while batches are iterated, so only one batch
+            is held in memory at a time, whatever the number of rows.
+            Collections are fetched with one query per batch each.
+
+            Args:
+                fields(list): names of fields of the records,
+                              see get_rows method
+                batch_size(int): number of rows fetched at once
+                filters: filter parameters of get method, except load
+
+            Returns:
+                batches(generator): lists of records (namedtuples),
+                                    ordered by id
+        """
+        fields = cls.row_fields(fields)
+        cls.validate_limit(batch_size)
+
+        query = cls.build_query(**filters)
+        statement = cls.row_statement(query, fields)
+        return cls.fetch_rows(fields, statement, batch_size)
+
+    @classmethod
+    def fetch_rows(cls, fields, statement, batch_size):
+        """ Fetch records of Server rows in batches, see stream_rows method.
+
+            Args:
+                fields(tuple): names of Server row fields
+                statement(Select): statement built by row_statement method
+                batch_size(int): number of rows fetched at once
+
+            Yields:
+                batch(list): list of records (namedtuples)
+        """
+        collections = [field for field in fields if field in cls.ROW_COLLECTIONS]
+        result = DB.session.execute(statement.execution_options(stream_results=True))
+        try:
+            while True:
+                rows = result.fetchmany(batch_size)
+                if not rows:
+                    break
+
+                server_ids = [row[0] for row in rows]
+                collection_values = {
+                    collection: cls.get_collection_values(collection, server_ids)
+                    for collection in collections
+                }
+                yield cls.make_rows(fields, rows, collection_values)
+        finally:
+            result.close()
+
     @classmethod
     def add(
         cls,
@@ -270,15 +832,276 @@ class ServerOp:
         srv_type_id = cls.resolve_type(srv_type)
         new_server = Server(name, srv_type_id, srv_status_id, description)
         if ips:
-            new_server.ips = [cls.resolve_ip(ip) for ip in ips]
+            new_server.ips = cls.resolve_ips(ips)
         if tags:
-            new_server.tags = [cls.resolve_tag(tag) for tag in tags]
+            new_server.tags = cls.resolve_tags(tags)
         if admins:
-            new_server.admins = [cls.resolve_admin(admin) for admin in admins]
+            new_server.admins = cls.resolve_admins(admins)
         DB.session.add(new_server)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
         return new_server
 
+    @classmethod
+    def validate_record(cls, record):
+        """ Validation of all fields of the Server record
+            used in bulk operations.
+
+            Args:
+                record(dict): Server fields, keys as in add method arguments
+        """
+        cls.validate_name(record.get("name"))
+        if record.get("description") is not None:
+            cls.validate_description(record["description"])
+        ServerStatusOp.validate_name(record.get("srv_status"))
+        ServerTypeOp.validate_name(record.get("srv_type"))
+        for ip in record.get("ips") or list():
+            IpOp.validate_address(ip)
+        for tag in record.get("tags") or list():
+            TagOp.validate_name(tag)
+        for admin in record.get("admins") or list():
+            AdminOp.validate_name(admin)
+
+    @classmethod
+    def collect_values(cls, records, key):
+        """ Collect values stored under given key in all records.
+            List values are flattened.
+
+            Args:
+                records(list): list of dicts with Server fields
+                key(str): name of the field
+
+            Returns:
+                values(list): collected values
+        """
+        values = list()
+        for record in records:
+            value = record.get(key)
+            if isinstance(value, list):
+                values.extend(value)
+            elif value is not None:
+                values.append(value)
+        return values
+
+    @classmethod
+    def lookup_ids(cls, model_op, values, field):
+        """ Find IDs of rows which field matches given values, using one query.
+            Values matched by more than one row are omitted, like in resolvers.
+
+            Args:
+                model_op(class): operations class of the model (e.g. TagOp)
+                values(list): values to find
+                field(str): name of the compared model field
+
+            Returns:
+                ids(dict): mapping of found value to the row ID
+        """
+        values = list(dict.fromkeys(values))
+        rows = model_op.get_many(values)
+        matched, _ = cls.match_rows(values, rows, field)
+        ids = {getattr(row, field): row.id for row in matched}
+        return ids
+
+    @classmethod
+    def find_ids(cls, values, ids):
+        """ Translate values into row IDs with use of the mapping
+            returned by lookup_ids method.
+
+            Args:
+                values(list): values to translate
+                ids(dict): mapping of value to the row ID
+
+            Returns:
+                found(list): IDs of found rows, without duplicates
+                missing(list): values not present in the mapping
+        """
+        found = list()
+        missing = list()
+        for value in dict.fromkeys(values or list()):
+            if value in ids:
+                found.append(ids[value])
+            else:
+                missing.append(value)
+        return found, missing
+
+    @classmethod
+    def resolve_record(cls, record, lookups):
+        """ Translate names of the Server record related rows into IDs.
+
+            Args:
+                record(dict): Server fields, keys as in add method arguments
+                lookups(dict): lookup_ids mappings under the record keys:
+                               srv_status, srv_type, ips, tags, admins
+
+            Returns:
+                server_row(dict): Server table row, ready to insert
+                related(dict): IDs of rows bounded to the server
+                               under keys: ips, tags, admins
+        """
+        srv_status = record["srv_status"]
+        if srv_status not in lookups["srv_status"]:
+            raise ServerStatusNotFoundError(f'Not found status name: "{srv_status}".')
+
+        srv_type = record["srv_type"]
+        if srv_type not in lookups["srv_type"]:
+            raise ServerTypeNotFoundError(f'Not found type name: "{srv_type}".')
+
+        ip_ids, missing = cls.find_ids(record.get("ips"), lookups["ips"])
+        if missing:
+            raise ServerIpNotFoundError(
+                f"Not found IP addresses: {', '.join(missing)}."
+            )
+
+        tag_ids, missing = cls.find_ids(record.get("tags"), lookups["tags"])
+        if missing:
+            raise ServerTagNotFoundError(f"Not found Tags: {', '.join(missing)}.")
+
+        admin_ids, missing = cls.find_ids(record.get("admins"), lookups["admins"])
+        if missing:
+            raise ServerAdminNotFoundError(f"Not found Admins: {', '.join(missing)}.")
+
+        server_row = {
+            "name": record["name"],
+            "description": record.get("description"),
+            "status_id": lookups["srv_status"][srv_status],
+            "type_id": lookups["srv_type"][srv_type],
+        }
+        related = {"ips": ip_ids, "tags": tag_ids, "admins": admin_ids}
+        return server_row, related
+
+    @classmethod
+    def insert_rows(cls, server_rows):
+        """ Insert Server rows with one executemany statement.
+            On PostgreSQL IDs of new rows are taken from the table
+            sequence before the insert, on other databases they are
+            read after it.
+
+            Args:
+                server_rows(list): Server table rows (dicts)
+
+            Returns:
+                ids(list): IDs of new rows, in order of given rows
+        """
+        if DB.session.get_bind().dialect.name == "postgresql":
+            sequence = func.pg_get_serial_sequence(cls.TABLE, "id")
+            ids = sorted(
+                row_id
+                for row_id, in DB.session.execute(
+                    select([func.nextval(sequence)]).select_from(
+                        func.generate_series(1, len(server_rows))
+                    )
+                )
+            )
+            server_rows = [
+                dict(server_row, id=row_id)
+                for row_id, server_row in zip(ids, server_rows)
+            ]
+            DB.session.execute(Server.__table__.insert(), server_rows)
+            return ids
+
+        # SQLite fallback: the transaction holds the database write lock
+        # from the insert on, so no other writer can take IDs between
+        # the new rows and the highest ID belongs to the last of them.
+        DB.session.execute(Server.__table__.insert(), server_rows)
+        last_id = DB.session.execute(select([func.max(Server.id)])).scalar()
+        return list(range(last_id - len(server_rows) + 1, last_id + 1))
+
+    @classmethod
+    def add_many(cls, records, chunk_size=1000):
+        """ Add many new Server rows at once.
+            All records are validated first, then related rows names
+            of the whole batch are resolved with one query per model.
+            Correct records are inserted with one executemany statement
+            per table and chunk of records. All chunks are added in one
+            transaction, so nothing is added if any chunk fails.
+
+            Args:
+                records(list): list of dicts with Server fields, keys as
+                               in add method arguments (name, srv_status,
+                               srv_type, description, ips, tags, admins)
+                chunk_size(int): number of records inserted at once
+
+            Returns:
+                created_ids(list): IDs of new Server rows,
+                                   in order of given records
+                errors(dict): index of not added record mapped
+                              to the exception (DbError) raised for it
+        """
+        errors = dict()
+        valid = dict()
+        for index, record in enumerate(records):
+            try:
+                cls.validate_record(record)
+            except DbError as exc:
+                errors[index] = exc
+            else:
+                ips = [IpOp.normalize_address(ip) for ip in record.get("ips") or []]
+                valid[index] = dict(record, ips=ips)
+
+        valid_records = list(valid.values())
+        lookups = {
+            "srv_status": cls.lookup_ids(
+                ServerStatusOp, cls.collect_values(valid_records, "srv_status"), "name"
+            ),
+            "srv_type": cls.lookup_ids(
+                ServerTypeOp, cls.collect_values(valid_records, "srv_type"), "name"
+            ),
+            "ips": cls.lookup_ids(
+                IpOp, cls.collect_values(valid_records, "ips"), "address"
+            ),
+            "tags": cls.lookup_ids(
+                TagOp, cls.collect_values(valid_records, "tags"), "name"
+            ),
+            "admins": cls.lookup_ids(
+                AdminOp, cls.collect_values(valid_records, "admins"), "name"
+            ),
+        }
+
+        resolved = list()
+        for index, record in valid.items():
+            try:
+                resolved.append(cls.resolve_record(record, lookups))
+            except DbError as exc:
+                errors[index] = exc
+
+        created_ids = list()
+        with transaction():
+            for start in range(0, len(resolved), chunk_size):
+                chunk = resolved[start : start + chunk_size]
+                server_ids = cls.insert_rows([server_row for server_row, _ in chunk])
+
+                ip_rows = list()
+                tag_rows = list()
+                admin_rows = list()
+                for server_id, (_, related) in zip(server_ids, chunk):
+                    ip_rows.extend(
+                        {"server_id": server_id, "ip_id": ip_id}
+                        for ip_id in related["ips"]
+                    )
+                    tag_rows.extend(
+                        {"server_id": server_id, "tag_id": tag_id}
+                        for tag_id in related["tags"]
+                    )
+                    admin_rows.extend(
+                        {"server_id": server_id, "admin_id": admin_id}
+                        for admin_id in related["admins"]
+                    )
+
+                for assoc_table, assoc_rows in (
+                    (server_ip, ip_rows),
+                    (server_tag, tag_rows),
+                    (server_admin, admin_rows),
+                ):
+                    if assoc_rows:
+                        DB.session.execute(assoc_table.insert(), assoc_rows)
+
+                created_ids.extend(server_ids)
+
+            if created_ids:
+                bump_version(cls.TABLE)
+
+        return created_ids, errors
+
     @classmethod
     def update(
         cls,
@@ -319,14 +1142,15 @@ class ServerOp:
             cls.validate_description(description)
             server_obj.description = description
         if ips:
-            server_obj.ips = [cls.resolve_ip(ip) for ip in ips]
+            server_obj.ips = cls.resolve_ips(ips)
         if tags:
-            server_obj.tags = [cls.resolve_tag(tag) for tag in tags]
+            server_obj.tags = cls.resolve_tags(tags)
         if admins:
-            server_obj.admins = [cls.resolve_admin(admin) for admin in admins]
+            server_obj.admins = cls.resolve_admins(admins)
 
         DB.session.add(server_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
         return server_obj
 
     @classmethod
@@ -337,4 +1161,5 @@ class ServerOp:
                 server_obj(Server): existing Server row object
         """
         DB.session.delete(server_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
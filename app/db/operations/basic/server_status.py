@@ -1,6 +1,10 @@
 import re
 
-from app import DB
+from app.extensions import DB
+from app.db.transaction import after_rollback
+from app.db.transaction import commit
+from app.db.versions import bump_version
+from app.db.cache import CatalogCache
 from app.db.models.server_status import ServerStatus
 from app.db.exceptions import ServerStatusIdNotValidError
 from app.db.exceptions import ServerStatusNameNotValidError
@@ -9,6 +13,10 @@ from app.db.exceptions import ServerStatusNameNotValidError
 class ServerStatusOp:
     """ Operations for ServerStatus model."""
 
+    TABLE = ServerStatus.__tablename__
+
+    CACHE = CatalogCache(ServerStatus)
+
     @classmethod
     def validate_id(cls, id):
         """ Field: id validation.
@@ -76,6 +84,41 @@ class ServerStatusOp:
 
         return result
 
+    @classmethod
+    def get_many(cls, names):
+        """ Get ServerStatus rows which name field is one of given values,
+            using one query.
+
+            Args:
+                names(list): list of name fields (str) to find
+
+            Return:
+                result(list): list of row (ServerStatus) objects
+        """
+        if not names:
+            return list()
+
+        for name in names:
+            cls.validate_name(name)
+
+        result = ServerStatus.query.filter(ServerStatus.name.in_(names)).all()
+        return result
+
+    @classmethod
+    def get_id(cls, name):
+        """ Get ID of ServerStatus row with given name, from the cache.
+
+            Args:
+                name(str): name field of the row
+
+            Return:
+                row_id(int): row ID, or None if there is no row
+                             or more than one row with given name
+        """
+        cls.validate_name(name)
+        row_id = cls.CACHE.get_id(name)
+        return row_id
+
     @classmethod
     def add(cls, name):
         """ Add new ServerStatus row.
@@ -89,7 +132,10 @@ class ServerStatusOp:
         cls.validate_name(name)
         new_status = ServerStatus(name)
         DB.session.add(new_status)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
+        cls.CACHE.invalidate()
+        after_rollback(cls.CACHE.invalidate)
         return new_status
 
     @classmethod
@@ -106,7 +152,10 @@ class ServerStatusOp:
         cls.validate_name(name)
         status_obj.name = name
         DB.session.add(status_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
+        cls.CACHE.invalidate()
+        after_rollback(cls.CACHE.invalidate)
         return status_obj
 
     @classmethod
@@ -117,4 +166,7 @@ class ServerStatusOp:
                 status_obj(ServerStatus): existing ServerStatus row object
         """
         DB.session.delete(status_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
+        cls.CACHE.invalidate()
+        after_rollback(cls.CACHE.invalidate)
@@ -1,6 +1,10 @@
 import re
 
-from app import DB
+from app.extensions import DB
+from app.db.transaction import after_rollback
+from app.db.transaction import commit
+from app.db.versions import bump_version
+from app.db.cache import CatalogCache
 from app.db.models.server_type import ServerType
 from app.db.exceptions import ServerTypeIdNotValidError
 from app.db.exceptions import ServerTypeNameNotValidError
@@ -9,6 +13,10 @@ from app.db.exceptions import ServerTypeNameNotValidError
 class ServerTypeOp:
     """ Operations for ServerType model."""
 
+    TABLE = ServerType.__tablename__
+
+    CACHE = CatalogCache(ServerType)
+
     @classmethod
     def validate_id(cls, id):
         """ Field: id validation.
@@ -76,6 +84,41 @@ class ServerTypeOp:
 
         return result
 
+    @classmethod
+    def get_many(cls, names):
+        """ Get ServerType rows which name field is one of given values,
+            using one query.
+
+            Args:
+                names(list): list of name fields (str) to find
+
+            Return:
+                result(list): list of row (ServerType) objects
+        """
+        if not names:
+            return list()
+
+        for name in names:
+            cls.validate_name(name)
+
+        result = ServerType.query.filter(ServerType.name.in_(names)).all()
+        return result
+
+    @classmethod
+    def get_id(cls, name):
+        """ Get ID of ServerType row with given name, from the cache.
+
+            Args:
+                name(str): name field of the row
+
+            Return:
+                row_id(int): row ID, or None if there is no row
+                             or more than one row with given name
+        """
+        cls.validate_name(name)
+        row_id = cls.CACHE.get_id(name)
+        return row_id
+
     @classmethod
     def add(cls, name):
         """ Add new ServerType row.
@@ -89,7 +132,10 @@ class ServerTypeOp:
         cls.validate_name(name)
         new_status = ServerType(name)
         DB.session.add(new_status)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
+        cls.CACHE.invalidate()
+        after_rollback(cls.CACHE.invalidate)
         return new_status
 
     @classmethod
@@ -106,7 +152,10 @@ class ServerTypeOp:
         cls.validate_name(name)
         type_obj.name = name
         DB.session.add(type_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
+        cls.CACHE.invalidate()
+        after_rollback(cls.CACHE.invalidate)
         return type_obj
 
     @classmethod
@@ -117,4 +166,7 @@ class ServerTypeOp:
                 type_obj(ServerType): existing ServerType row object
         """
         DB.session.delete(type_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
+        cls.CACHE.invalidate()
+        after_rollback(cls.CACHE.invalidate)
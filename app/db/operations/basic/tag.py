@@ -1,6 +1,8 @@
 import re
 
-from app import DB
+from app.extensions import DB
+from app.db.transaction import commit
+from app.db.versions import bump_version
 from app.db.models.tag import Tag
 from app.db.exceptions import TagIdNotValidError
 from app.db.exceptions import TagNameNotValidError
@@ -9,6 +11,8 @@ from app.db.exceptions import TagNameNotValidError
 class TagOp:
     """ Operations for Tag model. """
 
+    TABLE = Tag.__tablename__
+
     @classmethod
     def validate_id(cls, id):
         """ Field: id validation.
@@ -69,6 +73,26 @@ class TagOp:
         result = Tag.query.filter_by(**filters).all()
         return result
 
+    @classmethod
+    def get_many(cls, names):
+        """ Get Tag rows which name field is one of given values,
+            using one query.
+
+            Args:
+                names(list): list of name fields (str) to find
+
+            Return:
+                result(list): list of row (Tag) objects
+        """
+        if not names:
+            return list()
+
+        for name in names:
+            cls.validate_name(name)
+
+        result = Tag.query.filter(Tag.name.in_(names)).all()
+        return result
+
     @classmethod
     def add(cls, name):
         """ Add new Tag row.
@@ -82,7 +106,8 @@ class TagOp:
         cls.validate_name(name)
         new_tag = Tag(name)
         DB.session.add(new_tag)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
         return new_tag
 
     @classmethod
@@ -99,7 +124,8 @@ class TagOp:
         cls.validate_name(name)
         tag_obj.name = name
         DB.session.add(tag_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
         return tag_obj
 
     @classmethod
@@ -110,4 +136,5 @@ class TagOp:
                 tag_obj(Tag): existing Tag row object
         """
         DB.session.delete(tag_obj)
-        DB.session.commit()
+        bump_version(cls.TABLE)
+        commit()
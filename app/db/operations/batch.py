@@ -0,0 +1,247 @@
+import inspect
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.extensions import DB
+from app.db.transaction import transaction
+from app.db.models.admin import Admin
+from app.db.models.ip import Ip
+from app.db.models.server import Server
+from app.db.models.server_status import ServerStatus
+from app.db.models.server_type import ServerType
+from app.db.models.tag import Tag
+from app.db.operations.basic.admin import AdminOp
+from app.db.operations.basic.ip import IpOp
+from app.db.operations.basic.server import ServerOp
+from app.db.operations.basic.server_status import ServerStatusOp
+from app.db.operations.basic.server_type import ServerTypeOp
+from app.db.operations.basic.tag import TagOp
+
+from app.db.exceptions import DbError
+from app.db.exceptions import BatchModeNotValidError
+from app.db.exceptions import BatchOperationNotValidError
+from app.db.exceptions import BatchRowNotFoundError
+
+
+class BatchOp:
+    """ Many Op calls (add, update, delete) run in one transaction."""
+
+    MODELS = {
+        "admin": (AdminOp, Admin),
+        "ip": (IpOp, Ip),
+        "tag": (TagOp, Tag),
+        "server_status": (ServerStatusOp, ServerStatus),
+        "server_type": (ServerTypeOp, ServerType),
+        "server": (ServerOp, Server),
+    }
+    ACTIONS = ("add", "update", "delete")
+    MODES = ("atomic", "best_effort")
+    MAX_OPERATIONS = 1000
+    # errors of single operation, TypeError and ValueError are raised
+    # by Op methods for params of wrong types, e.g. ips=5
+    ERRORS = (DbError, SQLAlchemyError, TypeError, ValueError)
+
+    @classmethod
+    def validate_mode(cls, mode):
+        """ Field: mode validation.
+
+            Requirements:
+                - must be one of: atomic, best_effort
+
+            Args:
+                mode(str): batch mode
+        """
+        if mode not in cls.MODES:
+            raise BatchModeNotValidError(
+                f"Field: mode must be one of: {', '.join(cls.MODES)}."
+            )
+
+    @classmethod
+    def prepare(cls, index, operation):
+        """ Validate operation and translate it into Op method call.
+
+            Requirements:
+                - must be dict with fields: model (admin, ip, tag,
+                  server_status, server_type, server), action (add,
+                  update, delete), id (integer, update and delete only)
+                  and params (dict of Op method parameters, except
+                  the changed row object)
+
+            Args:
+                index(int): position of the operation in the batch
+                operation(dict): operation
+
+            Returns:
+                call(tuple): Op method, model, ID of changed row
+                             (None for add), method parameters
+        """
+        prefix = f"Operation {index}:"
+        if not isinstance(operation, dict):
+            raise BatchOperationNotValidError(f"{prefix} must be Dict.")
+
+        unknown = set(operation) - {"model", "action", "id", "params"}
+        if unknown:
+            raise BatchOperationNotValidError(
+                f"{prefix} unknown fields: {', '.join(sorted(unknown))}."
+            )
+
+        if operation.get("model") not in cls.MODELS:
+            raise BatchOperationNotValidError(
+                f"{prefix} field: model must be one of: {', '.join(cls.MODELS)}."
+            )
+        if operation.get("action") not in cls.ACTIONS:
+            raise BatchOperationNotValidError(
+                f"{prefix} field: action must be one of: {', '.join(cls.ACTIONS)}."
+            )
+
+        op_class, model = cls.MODELS[operation["model"]]
+        action = operation["action"]
+        method = getattr(op_class, action)
+
+        row_id = operation.get("id")
+        if action == "add":
+            if row_id is not None:
+                raise BatchOperationNotValidError(f"{prefix} add takes no id.")
+        elif not isinstance(row_id, int) or isinstance(row_id, bool):
+            raise BatchOperationNotValidError(f"{prefix} field: id must be Integer.")
+
+        params = operation.get("params", dict())
+        if not isinstance(params, dict):
+            raise BatchOperationNotValidError(f"{prefix} field: params must be Dict.")
+
+        args = (None,) if row_id is not None else ()
+        try:
+            inspect.signature(method).bind(*args, **params)
+        except TypeError as error:
+            raise BatchOperationNotValidError(f"{prefix} {error}.")
+
+        return method, model, row_id, params
+
+    @classmethod
+    def call(cls, method, model, row_id, params):
+        """ Call Op method.
+
+            Args:
+                method(callable): Op method
+                model(DB.Model): model of changed row
+                row_id(int): ID of changed row, None for add
+                params(dict): method parameters
+
+            Returns:
+                result(dict): status ok and ID of the row
+        """
+        if row_id is None:
+            row = method(**params)
+            return {"status": "ok", "id": row.id}
+
+        row = DB.session.query(model).get(row_id)
+        if row is None:
+            raise BatchRowNotFoundError(
+                f"Row: {model.__tablename__} with id {row_id} not found."
+            )
+        method(row, **params)
+        return {"status": "ok", "id": row_id}
+
+    @staticmethod
+    def error_result(error):
+        """ Result of failed operation: exception class name and first
+            line of its message (IntegrityError message contains SQL).
+        """
+        return {
+            "status": "error",
+            "error": type(error).__name__,
+            "message": str(error).splitlines()[0],
+        }
+
+    @classmethod
+    def call_savepoint(cls, call):
+        """ Call Op method in own savepoint, so its failure rolls back
+            only its own changes.
+
+            Args:
+                call(tuple): Op method call, see prepare method
+
+            Returns:
+                result(dict): status ok and ID of the row,
+                              or the error (see error_result)
+        """
+        try:
+            with transaction():
+                return cls.call(*call)
+        except cls.ERRORS as error:
+            return cls.error_result(error)
+
+    @classmethod
+    def run(cls, operations, mode="atomic"):
+        """ Run operations in one transaction, committed once.
+            All operations are validated before any of them runs.
+
+            In atomic mode failed operation rolls back the whole batch:
+            operations run before it get status rolled_back, operations
+            after it are skipped. In best_effort mode every operation
+            runs in own savepoint, failed operation rolls back only its
+            own changes, other changes are committed. If the commit
+            fails, all operations get status rolled_back and the error
+            of the commit is returned.
+
+            Usage:
+                BatchOp.run(
+                    [
+                        {"model": "tag", "action": "add", "params": {"name": "web"}},
+                        {"model": "server", "action": "update", "id": 7,
+                         "params": {"tags": ["web"]}},
+                    ]
+                )
+
+            Args:
+                operations(list): operations, see prepare method
+                mode(str): atomic or best_effort
+
+            Returns:
+                batch(dict): committed (bool, True if the transaction was
+                             committed), results (list, result of every
+                             operation: dict with status - ok, error,
+                             rolled_back, skipped - ID of the row (ok),
+                             exception class name and message (error)),
+                             error of the commit (if it failed)
+        """
+        cls.validate_mode(mode)
+        if not isinstance(operations, list) or not operations:
+            raise BatchOperationNotValidError(
+                "Field: operations must be non-empty List."
+            )
+        if len(operations) > cls.MAX_OPERATIONS:
+            raise BatchOperationNotValidError(
+                f"Field: operations can contain at most {cls.MAX_OPERATIONS} items."
+            )
+        calls = [
+            cls.prepare(index, operation) for index, operation in enumerate(operations)
+        ]
+
+        results = list()
+        try:
+            with transaction():
+                for call in calls:
+                    if mode == "atomic":
+                        results.append(cls.call(*call))
+                    else:
+                        results.append(cls.call_savepoint(call))
+        except cls.ERRORS as error:
+            rolled_back = [
+                {"status": "rolled_back"} if result["status"] == "ok" else result
+                for result in results
+            ]
+            if len(results) == len(calls):
+                return {
+                    "committed": False,
+                    "results": rolled_back,
+                    "error": cls.error_result(error),
+                }
+
+            skipped = [{"status": "skipped"}] * (len(calls) - len(results) - 1)
+            return {
+                "committed": False,
+                "results": rolled_back + [cls.error_result(error)] + skipped,
+            }
+
+        return {"committed": True, "results": results}
@@ -0,0 +1,175 @@
+""" Database connection pool configuration and metrics."""
+import threading
+import time
+
+from sqlalchemy import exc
+from sqlalchemy.engine.url import make_url
+from sqlalchemy.pool import QueuePool
+
+from app.extensions import DB
+
+
+def engine_options(config):
+    """ Get create_engine options from the application configuration.
+        SQLite in-memory database keeps its single connection pool.
+
+        Args:
+            config(dict): application configuration, with DB_* values:
+                          pool size, max overflow, pool timeout (seconds),
+                          pool recycle (seconds, -1 disables),
+                          pre ping flag, statement timeout (milliseconds,
+                          0 disables) and application name
+
+        Returns:
+            options(dict): SQLALCHEMY_ENGINE_OPTIONS
+    """
+    url = make_url(config["SQLALCHEMY_DATABASE_URI"])
+    options = {"pool_pre_ping": config["DB_POOL_PRE_PING"]}
+
+    if url.drivername.startswith("sqlite"):
+        if url.database in (None, "", ":memory:"):
+            return options
+        options["connect_args"] = {"check_same_thread": False}
+
+    options.update(
+        poolclass=MonitoredQueuePool,
+        pool_size=config["DB_POOL_SIZE"],
+        max_overflow=config["DB_MAX_OVERFLOW"],
+        pool_timeout=config["DB_POOL_TIMEOUT"],
+        pool_recycle=config["DB_POOL_RECYCLE"],
+    )
+
+    if url.drivername.startswith("postgresql"):
+        connect_args = {"application_name": config["DB_APPLICATION_NAME"]}
+        if config["DB_STATEMENT_TIMEOUT"]:
+            statement_timeout = config["DB_STATEMENT_TIMEOUT"]
+            connect_args["options"] = f"-c statement_timeout={statement_timeout}"
+        options["connect_args"] = connect_args
+
+    return options
+
+
+class PoolMetrics:
+    """ Checkouts of connections from the pool: how long they waited
+        for a connection and how many connections were in use.
+    """
+
+    def __init__(self):
+        """ Constructor for PoolMetrics."""
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """ Forget recorded checkouts."""
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+        self.peak_checked_out = 0
+
+    def record_checkout(self, wait, checked_out):
+        """ Record successful checkout.
+
+            Args:
+                wait(float): time of the checkout in seconds
+                checked_out(int): number of connections in use after it
+        """
+        with self.lock:
+            self.checkouts += 1
+            self.wait_total += wait
+            self.wait_max = max(self.wait_max, wait)
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def record_timeout(self):
+        """ Record checkout which timed out waiting for a connection."""
+        with self.lock:
+            self.timeouts += 1
+
+
+class MonitoredQueuePool(QueuePool):
+    """ QueuePool recording metrics of connections checkouts. Checkout
+        time covers waiting for a free connection, opening a new one
+        and pre ping.
+    """
+
+    def __init__(self, creator, pool_size=5, max_overflow=10, **kw):
+        super().__init__(creator, pool_size=pool_size, max_overflow=max_overflow, **kw)
+        self.max_overflow = max_overflow
+        self.metrics = PoolMetrics()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_timeout()
+            raise
+
+        self.metrics.record_checkout(time.perf_counter() - start, self.checkedout())
+        return connection
+
+    def recreate(self):
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+    @property
+    def capacity(self):
+        """ Maximum number of connections, None if it is unlimited."""
+        if self.max_overflow < 0:
+            return None
+        return self.size() + self.max_overflow
+
+    def stats(self):
+        """ Get pool metrics.
+
+            Returns:
+                stats(dict): pool size and capacity, connections in use
+                             (now and at peak) and saturation (used part
+                             of the capacity, now and at peak),
+                             number of checkouts and timeouts, mean,
+                             maximum and total checkout time
+                             in milliseconds
+        """
+        capacity = self.capacity
+        checked_out = self.checkedout()
+        metrics = self.metrics
+        with metrics.lock:
+            checkouts = metrics.checkouts
+            stats = {
+                "size": self.size(),
+                "capacity": capacity,
+                "checked_out": checked_out,
+                "overflow": max(self.overflow(), 0),
+                "peak_checked_out": metrics.peak_checked_out,
+                "checkouts": checkouts,
+                "timeouts": metrics.timeouts,
+                "wait_mean_ms": round(metrics.wait_total / checkouts * 1000, 3)
+                if checkouts
+                else 0.0,
+                "wait_max_ms": round(metrics.wait_max * 1000, 3),
+                "wait_total_ms": round(metrics.wait_total * 1000, 3),
+            }
+
+        stats["saturation"] = round(checked_out / capacity, 3) if capacity else None
+        stats["peak_saturation"] = (
+            round(stats["peak_checked_out"] / capacity, 3) if capacity else None
+        )
+        return stats
+
+
+def pool_stats(engine=None):
+    """ Get metrics of the engine connection pool.
+
+        Args:
+            engine(Engine): DB.engine by default
+
+        Returns:
+            stats(dict): pool metrics, see MonitoredQueuePool.stats,
+                         None if the pool is not monitored
+                         (e.g. SQLite in-memory database)
+    """
+    pool = (engine or DB.engine).pool
+    if not isinstance(pool, MonitoredQueuePool):
+        return None
+    return pool.stats()
@@ -0,0 +1,337 @@
+""" Slow query log.
+
+    Statements running longer than the threshold are logged (logger
+    app.db.slow_queries) with their fingerprint - statement text with
+    literals and parameters replaced by ?, which is the same for every
+    run of the statement - duration, parameters (redacted by default)
+    and the Op method which executed them. Optionally the query plan
+    of slow statement is captured: EXPLAIN on PostgreSQL (with analyze
+    option EXPLAIN (ANALYZE, BUFFERS) for SELECT statements, which runs
+    the statement again), EXPLAIN QUERY PLAN on SQLite. EXPLAIN runs
+    inside a savepoint rolled back afterwards, so its failure (e.g.
+    statement timeout) does not abort the transaction of the caller.
+    Statistics of the slowest statements are kept in a bounded table,
+    by fingerprint.
+
+    Usage:
+        SLOW_QUERIES.configure(threshold=100, explain=True)
+        ServerOp.get(tags=["web"])
+        SLOW_QUERIES.top()
+"""
+import hashlib
+import logging
+import re
+import sys
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+LOGGER = logging.getLogger(__name__)
+
+START_KEY = "slow_query_start"
+OPERATIONS_MODULE = "app.db.operations."
+MAX_OPERATIONS = 10
+
+STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?(?![\w.])")
+PLACEHOLDER = re.compile(r"%\(\w+\)s|%s|\?|(?<![:\w]):\w+")
+PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+WHITESPACE = re.compile(r"\s+")
+EXPLAINED_STATEMENTS = ("SELECT", "INSERT", "UPDATE", "DELETE")
+EXPLAIN_SAVEPOINT = "slow_query_explain"
+
+
+def fingerprint(statement):
+    """ Normalize the statement, so all runs of it have the same text.
+
+        Args:
+            statement(str): SQL statement
+
+        Returns:
+            normalized(str): statement with literals and parameters
+                             replaced by ?, lists of them by (?+),
+                             and whitespace collapsed
+            fingerprint_id(str): short hash of the normalized statement
+    """
+    normalized = STRING_LITERAL.sub("?", statement)
+    normalized = PLACEHOLDER.sub("?", normalized)
+    normalized = NUMBER_LITERAL.sub("?", normalized)
+    normalized = PLACEHOLDER_LIST.sub("(?+)", normalized)
+    normalized = WHITESPACE.sub(" ", normalized).strip()
+    fingerprint_id = hashlib.sha1(normalized.encode("utf-8")).hexdigest()[:16]
+    return normalized, fingerprint_id
+
+
+def redact(parameters):
+    """ Replace parameters values with their type names.
+
+        Args:
+            parameters(tuple, list, dict): statement parameters
+
+        Returns:
+            redacted(tuple, list, dict): parameters with type names
+    """
+    if isinstance(parameters, dict):
+        return {name: type(value).__name__ for name, value in parameters.items()}
+    if isinstance(parameters, (list, tuple)):
+        return [type(value).__name__ for value in parameters]
+    return type(parameters).__name__
+
+
+def calling_operation():
+    """ Find the Op method which executes the statement.
+
+        Returns:
+            operation(str): method name, e.g. ServerOp.get,
+                            None if statement is not run by Op method
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        if frame.f_globals.get("__name__", "").startswith(OPERATIONS_MODULE):
+            owner = frame.f_locals.get("cls")
+            if isinstance(owner, type):
+                return f"{owner.__name__}.{frame.f_code.co_name}"
+            return f"{frame.f_globals['__name__']}.{frame.f_code.co_name}"
+        frame = frame.f_back
+    return None
+
+
+class SlowQueryLog:
+    """ Slow query log, see module docstring."""
+
+    def __init__(self):
+        """ Constructor for SlowQueryLog."""
+        self.lock = threading.Lock()
+        self.threshold = None
+        self.redact_parameters = True
+        self.explain = False
+        self.analyze = False
+        self.size = 50
+        self.entries = dict()
+
+    @property
+    def enabled(self):
+        return self.threshold is not None
+
+    def configure(
+        self,
+        threshold=None,
+        redact_parameters=True,
+        explain=False,
+        analyze=False,
+        size=50,
+    ):
+        """ Configure the log.
+
+            Args:
+                threshold(float): minimal duration of logged statement
+                                  in milliseconds, None disables the log
+                redact_parameters(bool): log parameters types, not values
+                explain(bool): capture query plans of slow statements
+                analyze(bool): run slow SELECT statements again to capture
+                               actual times of the plan (PostgreSQL)
+                size(int): maximum number of fingerprints in the table
+        """
+        self.redact_parameters = redact_parameters
+        self.explain = explain
+        self.analyze = analyze
+        self.size = size
+
+        if threshold is not None and not self.enabled:
+            event.listen(Engine, "before_cursor_execute", self.before_cursor_execute)
+            event.listen(Engine, "after_cursor_execute", self.after_cursor_execute)
+            event.listen(Engine, "handle_error", self.handle_error)
+        elif threshold is None and self.enabled:
+            event.remove(Engine, "before_cursor_execute", self.before_cursor_execute)
+            event.remove(Engine, "after_cursor_execute", self.after_cursor_execute)
+            event.remove(Engine, "handle_error", self.handle_error)
+        self.threshold = threshold
+
+    def before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        conn.info.setdefault(START_KEY, list()).append(time.perf_counter())
+
+    def handle_error(self, exception_context):
+        starts = exception_context.connection.info.get(START_KEY)
+        if starts:
+            starts.pop()
+
+    def after_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        starts = conn.info.get(START_KEY)
+        if not starts:
+            return
+        duration = (time.perf_counter() - starts.pop()) * 1000
+        if self.threshold is None or duration < self.threshold:
+            return
+
+        normalized, fingerprint_id = fingerprint(statement)
+        plan = None
+        if (
+            self.explain
+            and not executemany
+            and self.is_slowest(fingerprint_id, duration)
+        ):
+            plan = self.explain_plan(conn, statement, parameters, self.analyze)
+        self.record(
+            normalized, fingerprint_id, parameters, duration, calling_operation(), plan,
+        )
+
+    def is_slowest(self, fingerprint_id, duration):
+        """ Check if the statement run is the slowest one recorded,
+            so its plan is worth capturing.
+        """
+        with self.lock:
+            entry = self.entries.get(fingerprint_id)
+            return entry is None or duration > entry["max_ms"]
+
+    @staticmethod
+    def explain_plan(conn, statement, parameters, analyze=False):
+        """ Capture query plan of the statement, in savepoint rolled back
+            afterwards, so neither the failure of EXPLAIN nor changes
+            made by analyzed statement affect the transaction.
+
+            Args:
+                conn(Connection): connection which executed the statement
+                statement(str): executed statement
+                parameters(tuple, dict): parameters of the statement
+                analyze(bool): run SELECT statement to get actual times
+
+            Returns:
+                plan(list): lines of the plan, None if it is not captured
+        """
+        words = statement.split(None, 1)
+        keyword = words[0].upper() if words else ""
+        if keyword not in EXPLAINED_STATEMENTS:
+            return None
+
+        dialect = conn.dialect.name
+        if dialect == "postgresql":
+            if analyze and keyword == "SELECT":
+                explain = "EXPLAIN (ANALYZE, BUFFERS) "
+            else:
+                explain = "EXPLAIN "
+        elif dialect == "sqlite":
+            explain = "EXPLAIN QUERY PLAN "
+        else:
+            return None
+
+        cursor = conn.connection.cursor()
+        try:
+            cursor.execute(f"SAVEPOINT {EXPLAIN_SAVEPOINT}")
+        except Exception as error:
+            cursor.close()
+            LOGGER.warning("EXPLAIN of slow statement failed: %s", error)
+            return None
+
+        try:
+            cursor.execute(explain + statement, parameters)
+            return [" ".join(str(column) for column in row) for row in cursor]
+        except Exception as error:
+            LOGGER.warning("EXPLAIN of slow statement failed: %s", error)
+            return None
+        finally:
+            cursor.execute(f"ROLLBACK TO SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            cursor.execute(f"RELEASE SAVEPOINT {EXPLAIN_SAVEPOINT}")
+            cursor.close()
+
+    def record(
+        self,
+        normalized,
+        fingerprint_id,
+        parameters,
+        duration,
+        operation=None,
+        plan=None,
+    ):
+        """ Log slow statement and add it to the table.
+
+            Args:
+                normalized(str): normalized statement, see fingerprint
+                fingerprint_id(str): hash of the normalized statement
+                parameters(tuple, dict): parameters of the statement
+                duration(float): duration in milliseconds
+                operation(str): Op method which executed the statement
+                plan(list): lines of query plan
+        """
+        if self.redact_parameters:
+            parameters = redact(parameters)
+
+        LOGGER.warning(
+            "Slow statement %s: %.1f ms, operation: %s, parameters: %s, "
+            "statement: %s",
+            fingerprint_id,
+            duration,
+            operation,
+            parameters,
+            normalized,
+        )
+        if plan:
+            LOGGER.warning("Plan of statement %s:\n%s", fingerprint_id, "\n".join(plan))
+
+        with self.lock:
+            entry = self.entries.get(fingerprint_id)
+            if entry is None:
+                if len(self.entries) >= self.size:
+                    self.evict()
+                entry = {
+                    "fingerprint": fingerprint_id,
+                    "statement": normalized,
+                    "count": 0,
+                    "total_ms": 0.0,
+                    "max_ms": 0.0,
+                    "operations": list(),
+                    "parameters": None,
+                    "plan": None,
+                }
+                self.entries[fingerprint_id] = entry
+
+            entry["count"] += 1
+            entry["total_ms"] += duration
+            operations = entry["operations"]
+            if operation not in operations and len(operations) < MAX_OPERATIONS:
+                operations.append(operation)
+            if duration >= entry["max_ms"]:
+                entry["max_ms"] = duration
+                entry["parameters"] = parameters
+                entry["plan"] = plan or entry["plan"]
+
+    def evict(self):
+        """ Remove fingerprint with the lowest total duration."""
+        lowest = min(self.entries.values(), key=lambda entry: entry["total_ms"])
+        del self.entries[lowest["fingerprint"]]
+
+    def top(self, limit=None):
+        """ Get the slowest statements, by total duration.
+
+            Args:
+                limit(int): maximum number of statements, all by default
+
+            Returns:
+                entries(list): dicts with fingerprint, normalized statement,
+                               count, total, mean and max duration (ms),
+                               calling Op methods, parameters and query
+                               plan of the slowest run
+        """
+        with self.lock:
+            entries = [dict(entry) for entry in self.entries.values()]
+
+        entries.sort(key=lambda entry: entry["total_ms"], reverse=True)
+        for entry in entries:
+            entry["mean_ms"] = round(entry["total_ms"] / entry["count"], 3)
+            entry["total_ms"] = round(entry["total_ms"], 3)
+            entry["max_ms"] = round(entry["max_ms"], 3)
+        return entries[:limit]
+
+    def reset(self):
+        """ Forget recorded statements."""
+        with self.lock:
+            self.entries = dict()
+
+
+SLOW_QUERIES = SlowQueryLog()
@@ -0,0 +1,63 @@
+""" Counting of SQL statements sent to the database."""
+from sqlalchemy import event
+
+from app.extensions import DB
+
+
+TRANSACTION_CONTROL = ("BEGIN", "COMMIT", "ROLLBACK", "SAVEPOINT", "RELEASE")
+
+
+class StatementCounter:
+    """ Context manager counting SQL statements executed by the engine
+        while the context is active. Statement executed with many
+        parameter sets (executemany) is counted once. Transaction control
+        statements (BEGIN, SAVEPOINT etc.) are not counted - drivers
+        emit them differently, e.g. psycopg2 begins transactions implicitly.
+
+        Usage:
+            with StatementCounter() as counter:
+                ServerOp.get(tags=["web"])
+            print(counter.count, counter.statements)
+    """
+
+    def __init__(self, engine=None):
+        """ Constructor for StatementCounter.
+
+            Args:
+                engine(Engine): counted engine, DB.engine by default
+        """
+        self.engine = engine
+        self.statements = list()
+
+    @property
+    def count(self):
+        """ Number of statements executed so far."""
+        return len(self.statements)
+
+    def before_cursor_execute(
+        self, conn, cursor, statement, parameters, context, executemany
+    ):
+        if not statement.lstrip().upper().startswith(TRANSACTION_CONTROL):
+            self.statements.append(statement)
+
+    def reset(self):
+        """ Forget statements counted so far, keep counting."""
+        self.statements = list()
+
+    def start(self):
+        """ Start counting statements, from zero."""
+        if self.engine is None:
+            self.engine = DB.engine
+        self.statements = list()
+        event.listen(self.engine, "before_cursor_execute", self.before_cursor_execute)
+
+    def stop(self):
+        """ Stop counting statements. Counted statements are kept."""
+        event.remove(self.engine, "before_cursor_execute", self.before_cursor_execute)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
@@ -0,0 +1,90 @@
+""" Unit of work - many database operations committed as one transaction."""
+from contextlib import contextmanager
+
+from app.extensions import DB
+
+
+DEPTH_KEY = "transaction_depth"
+CALLBACKS_KEY = "transaction_rollback_callbacks"
+
+
+def in_transaction():
+    """ Check if the code runs inside transaction context.
+
+        Returns:
+            active(bool): True if transaction context is active
+    """
+    return DB.session.info.get(DEPTH_KEY, 0) > 0
+
+
+def commit():
+    """ Commit changes made by an operation.
+        Inside transaction context changes are only flushed (so new rows
+        get their IDs) and committed once, at exit of the outermost context.
+    """
+    if in_transaction():
+        DB.session.flush()
+    else:
+        DB.session.commit()
+
+
+def after_rollback(callback):
+    """ Register function called when changes made by an operation
+        are rolled back, e.g. to invalidate cache filled with them.
+        Outside transaction context changes are already committed,
+        so callback is not registered.
+
+        Args:
+            callback(callable): function called without arguments
+    """
+    if in_transaction():
+        DB.session.info[CALLBACKS_KEY].append(callback)
+
+
+@contextmanager
+def transaction():
+    """ Run many operations in one transaction.
+        Operations do not commit their changes, all changes are committed
+        at exit of the context, or rolled back if exception is raised.
+        Nested context uses savepoint, so exception raised in it rolls back
+        only changes made inside the nested context.
+
+        Usage:
+            with transaction():
+                IpOp.add("10.0.0.1")
+                TagOp.add("web")
+                ServerOp.add("web01", "Active", "Physical", ips=["10.0.0.1"])
+
+        Yields:
+            session(Session): database session
+    """
+    session = DB.session
+    info = session.info
+    depth = info.get(DEPTH_KEY, 0)
+
+    if depth:
+        savepoint = session.begin_nested()
+    else:
+        savepoint = None
+        info[CALLBACKS_KEY] = list()
+    callbacks = info[CALLBACKS_KEY]
+    callbacks_start = len(callbacks)
+
+    info[DEPTH_KEY] = depth + 1
+    try:
+        yield session
+        if savepoint is not None:
+            savepoint.commit()
+        else:
+            session.commit()
+    except BaseException:
+        if savepoint is not None:
+            savepoint.rollback()
+        else:
+            session.rollback()
+        for callback in callbacks[callbacks_start:]:
+            callback()
+        del callbacks[callbacks_start:]
+        raise
+    finally:
+        info[DEPTH_KEY] = depth
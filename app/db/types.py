@@ -0,0 +1,69 @@
+""" Custom database column types."""
+import ipaddress
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.types import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+class IpAddressType(TypeDecorator):
+    """ IP address (v4 or v6) column type.
+
+        Stored as native inet in PostgreSQL. Other databases store packed
+        bytes: IP version byte followed by address bytes, so byte-wise
+        comparison orders addresses the same way as inet does and network
+        ranges can be found with index range scan.
+
+        Values are bound from and returned as normalized address strings.
+    """
+
+    impl = LargeBinary
+
+    def load_dialect_impl(self, dialect):
+        """ Use inet for PostgreSQL, packed bytes for other databases."""
+        if dialect.name == "postgresql":
+            return dialect.type_descriptor(postgresql.INET())
+        return dialect.type_descriptor(LargeBinary(17))
+
+    def process_bind_param(self, value, dialect):
+        """ Convert address string into database value."""
+        if value is None:
+            return None
+
+        address = ipaddress.ip_address(value)
+        if dialect.name == "postgresql":
+            return str(address)
+        return self.pack(address)
+
+    def process_result_value(self, value, dialect):
+        """ Convert database value into normalized address string."""
+        if value is None:
+            return None
+
+        if dialect.name == "postgresql":
+            return str(ipaddress.ip_address(value))
+        return str(self.unpack(value))
+
+    @classmethod
+    def pack(cls, address):
+        """ Pack address into bytes: version byte and address bytes.
+
+            Args:
+                address(IPv4Address, IPv6Address): address to pack
+
+            Returns:
+                packed(bytes): packed address
+        """
+        return bytes([address.version]) + address.packed
+
+    @classmethod
+    def unpack(cls, packed):
+        """ Unpack address packed with pack method.
+
+            Args:
+                packed(bytes): packed address
+
+            Returns:
+                address(IPv4Address, IPv6Address): unpacked address
+        """
+        return ipaddress.ip_address(bytes(packed[1:]))
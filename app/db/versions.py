@@ -0,0 +1,163 @@
+""" Change versions of tables, for conditional requests.
+
+    Every Op method changing rows (add, update, delete) marks its table
+    as changed, and versions of changed tables are increased right
+    before the commit of the transaction (see transaction context),
+    in the same transaction - so the version is committed or rolled back
+    together with the rows, and it is shared by all processes. Version
+    rows are updated in order of table names, so transactions changing
+    many tables lock them in the same order, and only for the time
+    of the commit. Readers compare versions of tables instead of reading
+    the tables.
+
+    Rows of change_version table are created by migration, or with
+    init_versions after create_all. Versions of tables without a row
+    are not changed.
+"""
+import datetime
+import hashlib
+import logging
+
+from sqlalchemy import event
+from sqlalchemy import insert
+from sqlalchemy import select
+from sqlalchemy import update
+from sqlalchemy.orm import Session
+
+from app.extensions import DB
+from app.db.models.change_version import ChangeVersion
+from app.db.transaction import DEPTH_KEY
+
+
+LOGGER = logging.getLogger(__name__)
+
+CHANGE_VERSION = ChangeVersion.__table__
+CHANGED_KEY = "changed_tables"
+
+
+def bump_version(table_name):
+    """ Mark the table as changed in the current transaction, its version
+        is increased at commit.
+
+        Args:
+            table_name(str): name of the changed table
+    """
+    DB.session.info.setdefault(CHANGED_KEY, set()).add(table_name)
+
+
+def is_outermost(session):
+    """ Check if commit or rollback ends the transaction of operations,
+        not savepoint of nested transaction context.
+    """
+    return session.info.get(DEPTH_KEY, 0) <= 1
+
+
+@event.listens_for(Session, "before_commit")
+def increase_versions(session):
+    """ Increase versions of tables changed in the committed transaction."""
+    if not is_outermost(session) or not session.info.get(CHANGED_KEY):
+        return
+
+    now = datetime.datetime.utcnow()
+    for table_name in sorted(session.info.pop(CHANGED_KEY)):
+        result = session.execute(
+            update(CHANGE_VERSION)
+            .where(CHANGE_VERSION.c.table_name == table_name)
+            .values(version=CHANGE_VERSION.c.version + 1, changed_at=now)
+        )
+        if result.rowcount == 0:
+            LOGGER.warning("Table %s has no change version row.", table_name)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def forget_changes(session, previous_transaction):
+    """ Forget tables changed in the rolled back transaction."""
+    if is_outermost(session):
+        session.info.pop(CHANGED_KEY, None)
+
+
+def init_versions(bind=None):
+    """ Create version rows of all tables which have none.
+
+        Args:
+            bind(Engine): database, DB.engine by default
+    """
+    with (bind or DB.engine).begin() as connection:
+        existing = {
+            row[0] for row in connection.execute(select([CHANGE_VERSION.c.table_name]))
+        }
+        now = datetime.datetime.utcnow()
+        rows = [
+            {"table_name": table.name, "version": 0, "changed_at": now}
+            for table in DB.metadata.sorted_tables
+            if table.name not in existing and table is not CHANGE_VERSION
+        ]
+        if rows:
+            connection.execute(insert(CHANGE_VERSION), rows)
+
+
+def version_column(table_name):
+    """ Get column selecting change version of the table, to read it
+        with the table rows in one query.
+
+        Args:
+            table_name(str): name of the table
+
+        Returns:
+            column(ScalarSelect): version of the table, NULL without row
+    """
+    return (
+        select([CHANGE_VERSION.c.version])
+        .where(CHANGE_VERSION.c.table_name == table_name)
+        .as_scalar()
+    )
+
+
+def get_versions(table_names):
+    """ Get change versions of tables, with one query.
+
+        Args:
+            table_names(list): names of tables
+
+        Returns:
+            versions(dict): table names mapped to tuples (version,
+                            time of the last change), (0, None)
+                            for tables never changed
+    """
+    query = select(
+        [
+            CHANGE_VERSION.c.table_name,
+            CHANGE_VERSION.c.version,
+            CHANGE_VERSION.c.changed_at,
+        ]
+    ).where(CHANGE_VERSION.c.table_name.in_(table_names))
+    versions = dict.fromkeys(table_names, (0, None))
+    for table_name, version, changed_at in DB.session.execute(query):
+        versions[table_name] = (version, changed_at)
+    return versions
+
+
+def version_tag(table_names, representation=()):
+    """ Get entity tag (ETag) and last modification time of data read
+        from tables. Read it before the data: data changed in the
+        meantime gets newer tag with the next request, never older.
+
+        Args:
+            table_names(list): names of tables
+            representation(tuple): negotiated format of the data
+                                   (e.g. mimetype and compression),
+                                   each one gets own tag
+
+        Returns:
+            etag(str): entity tag, changed with any table version
+            last_modified(datetime): time of the last change of any
+                                     table (UTC), None if none changed
+    """
+    versions = get_versions(table_names)
+    key = ",".join(
+        [f"{table_name}:{versions[table_name][0]}" for table_name in sorted(versions)]
+        + [str(part) for part in representation]
+    )
+    etag = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    changes = [changed_at for _, changed_at in versions.values() if changed_at]
+    return etag, max(changes, default=None)
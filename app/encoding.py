@@ -0,0 +1,229 @@
+""" Encodings of streamed records and response compression.
+
+    Records (namedtuples, see ServerOp.get_rows) are sent in one of
+    the row formats, chosen by Accept request header:
+
+        application/x-ndjson    one JSON object per record and line
+        application/msgpack     stream of msgpack maps: the header
+                                {"fields": [...]}, then one map per batch
+                                {"dictionary": [...], "rows": [...]},
+                                rows are arrays of values in fields order,
+                                strings of dictionary fields (e.g. status,
+                                tags) are indexes of the dictionary, which
+                                every batch extends with its new strings
+
+    Responses longer than COMPRESSION_THRESHOLD bytes are compressed
+    with gzip or deflate, chosen by Accept-Encoding request header.
+"""
+import itertools
+import json
+import zlib
+
+import msgpack
+from flask import Response
+from flask import current_app
+from flask import request
+from flask import stream_with_context
+
+
+NDJSON = "application/x-ndjson"
+MSGPACK = "application/msgpack"
+ROW_MIMETYPES = (NDJSON, MSGPACK)
+
+# zlib window bits of the compressed data formats
+COMPRESSIONS = {"gzip": 16 + zlib.MAX_WBITS, "deflate": zlib.MAX_WBITS}
+
+
+def row_mimetype():
+    """ Get row format accepted by the client, NDJSON by default."""
+    return request.accept_mimetypes.best_match(ROW_MIMETYPES, default=NDJSON)
+
+
+def response_encoding():
+    """ Get compression accepted by the client, None if it accepts none."""
+    return request.accept_encodings.best_match(list(COMPRESSIONS))
+
+
+def row_representation():
+    """ Get representation of streamed rows negotiated with the client,
+        e.g. to tag the response.
+
+        Returns:
+            representation(tuple): row mimetype and compression (or None)
+    """
+    return row_mimetype(), response_encoding()
+
+
+def ndjson_chunks(batches):
+    """ Encode batches of records into NDJSON, one chunk per batch.
+
+        Args:
+            batches(iterable): lists of records (namedtuples)
+
+        Yields:
+            chunk(bytes): records encoded as JSON, one per line
+    """
+    for batch in batches:
+        yield "".join(
+            json.dumps(record._asdict(), separators=(",", ":")) + "\n"
+            for record in batch
+        ).encode("utf-8")
+
+
+class Dictionary(dict):
+    """ Strings mapped to their indexes, added on first lookup."""
+
+    def __init__(self):
+        """ Constructor for Dictionary."""
+        super().__init__()
+        self.new_values = list()
+
+    def __missing__(self, value):
+        position = self[value] = len(self)
+        self.new_values.append(value)
+        return position
+
+    def pop_new_values(self):
+        """ Get strings added since the previous call."""
+        new_values, self.new_values = self.new_values, list()
+        return new_values
+
+
+def msgpack_chunks(batches, fields, dictionary_fields):
+    """ Encode batches of records into msgpack, one chunk per batch.
+
+        Args:
+            batches(iterable): lists of records (namedtuples)
+            fields(tuple): names of the records fields
+            dictionary_fields(tuple): names of fields with strings (or tuples
+                                      of strings) encoded as dictionary indexes
+
+        Yields:
+            chunk(bytes): msgpack header, then batches of records
+    """
+    packer = msgpack.Packer()
+    yield packer.pack({"fields": list(fields)})
+
+    positions = [fields.index(field) for field in dictionary_fields if field in fields]
+    dictionary = Dictionary()
+    for batch in batches:
+        rows = list()
+        for record in batch:
+            row = list(record)
+            for position in positions:
+                value = row[position]
+                if type(value) is tuple:
+                    row[position] = [dictionary[item] for item in value]
+                elif value is not None:
+                    row[position] = dictionary[value]
+            rows.append(row)
+        yield packer.pack({"dictionary": dictionary.pop_new_values(), "rows": rows})
+
+
+def decode_msgpack(data, dictionary_fields):
+    """ Decode records encoded with msgpack_chunks, e.g. by API client.
+
+        Args:
+            data(bytes): whole msgpack stream
+            dictionary_fields(tuple): names of dictionary encoded fields
+
+        Returns:
+            records(list): dicts of fields values
+    """
+    unpacker = msgpack.Unpacker(raw=False)
+    unpacker.feed(data)
+    fields = next(unpacker)["fields"]
+    positions = [fields.index(field) for field in dictionary_fields if field in fields]
+
+    dictionary = list()
+    records = list()
+    for batch in unpacker:
+        dictionary.extend(batch["dictionary"])
+        for row in batch["rows"]:
+            for position in positions:
+                value = row[position]
+                if isinstance(value, list):
+                    row[position] = [dictionary[item] for item in value]
+                elif value is not None:
+                    row[position] = dictionary[value]
+            records.append(dict(zip(fields, row)))
+    return records
+
+
+def row_chunks(batches, mimetype, fields, dictionary_fields=()):
+    """ Encode batches of records in the row format.
+
+        Args:
+            batches(iterable): lists of records (namedtuples)
+            mimetype(str): one of ROW_MIMETYPES
+            fields(tuple): names of the records fields
+            dictionary_fields(tuple): fields encoded with dictionary
+                                      (msgpack only)
+
+        Returns:
+            chunks(generator): encoded batches (bytes)
+    """
+    if mimetype == MSGPACK:
+        return msgpack_chunks(batches, fields, dictionary_fields)
+    return ndjson_chunks(batches)
+
+
+def compress_chunks(chunks, encoding, level):
+    """ Compress chunks as one stream. Every chunk is flushed, so client
+        can decode data received so far.
+
+        Args:
+            chunks(iterable): data chunks (bytes)
+            encoding(str): name of the compression, key of COMPRESSIONS
+            level(int): compression level, 1 (fastest) - 9 (smallest)
+
+        Yields:
+            chunk(bytes): compressed data
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, COMPRESSIONS[encoding])
+    for chunk in chunks:
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def stream_response(chunks, mimetype):
+    """ Create response streaming chunks, compressed with encoding
+        preferred by the client when response is not shorter than
+        COMPRESSION_THRESHOLD bytes. First chunks, up to the threshold,
+        are read before the response is returned, to decide it -
+        shorter response is sent whole, uncompressed.
+
+        Args:
+            chunks(iterable): response data chunks (bytes)
+            mimetype(str): response mimetype
+
+        Returns:
+            response(Response): response
+    """
+    config = current_app.config
+    chunks = stream_with_context(chunks)
+
+    head = list()
+    size = 0
+    for chunk in chunks:
+        head.append(chunk)
+        size += len(chunk)
+        if size >= config["COMPRESSION_THRESHOLD"]:
+            break
+    else:
+        response = Response(b"".join(head), mimetype=mimetype)
+        response.vary.update(("Accept", "Accept-Encoding"))
+        return response
+
+    chunks = itertools.chain(head, chunks)
+    encoding = response_encoding()
+    if encoding is not None:
+        chunks = compress_chunks(chunks, encoding, config["COMPRESSION_LEVEL"])
+
+    response = Response(chunks, mimetype=mimetype)
+    if encoding is not None:
+        response.content_encoding = encoding
+    response.vary.update(("Accept", "Accept-Encoding"))
+    return response
@@ -0,0 +1,5 @@
+""" Flask extensions, bound to the application by create_app."""
+from flask_sqlalchemy import SQLAlchemy
+
+
+DB = SQLAlchemy()
@@ -0,0 +1,369 @@
+""" Application metrics in Prometheus text format.
+
+    Requests metrics are recorded by every request. Metrics of the
+    connection pool, Op methods (see app.db.instrumentation) and catalog
+    caches are process totals, copied into the process store at most
+    every METRICS_SYNC_INTERVAL seconds and before rendering. With
+    METRICS_DIR set, values of all worker processes are summed, so any
+    worker serves metrics of all of them. The directory must be empty
+    when the server starts, and gunicorn should remove values of exited
+    workers in child_exit hook:
+
+        def child_exit(server, worker):
+            METRICS.mark_process_dead(worker.pid)
+"""
+import json
+import math
+import time
+
+from flask import g
+from flask import request
+
+from app.metrics.store import ProcessStores
+
+
+REQUEST_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+OP_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+FAMILIES = {
+    "smt_http_requests_total": ("counter", "HTTP requests by route and status."),
+    "smt_http_request_duration_seconds": (
+        "histogram",
+        "HTTP request duration by route.",
+    ),
+    "smt_http_requests_in_flight": ("gauge", "HTTP requests being served."),
+    "smt_db_pool_connections": (
+        "gauge",
+        "Connections of the pool: size, checked out and overflow.",
+    ),
+    "smt_db_pool_checkouts_total": ("counter", "Connections checked out."),
+    "smt_db_pool_checkout_timeouts_total": (
+        "counter",
+        "Checkouts timed out waiting for connection.",
+    ),
+    "smt_db_pool_checkout_wait_seconds_total": (
+        "counter",
+        "Time spent on connections checkouts.",
+    ),
+    "smt_op_duration_seconds": ("histogram", "Op method call duration."),
+    "smt_op_errors_total": ("counter", "Op method errors by exception class."),
+    "smt_op_statements_total": ("counter", "SQL statements executed by Op method."),
+    "smt_catalog_cache_hits_total": ("counter", "Catalog cache hits."),
+    "smt_catalog_cache_misses_total": ("counter", "Catalog cache misses."),
+    "smt_catalog_cache_hit_ratio": ("gauge", "Catalog cache hits of all lookups."),
+}
+
+
+HISTOGRAM_BUCKETS = {
+    "smt_http_request_duration_seconds": REQUEST_BUCKETS,
+    "smt_op_duration_seconds": OP_BUCKETS,
+}
+
+
+def metric_key(name, labels):
+    """ Get store key of the metric sample.
+
+        Args:
+            name(str): sample name
+            labels(dict): sample labels
+
+        Returns:
+            key(str): store key
+    """
+    return json.dumps([name, sorted(labels.items())])
+
+
+def bucket_bound(bound):
+    return "+Inf" if math.isinf(bound) else repr(float(bound))
+
+
+class Metrics:
+    """ Application metrics, see module docstring."""
+
+    def __init__(self):
+        """ Constructor for Metrics."""
+        self.stores = ProcessStores()
+        self.sync_interval = 1.0
+        self.synced_at = None
+        self.synced_calls = dict()
+
+    def configure(self, directory=None, sync_interval=1.0):
+        """ Configure metrics storage.
+
+            Args:
+                directory(str): directory of workers files,
+                                None for single process
+                sync_interval(float): minimal time between copies
+                                      of process totals, in seconds
+        """
+        self.stores.configure(directory)
+        self.sync_interval = sync_interval
+        self.synced_at = None
+        self.synced_calls = dict()
+
+    def inc(self, name, labels=None, amount=1.0, live=False):
+        self.stores.store(live).add(metric_key(name, labels or dict()), amount)
+
+    def set(self, name, labels=None, value=0.0, live=False):
+        self.stores.store(live).set(metric_key(name, labels or dict()), value)
+
+    def observe(self, name, labels, value, buckets):
+        """ Record value in the histogram.
+
+            Args:
+                name(str): histogram name
+                labels(dict): histogram labels
+                value(float): observed value
+                buckets(tuple): upper bounds of histogram buckets
+        """
+        bound = next((bound for bound in buckets if value <= bound), math.inf)
+        store = self.stores.store()
+        bucket_labels = dict(labels, le=bucket_bound(bound))
+        store.add(metric_key(f"{name}_bucket", bucket_labels), 1.0)
+        store.add(metric_key(f"{name}_sum", labels), value)
+        store.add(metric_key(f"{name}_count", labels), 1.0)
+
+    def mark_process_dead(self, pid):
+        self.stores.mark_process_dead(pid)
+
+    def start_request(self):
+        g.metrics_start = time.perf_counter()
+        self.inc("smt_http_requests_in_flight", live=True)
+
+    def end_request(self, status):
+        """ Record the request served by the current process.
+
+            Args:
+                status(int): response status code
+        """
+        start = g.pop("metrics_start", None)
+        if start is None:
+            return
+
+        self.inc("smt_http_requests_in_flight", amount=-1.0, live=True)
+        route = request.url_rule.rule if request.url_rule else "unmatched"
+        labels = {"method": request.method, "route": route}
+        self.inc("smt_http_requests_total", dict(labels, status=str(status)))
+        self.observe(
+            "smt_http_request_duration_seconds",
+            labels,
+            time.perf_counter() - start,
+            REQUEST_BUCKETS,
+        )
+
+        if self.synced_at is None or (
+            time.monotonic() - self.synced_at >= self.sync_interval
+        ):
+            self.sync()
+
+    def sync(self):
+        """ Copy totals of the current process: pool, Op methods
+            and catalog caches metrics.
+        """
+        from app.db.instrumentation import INSTRUMENTATION
+        from app.db.operations.basic.server_status import ServerStatusOp
+        from app.db.operations.basic.server_type import ServerTypeOp
+        from app.db.pool import pool_stats
+
+        self.synced_at = time.monotonic()
+
+        pool = pool_stats()
+        if pool is not None:
+            for state in ("size", "checked_out", "overflow"):
+                self.set(
+                    "smt_db_pool_connections", {"state": state}, pool[state], live=True
+                )
+            self.set("smt_db_pool_checkouts_total", value=pool["checkouts"])
+            self.set("smt_db_pool_checkout_timeouts_total", value=pool["timeouts"])
+            self.set(
+                "smt_db_pool_checkout_wait_seconds_total",
+                value=pool["wait_total_ms"] / 1000,
+            )
+
+        for name, metrics in list(INSTRUMENTATION.metrics.items()):
+            if self.synced_calls.get(name, 0) == metrics.calls:
+                continue
+            with metrics.lock:
+                self.synced_calls[name] = metrics.calls
+                buckets = metrics.latency.buckets()
+                total = metrics.latency.total
+                errors = dict(metrics.errors)
+                statements = metrics.statements
+            self.set_histogram(
+                "smt_op_duration_seconds",
+                {"operation": name},
+                [(highest / 1000000, count) for highest, count in buckets],
+                total / 1000000,
+                OP_BUCKETS,
+            )
+            for error, count in errors.items():
+                self.set(
+                    "smt_op_errors_total", {"operation": name, "error": error}, count
+                )
+            self.set("smt_op_statements_total", {"operation": name}, statements)
+
+        for op_class in (ServerStatusOp, ServerTypeOp):
+            stats = op_class.CACHE.stats()
+            labels = {"cache": op_class.CACHE.model.__tablename__}
+            self.set("smt_catalog_cache_hits_total", labels, stats["hits"])
+            self.set("smt_catalog_cache_misses_total", labels, stats["misses"])
+
+    def set_histogram(self, name, labels, values, total, buckets):
+        """ Set histogram to values counted by other histogram.
+
+            Args:
+                name(str): histogram name
+                labels(dict): histogram labels
+                values(list): tuples (value, count)
+                total(float): sum of values
+                buckets(tuple): upper bounds of histogram buckets
+        """
+        counts = dict.fromkeys(list(buckets) + [math.inf], 0)
+        for value, count in values:
+            bound = next((bound for bound in buckets if value <= bound), math.inf)
+            counts[bound] += count
+
+        for bound, count in counts.items():
+            bucket_labels = dict(labels, le=bucket_bound(bound))
+            self.set(f"{name}_bucket", bucket_labels, count)
+        self.set(f"{name}_sum", labels, total)
+        self.set(f"{name}_count", labels, sum(counts.values()))
+
+    def samples(self):
+        """ Get samples of all processes, with cumulative histogram
+            buckets and cache hit ratios.
+
+            Returns:
+                samples(dict): metric family names mapped to lists
+                               of tuples (sample name, labels, value)
+        """
+        self.sync()
+        families = {name: list() for name in FAMILIES}
+        for key, value in sorted(self.stores.collect().items()):
+            name, labels = json.loads(key)
+            family = name
+            for suffix in ("_bucket", "_sum", "_count"):
+                if name.endswith(suffix) and name[: -len(suffix)] in FAMILIES:
+                    family = name[: -len(suffix)]
+            if family in families:
+                families[family].append((name, dict(labels), value))
+
+        for family, buckets in HISTOGRAM_BUCKETS.items():
+            families[family] = cumulative_buckets(families[family], buckets)
+
+        hits = {
+            labels["cache"]: value
+            for _, labels, value in families["smt_catalog_cache_hits_total"]
+        }
+        for _, labels, misses in families["smt_catalog_cache_misses_total"]:
+            lookups = hits.get(labels["cache"], 0.0) + misses
+            if lookups:
+                families["smt_catalog_cache_hit_ratio"].append(
+                    (
+                        "smt_catalog_cache_hit_ratio",
+                        labels,
+                        hits.get(labels["cache"], 0.0) / lookups,
+                    )
+                )
+        return families
+
+    def render(self):
+        """ Render metrics of all processes in Prometheus text format."""
+        lines = list()
+        for family, samples in self.samples().items():
+            if not samples:
+                continue
+            kind, help_text = FAMILIES[family]
+            lines.append(f"# HELP {family} {help_text}")
+            lines.append(f"# TYPE {family} {kind}")
+            for name, labels, value in samples:
+                lines.append(f"{name}{format_labels(labels)} {format_value(value)}")
+        return "\n".join(lines) + "\n"
+
+
+def cumulative_buckets(samples, buckets):
+    """ Turn counts of histogram buckets into cumulative counts
+        of all buckets, ordered by bucket upper bound.
+
+        Args:
+            samples(list): histogram samples, tuples (name, labels, value)
+            buckets(tuple): upper bounds of histogram buckets
+
+        Returns:
+            samples(list): histogram samples with cumulative buckets
+    """
+    counts = dict()
+    others = list()
+    for name, labels, value in samples:
+        if name.endswith("_bucket"):
+            series = tuple(sorted((k, v) for k, v in labels.items() if k != "le"))
+            series_counts = counts.setdefault((name, series), dict())
+            series_counts[float(labels["le"])] = value
+        else:
+            others.append((name, labels, value))
+
+    result = list()
+    for (name, series), series_counts in sorted(counts.items()):
+        total = 0.0
+        for bound in list(buckets) + [math.inf]:
+            total += series_counts.get(bound, 0.0)
+            result.append((name, dict(series, le=bucket_bound(bound)), total))
+    return result + others
+
+
+def format_labels(labels):
+    if not labels:
+        return ""
+    pairs = ",".join(
+        '{}="{}"'.format(name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in sorted(labels.items())
+    )
+    return "{" + pairs + "}"
+
+
+def format_value(value):
+    if value.is_integer():
+        return str(int(value))
+    return repr(value)
+
+
+METRICS = Metrics()
+
+
+def init_metrics(app):
+    """ Record metrics of the application requests.
+
+        Args:
+            app(Flask): application
+    """
+    METRICS.configure(app.config["METRICS_DIR"], app.config["METRICS_SYNC_INTERVAL"])
+
+    @app.before_request
+    def start_request():
+        METRICS.start_request()
+
+    @app.after_request
+    def end_request(response):
+        METRICS.end_request(response.status_code)
+        return response
+
+    @app.teardown_request
+    def end_failed_request(error):
+        # after_request is not called when the view raised an exception
+        METRICS.end_request(500)
@@ -0,0 +1,247 @@
+""" Storage of metric values, shared by processes through files.
+
+    Every process writes its values into own memory mapped file, so
+    writes are as cheap as in memory and never block other processes.
+    Values of all processes are summed when metrics are read, by any
+    process. File layout: 8 bytes of used length, then entries aligned
+    to 8 bytes: 4 bytes key length, key (UTF-8), padding, 8 bytes value
+    (double). New entry becomes visible to readers when used length
+    is updated, after the entry is written.
+"""
+import glob
+import mmap
+import os
+import struct
+import threading
+
+
+HEADER = struct.Struct("Q")
+KEY_LENGTH = struct.Struct("I")
+VALUE = struct.Struct("d")
+INITIAL_SIZE = 1 << 16
+
+
+def entry_size(key_length):
+    """ Size of the entry with key of given length, aligned to 8 bytes."""
+    return -(-(KEY_LENGTH.size + key_length) // 8) * 8 + VALUE.size
+
+
+def read_entries(data, used):
+    """ Read entries from the file data.
+
+        Args:
+            data(bytes): file content (or memory map)
+            used(int): used length of the data
+
+        Yields:
+            key(str): entry key
+            offset(int): offset of entry value
+    """
+    position = HEADER.size
+    while position < used:
+        (key_length,) = KEY_LENGTH.unpack_from(data, position)
+        key_start = position + KEY_LENGTH.size
+        key = bytes(data[key_start : key_start + key_length]).decode("utf-8")
+        offset = position + entry_size(key_length) - VALUE.size
+        yield key, offset
+        position = offset + VALUE.size
+
+
+class MemoryStore:
+    """ Metric values of the single process, in memory."""
+
+    def __init__(self):
+        """ Constructor for MemoryStore."""
+        self.lock = threading.Lock()
+        self.values = dict()
+
+    def add(self, key, amount):
+        with self.lock:
+            self.values[key] = self.values.get(key, 0.0) + amount
+
+    def set(self, key, value):
+        with self.lock:
+            self.values[key] = float(value)
+
+    def items(self):
+        with self.lock:
+            return list(self.values.items())
+
+
+class MmapStore:
+    """ Metric values of the process, in memory mapped file."""
+
+    def __init__(self, path):
+        """ Constructor for MmapStore.
+
+            Args:
+                path(str): path of the file, created if it does not exist
+        """
+        self.path = path
+        self.lock = threading.Lock()
+        self.file = open(path, "a+b")
+        if os.fstat(self.file.fileno()).st_size == 0:
+            self.file.truncate(INITIAL_SIZE)
+        self.mmap = mmap.mmap(self.file.fileno(), 0)
+
+        (self.used,) = HEADER.unpack_from(self.mmap, 0)
+        if self.used == 0:
+            self.used = HEADER.size
+            HEADER.pack_into(self.mmap, 0, self.used)
+        self.offsets = dict(read_entries(self.mmap, self.used))
+
+    def offset(self, key):
+        """ Get offset of the key value, adding new entry if needed."""
+        offset = self.offsets.get(key)
+        if offset is not None:
+            return offset
+
+        encoded = key.encode("utf-8")
+        size = entry_size(len(encoded))
+        if self.used + size > len(self.mmap):
+            capacity = len(self.mmap)
+            while self.used + size > capacity:
+                capacity *= 2
+            self.mmap.close()
+            self.file.truncate(capacity)
+            self.mmap = mmap.mmap(self.file.fileno(), 0)
+
+        KEY_LENGTH.pack_into(self.mmap, self.used, len(encoded))
+        key_start = self.used + KEY_LENGTH.size
+        self.mmap[key_start : key_start + len(encoded)] = encoded
+        offset = self.used + size - VALUE.size
+        VALUE.pack_into(self.mmap, offset, 0.0)
+
+        self.used += size
+        HEADER.pack_into(self.mmap, 0, self.used)
+        self.offsets[key] = offset
+        return offset
+
+    def add(self, key, amount):
+        with self.lock:
+            offset = self.offset(key)
+            (value,) = VALUE.unpack_from(self.mmap, offset)
+            VALUE.pack_into(self.mmap, offset, value + amount)
+
+    def set(self, key, value):
+        with self.lock:
+            offset = self.offset(key)
+            VALUE.pack_into(self.mmap, offset, float(value))
+
+    def items(self):
+        with self.lock:
+            return [
+                (key, VALUE.unpack_from(self.mmap, offset)[0])
+                for key, offset in self.offsets.items()
+            ]
+
+    def close(self):
+        with self.lock:
+            self.mmap.close()
+            self.file.close()
+
+
+def read_file(path):
+    """ Read values from the file of other process.
+
+        Args:
+            path(str): path of MmapStore file
+
+        Returns:
+            values(list): tuples (key, value)
+    """
+    with open(path, "rb") as store_file:
+        data = store_file.read()
+    if len(data) < HEADER.size:
+        return list()
+
+    (used,) = HEADER.unpack_from(data, 0)
+    return [
+        (key, VALUE.unpack_from(data, offset)[0])
+        for key, offset in read_entries(data, min(used, len(data)))
+    ]
+
+
+class ProcessStores:
+    """ Stores of the current process, and values summed over processes.
+
+        Without directory values are kept in memory, for single process.
+        With directory every process writes two files: metrics_<pid>.db
+        with values kept after the process exits (counters, histograms),
+        and live_<pid>.db with values of living process only (gauges,
+        e.g. requests in flight), removed with mark_process_dead.
+    """
+
+    def __init__(self, directory=None):
+        """ Constructor for ProcessStores.
+
+            Args:
+                directory(str): directory of processes files,
+                                None to keep values in memory
+        """
+        self.lock = threading.Lock()
+        self.configure(directory)
+
+    def configure(self, directory):
+        """ Change directory of processes files, forget current stores."""
+        with self.lock:
+            self.directory = directory or None
+            self.pid = None
+            self.stores = dict()
+
+    def store(self, live=False):
+        """ Get store of the current process, opened on first use
+            (and again in forked process).
+
+            Args:
+                live(bool): True for store of values of living process
+
+            Returns:
+                store(MemoryStore, MmapStore): store of values
+        """
+        kind = "live" if live else "metrics"
+        pid = os.getpid()
+        if self.pid == pid and kind in self.stores:
+            return self.stores[kind]
+
+        with self.lock:
+            if self.pid != pid:
+                self.pid = pid
+                self.stores = dict()
+            if kind not in self.stores:
+                if self.directory is None:
+                    self.stores[kind] = MemoryStore()
+                else:
+                    path = os.path.join(self.directory, f"{kind}_{pid}.db")
+                    self.stores[kind] = MmapStore(path)
+            return self.stores[kind]
+
+    def collect(self):
+        """ Sum values of all processes.
+
+            Returns:
+                values(dict): keys mapped to summed values
+        """
+        if self.directory is None:
+            items = [self.store().items(), self.store(live=True).items()]
+        else:
+            pattern = os.path.join(self.directory, "*.db")
+            items = [read_file(path) for path in sorted(glob.glob(pattern))]
+
+        values = dict()
+        for process_items in items:
+            for key, value in process_items:
+                values[key] = values.get(key, 0.0) + value
+        return values
+
+    def mark_process_dead(self, pid):
+        """ Remove values of living process, after the process exited.
+
+            Args:
+                pid(int): ID of the exited process
+        """
+        if self.directory is None:
+            return
+        path = os.path.join(self.directory, f"live_{pid}.db")
+        if os.path.exists(path):
+            os.remove(path)
@@ -0,0 +1,234 @@
+from functools import wraps
+
+from flask import Blueprint
+from flask import Response
+from flask import jsonify
+from flask import make_response
+from flask import request
+
+from app.db.exceptions import BatchOperationNotValidError
+from app.db.exceptions import DbError
+from app.db.exceptions import ServerNotFoundError
+
+from app.db.models.admin import Admin
+from app.db.models.ip import Ip
+from app.db.models.server import Server
+from app.db.models.server_status import ServerStatus
+from app.db.models.server_type import ServerType
+from app.db.models.tag import Tag
+from app.db.operations.basic.server import ServerOp
+from app.db.operations.batch import BatchOp
+from app.db.pool import pool_stats
+from app.db.slow_queries import SLOW_QUERIES
+from app.db.versions import version_tag
+from app.encoding import row_chunks
+from app.encoding import row_mimetype
+from app.encoding import row_representation
+from app.encoding import stream_response
+from app.metrics.prometheus import METRICS
+
+
+VIEWS = Blueprint("views", __name__)
+# registered with DEBUG or DEBUG_ENDPOINTS config value only
+DEBUG_VIEWS = Blueprint("debug_views", __name__, url_prefix="/debug")
+
+SERVER_FIELDS = tuple(ServerOp.ROW_COLUMNS) + tuple(ServerOp.ROW_COLLECTIONS)
+SERVER_FILTERS = {
+    "id": "id",
+    "name": "name",
+    "status": "srv_status",
+    "type": "srv_type",
+    "ip": "ip",
+    "network": "network",
+}
+SERVER_LIST_FILTERS = ("tags", "admins")
+SERVER_DICTIONARY_FIELDS = ("status", "type", "tags", "admins")
+SERVER_TABLES = (
+    Server.__tablename__,
+    ServerStatus.__tablename__,
+    ServerType.__tablename__,
+    Ip.__tablename__,
+    Tag.__tablename__,
+    Admin.__tablename__,
+)
+STREAM_BATCH_SIZE = 500
+
+
+@VIEWS.errorhandler(DbError)
+def db_error(error, status=400):
+    return jsonify(error=type(error).__name__, message=str(error)), status
+
+
+def not_modified(etag, last_modified):
+    """ Check if the client has current data, by If-None-Match
+        or (when it is not sent) If-Modified-Since request header.
+    """
+    if request.if_none_match:
+        return request.if_none_match.contains_weak(etag)
+    if request.if_modified_since and last_modified:
+        since = request.if_modified_since.replace(tzinfo=None)
+        return last_modified.replace(microsecond=0) <= since
+    return False
+
+
+def conditional(*table_names, negotiate=None):
+    """ Decorate view of data read from tables, to send ETag
+        and Last-Modified headers made of change versions of the tables
+        (see app.db.versions) and answer conditional requests
+        with 304 Not Modified, without running the view.
+
+        Args:
+            table_names(str): names of tables read by the view
+            negotiate(callable): function returning representation
+                                 negotiated by Accept and Accept-Encoding
+                                 request headers (see app.encoding),
+                                 which is part of the tag
+    """
+
+    def decorator(view):
+        @wraps(view)
+        def conditional_view(*args, **kwargs):
+            representation = negotiate() if negotiate else ()
+            etag, last_modified = version_tag(table_names, representation)
+            if not_modified(etag, last_modified):
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+
+            response.set_etag(etag, weak=True)
+            if last_modified:
+                response.last_modified = last_modified
+            response.cache_control.no_cache = True
+            if negotiate:
+                response.vary.update(("Accept", "Accept-Encoding"))
+            return response
+
+        return conditional_view
+
+    return decorator
+
+
+def server_filters(args):
+    """ Translate query string into ServerOp.get filter parameters.
+        Lists are given as repeated or comma separated values,
+        e.g. tags=web&tags=db or tags=web,db.
+
+        Args:
+            args(MultiDict): request query string arguments
+
+        Returns:
+            filters(dict): filter parameters
+    """
+    filters = dict()
+    for arg, parameter in SERVER_FILTERS.items():
+        if arg in args:
+            filters[parameter] = args[arg]
+    if "id" in filters and filters["id"].isdigit():
+        filters["id"] = int(filters["id"])
+
+    for arg in SERVER_LIST_FILTERS:
+        values = [value for item in args.getlist(arg) for value in item.split(",")]
+        if values:
+            filters[arg] = values
+    return filters
+
+
+def server_fields(args):
+    """ Get names of Server row fields chosen by fields argument of query
+        string, given as repeated or comma separated values, e.g.
+        fields=id,name,status. Only columns of chosen fields are selected
+        and only chosen collections (ips, tags, admins) are fetched.
+
+        Args:
+            args(MultiDict): request query string arguments
+
+        Returns:
+            fields(list): names of fields, SERVER_FIELDS if not given
+                         or empty
+    """
+    fields = [
+        field for item in args.getlist("fields") for field in item.split(",") if field
+    ]
+    return fields or list(SERVER_FIELDS)
+
+
+@VIEWS.route("/")
+def hello():
+    return "Hello World!"
+
+
+@VIEWS.route("/server")
+@conditional(Server.__tablename__)
+def server():
+    result = Server.query.get(1)
+    return str(result)
+
+
+@VIEWS.route("/servers")
+@conditional(*SERVER_TABLES, negotiate=row_representation)
+def servers():
+    """ Stream Server rows filtered by query string (see server_filters),
+        with fields chosen by query string (see server_fields), as NDJSON
+        or msgpack (see app.encoding). Rows are read from server side
+        cursor while the response is sent, so it is not held in memory.
+    """
+    fields = ServerOp.row_fields(server_fields(request.args))
+    batches = ServerOp.stream_rows(
+        fields=fields, batch_size=STREAM_BATCH_SIZE, **server_filters(request.args),
+    )
+    mimetype = row_mimetype()
+    chunks = row_chunks(batches, mimetype, fields, SERVER_DICTIONARY_FIELDS)
+    return stream_response(chunks, mimetype)
+
+
+@VIEWS.route("/servers/<int:server_id>")
+@conditional(*SERVER_TABLES)
+def server_row(server_id):
+    """ Get Server row as JSON, with fields chosen by query string
+        (see server_fields).
+    """
+    rows = ServerOp.get_rows(fields=server_fields(request.args), id=server_id)
+    if not rows:
+        return db_error(ServerNotFoundError(f"Server: {server_id} not found."), 404)
+    return jsonify(rows[0]._asdict())
+
+
+@VIEWS.route("/batch", methods=["POST"])
+def batch():
+    """ Run many operations in one transaction, see BatchOp.run.
+        Request body: {"operations": [...], "mode": "atomic"}. Response
+        has results of all operations, with status 400 if the batch
+        was rolled back.
+    """
+    payload = request.get_json(silent=True)
+    if not isinstance(payload, dict):
+        raise BatchOperationNotValidError("Request body must be JSON object.")
+
+    mode = payload.get("mode", "atomic")
+    batch = BatchOp.run(payload.get("operations"), mode=mode)
+    return jsonify(mode=mode, **batch), 200 if batch["committed"] else 400
+
+
+@VIEWS.route("/server_type")
+@conditional(ServerType.__tablename__)
+def server_type():
+    result = ServerType.query.get(1)
+    return str(result)
+
+
+@DEBUG_VIEWS.route("/pool")
+def pool():
+    return jsonify(pool_stats())
+
+
+@DEBUG_VIEWS.route("/slow-queries")
+def slow_queries():
+    limit = request.args.get("limit", type=int)
+    return jsonify(SLOW_QUERIES.top(limit))
+
+
+@VIEWS.route("/metrics")
+def metrics():
+    return Response(METRICS.render(), mimetype="text/plain; version=0.0.4")
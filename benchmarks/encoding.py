@@ -0,0 +1,110 @@
+""" Benchmark of /servers response encodings: payload size and CPU time.
+
+    Fills the database with synthetic fleet, reads all servers records
+    once (as /servers streams them), then encodes them with every row
+    format (NDJSON, msgpack with dictionary encoded names), without
+    and with compression, and reports payload size and median CPU time
+    of encoding (with compression) and of decoding by the client.
+
+    Usage:
+        python -m benchmarks.encoding --uri sqlite:////tmp/bench.db
+        python -m benchmarks.encoding --servers 100000 --level 1 --level 6
+"""
+import argparse
+import json
+import statistics
+import time
+import zlib
+
+from app import create_app
+from app.encoding import COMPRESSIONS
+from app.encoding import MSGPACK
+from app.encoding import NDJSON
+from app.encoding import compress_chunks
+from app.encoding import decode_msgpack
+from app.encoding import row_chunks
+from app.db.operations.basic.server import ServerOp
+from app.views import SERVER_DICTIONARY_FIELDS
+from app.views import SERVER_FIELDS
+from app.views import STREAM_BATCH_SIZE
+
+from benchmarks.fleet import add_fleet_arguments
+from benchmarks.fleet import fleet_from_arguments
+from benchmarks.fleet import generate
+
+
+def encode(batches, mimetype, level):
+    """ Encode batches like /servers does, compressed with gzip
+        when level is given.
+    """
+    chunks = row_chunks(batches, mimetype, SERVER_FIELDS, SERVER_DICTIONARY_FIELDS)
+    if level is not None:
+        chunks = compress_chunks(chunks, "gzip", level)
+    return b"".join(chunks)
+
+
+def decode(payload, mimetype, level):
+    """ Decode payload like API client does."""
+    if level is not None:
+        payload = zlib.decompress(payload, COMPRESSIONS["gzip"])
+    if mimetype == MSGPACK:
+        return decode_msgpack(payload, SERVER_DICTIONARY_FIELDS)
+    return [json.loads(line) for line in payload.splitlines()]
+
+
+def cpu_ms(function, repeat):
+    """ Measure median CPU time of the function, in milliseconds."""
+    timings = list()
+    for _ in range(repeat):
+        start = time.process_time()
+        function()
+        timings.append((time.process_time() - start) * 1000)
+    return round(statistics.median(timings), 1)
+
+
+def measure(batches, mimetype, level, repeat):
+    """ Measure payload size and CPU time of encoding and decoding."""
+    payload = encode(batches, mimetype, level)
+    return {
+        "bytes": len(payload),
+        "encode_ms": cpu_ms(lambda: encode(batches, mimetype, level), repeat),
+        "decode_ms": cpu_ms(lambda: decode(payload, mimetype, level), repeat),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uri", default="sqlite:////tmp/smt_bench.db")
+    add_fleet_arguments(parser, servers=20000, tags=1000, admins=200)
+    parser.add_argument(
+        "--level",
+        type=int,
+        action="append",
+        help="gzip compression level, repeat to compare levels (default: 1, 6)",
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    create_app(SQLALCHEMY_DATABASE_URI=args.uri).app_context().push()
+
+    fleet = fleet_from_arguments(args)
+    generate(fleet)
+    batches = list(
+        ServerOp.stream_rows(fields=SERVER_FIELDS, batch_size=STREAM_BATCH_SIZE)
+    )
+
+    report = {"servers": fleet.servers}
+    for mimetype in (NDJSON, MSGPACK):
+        for level in [None] + (args.level or [1, 6]):
+            name = mimetype.split("/")[1] + ("" if level is None else f"+gzip{level}")
+            report[name] = measure(batches, mimetype, level, args.repeat)
+
+    plain = report["x-ndjson"]["bytes"]
+    for name, result in report.items():
+        if name != "servers":
+            result["ratio"] = round(result["bytes"] / plain, 3)
+    print(json.dumps(report, indent=4))
+
+
+if __name__ == "__main__":
+    main()
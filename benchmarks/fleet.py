@@ -0,0 +1,309 @@
+""" Synthetic fleet generator for benchmarks.
+
+    Fleet consists of servers with given number of own IP addresses,
+    tags and admins drawn from shared pools, and statuses and types
+    assigned round robin. Rows are inserted with executemany in chunks,
+    bypassing the Op layer, so even big fleets are created quickly.
+"""
+import random
+
+from app.extensions import DB
+from app.db.versions import init_versions
+from app.db.models.server import Server
+from app.db.models.server import server_ip
+from app.db.models.server import server_tag
+from app.db.models.server import server_admin
+from app.db.models.ip import Ip
+from app.db.models.tag import Tag
+from app.db.models.admin import Admin
+from app.db.models.server_status import ServerStatus
+from app.db.models.server_type import ServerType
+
+
+INSERT_CHUNK = 10000
+
+
+class Fleet:
+    """ Sizes of the synthetic fleet, and names of its rows."""
+
+    def __init__(
+        self,
+        servers=10000,
+        ips_per_server=2,
+        tags=500,
+        tags_per_server=4,
+        admins=100,
+        admins_per_server=1,
+        statuses=4,
+        types=3,
+        seed=0,
+    ):
+        """ Constructor for Fleet.
+
+            Args:
+                servers(int): number of servers
+                ips_per_server(int): number of IP addresses of every server
+                tags(int): number of tags
+                tags_per_server(int): number of tags of every server
+                admins(int): number of admins
+                admins_per_server(int): number of admins of every server
+                statuses(int): number of server statuses
+                types(int): number of server types
+                seed(int): seed of random tags and admins assignment
+        """
+        self.servers = servers
+        self.ips_per_server = ips_per_server
+        self.tags = tags
+        self.tags_per_server = min(tags_per_server, tags)
+        self.admins = admins
+        self.admins_per_server = min(admins_per_server, admins)
+        self.statuses = statuses
+        self.types = types
+        self.seed = seed
+
+    @property
+    def ips(self):
+        """ Number of IP addresses."""
+        return self.servers * self.ips_per_server
+
+    @property
+    def association_rows(self):
+        """ Number of server_ip, server_tag and server_admin rows."""
+        per_server = self.ips_per_server + self.tags_per_server + self.admins_per_server
+        return self.servers * per_server
+
+    @staticmethod
+    def server_name(number):
+        return f"server{number}"
+
+    @staticmethod
+    def tag_name(number):
+        return f"tag{number}"
+
+    @staticmethod
+    def admin_name(number):
+        return f"admin{number}"
+
+    @staticmethod
+    def letters(number):
+        """ Number written with letters (1 - A, 26 - Z, 27 - AA),
+            for names which can not contain digits.
+        """
+        letters = ""
+        while number:
+            number, rest = divmod(number - 1, 26)
+            letters = chr(ord("A") + rest) + letters
+        return letters
+
+    @classmethod
+    def status_name(cls, number):
+        return f"Status{cls.letters(number)}"
+
+    @classmethod
+    def type_name(cls, number):
+        return f"Type{cls.letters(number)}"
+
+    @staticmethod
+    def address(number):
+        """ IP address with given number, from 10.0.0.0/8 network."""
+        return f"10.{number >> 16 & 255}.{number >> 8 & 255}.{number & 255}"
+
+    def server_ip_numbers(self, server_number):
+        """ Numbers of IP addresses of the server with given number."""
+        first = (server_number - 1) * self.ips_per_server + 1
+        return range(first, first + self.ips_per_server)
+
+    def to_dict(self):
+        """ Fleet sizes as dict, for benchmark reports."""
+        return {
+            "servers": self.servers,
+            "ips": self.ips,
+            "tags": self.tags,
+            "admins": self.admins,
+            "statuses": self.statuses,
+            "types": self.types,
+            "tags_per_server": self.tags_per_server,
+            "admins_per_server": self.admins_per_server,
+            "ips_per_server": self.ips_per_server,
+            "association_rows": self.association_rows,
+            "seed": self.seed,
+        }
+
+    @classmethod
+    def from_dict(cls, sizes):
+        """ Create Fleet from sizes saved with to_dict method.
+
+            Args:
+                sizes(dict): fleet sizes
+
+            Returns:
+                fleet(Fleet): sizes of the fleet
+        """
+        arguments = (
+            "servers",
+            "ips_per_server",
+            "tags",
+            "tags_per_server",
+            "admins",
+            "admins_per_server",
+            "statuses",
+            "types",
+            "seed",
+        )
+        return cls(**{name: sizes[name] for name in arguments if name in sizes})
+
+
+def insert_rows(table, rows):
+    """ Insert rows into the table with executemany, in chunks.
+
+        Args:
+            table(Table): table to fill
+            rows(iterable): dicts with column values
+    """
+    chunk = list()
+    for row in rows:
+        chunk.append(row)
+        if len(chunk) == INSERT_CHUNK:
+            DB.session.execute(table.insert(), chunk)
+            chunk = list()
+    if chunk:
+        DB.session.execute(table.insert(), chunk)
+    DB.session.commit()
+
+
+def generate(fleet):
+    """ Drop and create schema, then fill it with the synthetic fleet.
+
+        Args:
+            fleet(Fleet): sizes of the fleet
+    """
+    DB.session.remove()
+    DB.drop_all()
+    DB.create_all()
+    init_versions()
+
+    insert_rows(
+        ServerStatus.__table__,
+        ({"id": i, "name": fleet.status_name(i)} for i in range(1, fleet.statuses + 1)),
+    )
+    insert_rows(
+        ServerType.__table__,
+        ({"id": i, "name": fleet.type_name(i)} for i in range(1, fleet.types + 1)),
+    )
+    insert_rows(
+        Tag.__table__,
+        ({"id": i, "name": fleet.tag_name(i)} for i in range(1, fleet.tags + 1)),
+    )
+    insert_rows(
+        Admin.__table__,
+        ({"id": i, "name": fleet.admin_name(i)} for i in range(1, fleet.admins + 1)),
+    )
+    insert_rows(
+        Server.__table__,
+        (
+            {
+                "id": i,
+                "name": fleet.server_name(i),
+                "status_id": i % fleet.statuses + 1,
+                "type_id": i % fleet.types + 1,
+            }
+            for i in range(1, fleet.servers + 1)
+        ),
+    )
+    insert_rows(
+        Ip.__table__,
+        ({"id": i, "address": fleet.address(i)} for i in range(1, fleet.ips + 1)),
+    )
+
+    rand = random.Random(fleet.seed)
+    insert_rows(
+        server_ip,
+        (
+            {"server_id": srv_id, "ip_id": ip_id}
+            for srv_id in range(1, fleet.servers + 1)
+            for ip_id in fleet.server_ip_numbers(srv_id)
+        ),
+    )
+    insert_rows(
+        server_tag,
+        (
+            {"server_id": srv_id, "tag_id": tag_id}
+            for srv_id in range(1, fleet.servers + 1)
+            for tag_id in rand.sample(range(1, fleet.tags + 1), fleet.tags_per_server)
+        ),
+    )
+    insert_rows(
+        server_admin,
+        (
+            {"server_id": srv_id, "admin_id": admin_id}
+            for srv_id in range(1, fleet.servers + 1)
+            for admin_id in rand.sample(
+                range(1, fleet.admins + 1), fleet.admins_per_server
+            )
+        ),
+    )
+
+    reset_sequences()
+
+
+def reset_sequences():
+    """ Move PostgreSQL sequences past the inserted IDs, so rows added
+        later through the Op layer get next free IDs.
+    """
+    if DB.engine.dialect.name != "postgresql":
+        return
+
+    for table in (ServerStatus, ServerType, Tag, Admin, Server, Ip):
+        name = table.__tablename__
+        DB.session.execute(
+            f"SELECT setval(pg_get_serial_sequence('{name}', 'id'), "
+            f"COALESCE((SELECT MAX(id) FROM {name}), 0) + 1, false)"
+        )
+    DB.session.commit()
+
+
+def add_fleet_arguments(parser, **defaults):
+    """ Add fleet size arguments to the command line parser.
+
+        Args:
+            parser(ArgumentParser): benchmark command line parser
+            defaults: default values of Fleet arguments, overriding
+                      Fleet defaults
+    """
+    fleet_defaults = dict(Fleet().__dict__, **defaults)
+    for name in (
+        "servers",
+        "ips_per_server",
+        "tags",
+        "tags_per_server",
+        "admins",
+        "admins_per_server",
+        "statuses",
+        "types",
+        "seed",
+    ):
+        parser.add_argument(
+            f"--{name.replace('_', '-')}", type=int, default=fleet_defaults[name]
+        )
+
+
+def fleet_from_arguments(args):
+    """ Create Fleet from parsed command line arguments.
+
+        Args:
+            args(Namespace): arguments added with add_fleet_arguments
+
+        Returns:
+            fleet(Fleet): sizes of the fleet
+    """
+    return Fleet(
+        servers=args.servers,
+        ips_per_server=args.ips_per_server,
+        tags=args.tags,
+        tags_per_server=args.tags_per_server,
+        admins=args.admins,
+        admins_per_server=args.admins_per_server,
+        statuses=args.statuses,
+        types=args.types,
+        seed=args.seed,
+    )
@@ -0,0 +1,262 @@
+""" Benchmark regression gate.
+
+    Runs the benchmark suite (see benchmarks.run) with the fleet and
+    repeat counts of the stored baseline, then compares every scenario
+    with the baseline: median wall time, number of SQL statements and
+    peak memory. Exits with status 1 and prints the differences when
+    any scenario regressed beyond the thresholds.
+
+    Usage:
+        python -m benchmarks.gate --update      (store new baseline)
+        python -m benchmarks.gate               (compare with baseline)
+        python -m benchmarks.gate --time-threshold 0.5 --scenario server.get
+"""
+import argparse
+import json
+import os
+import sys
+
+from app import create_app
+
+from benchmarks.fleet import Fleet
+from benchmarks.fleet import add_fleet_arguments
+from benchmarks.fleet import fleet_from_arguments
+from benchmarks.run import run_suite
+
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+
+class Metric:
+    """ Compared scenario metric, with its regression threshold."""
+
+    def __init__(self, name, threshold, min_delta=0):
+        """ Constructor for Metric.
+
+            Args:
+                name(str): name of the metric in scenario results
+                threshold(float): allowed relative growth, e.g. 0.2 for 20%
+                min_delta(float): growth smaller than this absolute value
+                                  is never a regression (measurement noise)
+        """
+        self.name = name
+        self.threshold = threshold
+        self.min_delta = min_delta
+
+    def is_regression(self, baseline, current):
+        """ Check if the current value regressed from the baseline value.
+
+            Returns:
+                regression(bool): True if value grew beyond the threshold
+        """
+        if baseline is None or current is None:
+            return False
+
+        delta = current - baseline
+        return delta > self.min_delta and delta > baseline * self.threshold
+
+
+def change(baseline, current):
+    """ Format relative change of the value. """
+    if baseline is None or current is None:
+        return "n/a"
+    if baseline == 0:
+        return "+inf%" if current else "+0.0%"
+    return f"{(current - baseline) / baseline * 100:+.1f}%"
+
+
+def compare(baseline, current, metrics):
+    """ Compare scenarios results with the baseline.
+
+        Args:
+            baseline(dict): baseline report
+            current(dict): current report
+            metrics(list): compared metrics (Metric objects)
+
+        Returns:
+            rows(list): tuples (scenario, metric, baseline value,
+                        current value, change, regression flag),
+                        for every compared metric of every scenario
+            missing(list): names of baseline scenarios not run now
+    """
+    rows = list()
+    baseline_scenarios = baseline["scenarios"]
+    for scenario, results in current["scenarios"].items():
+        if scenario not in baseline_scenarios:
+            continue
+
+        for metric in metrics:
+            old = baseline_scenarios[scenario].get(metric.name)
+            new = results.get(metric.name)
+            rows.append(
+                (
+                    scenario,
+                    metric.name,
+                    old,
+                    new,
+                    change(old, new),
+                    metric.is_regression(old, new),
+                )
+            )
+
+    missing = [name for name in baseline_scenarios if name not in current["scenarios"]]
+    return rows, missing
+
+
+def format_rows(rows):
+    """ Format comparison rows as text table. """
+    header = ("scenario", "metric", "baseline", "current", "change", "")
+    lines = [header] + [
+        (
+            scenario,
+            metric,
+            str(old),
+            str(new),
+            diff,
+            "REGRESSION" if regression else "",
+        )
+        for scenario, metric, old, new, diff, regression in rows
+    ]
+    widths = [max(len(line[column]) for line in lines) for column in range(5)]
+
+    text = list()
+    for line in lines:
+        cells = [line[0].ljust(widths[0]), line[1].ljust(widths[1])]
+        cells += [line[column].rjust(widths[column]) for column in range(2, 5)]
+        text.append("  ".join(cells + [line[5]]).rstrip())
+    return "\n".join(text)
+
+
+def load_baseline(path):
+    """ Load baseline report from the file.
+
+        Returns:
+            baseline(dict): baseline report, None if file does not exist
+    """
+    if not os.path.exists(path):
+        return None
+    with open(path, "r") as baseline_file:
+        return json.load(baseline_file)
+
+
+def save_baseline(path, report):
+    """ Save report to the file, e.g. as the baseline. """
+    with open(path, "w") as baseline_file:
+        baseline_file.write(json.dumps(report, indent=4) + "\n")
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--uri", default="sqlite:////tmp/smt_bench.db")
+    parser.add_argument("--baseline", default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--update",
+        action="store_true",
+        help="run the suite and store results as the new baseline",
+    )
+    parser.add_argument(
+        "--time-threshold",
+        type=float,
+        default=0.3,
+        help="allowed relative growth of median wall time",
+    )
+    parser.add_argument(
+        "--min-time-delta",
+        type=float,
+        default=0.5,
+        help="wall time growth (ms) always treated as noise",
+    )
+    parser.add_argument(
+        "--statements-threshold",
+        type=float,
+        default=0.0,
+        help="allowed relative growth of SQL statements count",
+    )
+    parser.add_argument(
+        "--memory-threshold",
+        type=float,
+        default=0.25,
+        help="allowed relative growth of peak memory",
+    )
+    parser.add_argument(
+        "--min-memory-delta",
+        type=float,
+        default=16.0,
+        help="peak memory growth (KiB) always treated as noise",
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        help="run only scenarios which names start with given prefix",
+    )
+    parser.add_argument("--output", help="write JSON report of this run to the file")
+    add_fleet_arguments(parser)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--warmup", type=int, default=2)
+    parser.add_argument("--memory-repeat", type=int, default=3)
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    create_app(SQLALCHEMY_DATABASE_URI=args.uri).app_context().push()
+
+    if args.update:
+        report = run_suite(
+            fleet_from_arguments(args),
+            args.repeat,
+            args.warmup,
+            args.memory_repeat,
+            args.scenario,
+        )
+        save_baseline(args.baseline, report)
+        print(
+            f"Baseline of {len(report['scenarios'])} scenarios saved: {args.baseline}"
+        )
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print(f"No baseline: {args.baseline}. Store it with --update first.")
+        return 1
+
+    report = run_suite(
+        Fleet.from_dict(baseline["fleet"]),
+        baseline["repeat"],
+        baseline["warmup"],
+        baseline["memory_repeat"],
+        args.scenario,
+    )
+    if args.output:
+        save_baseline(args.output, report)
+
+    if report["database"] != baseline["database"]:
+        print(
+            f"Baseline was stored for {baseline['database']} database, "
+            f"not {report['database']}."
+        )
+        return 1
+
+    metrics = [
+        Metric("median_ms", args.time_threshold, args.min_time_delta),
+        Metric("statements", args.statements_threshold),
+        Metric("peak_kib", args.memory_threshold, args.min_memory_delta),
+    ]
+    rows, missing = compare(baseline, report, metrics)
+    regressions = [row for row in rows if row[5]]
+
+    print(format_rows(rows))
+    for name in missing if not args.scenario else list():
+        print(f"Scenario {name} from the baseline was not run.")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond thresholds:")
+        print(format_rows(regressions))
+        return 1
+
+    print(f"\nNo regressions in {len(report['scenarios'])} scenarios.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+""" Import time (cold start) benchmark.
+
+    Runs every target in a new Python process with -X importtime, given
+    number of times, and reports median wall time of the process, median
+    time spent on imports, number of imported modules and the heaviest
+    top level imports. Targets importing modules they should not (e.g.
+    models importing Flask-Migrate) are reported as failed, as well as
+    targets slower than their budget.
+
+    Usage:
+        python -m benchmarks.import_time
+        python -m benchmarks.import_time --target cli --budget cli=500
+"""
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+
+class Target:
+    """ Measured cold start: Python code run in a new process."""
+
+    def __init__(self, name, code, forbidden=()):
+        """ Constructor for Target.
+
+            Args:
+                name(str): name of the target
+                code(str): Python code run in the process
+                forbidden(tuple): top level packages the code must not import
+        """
+        self.name = name
+        self.code = code
+        self.forbidden = forbidden
+
+
+OPERATIONS = ", ".join(
+    f"app.db.operations.basic.{name}"
+    for name in ("admin", "ip", "server", "server_status", "server_type", "tag")
+)
+
+WORKER = f"import {OPERATIONS}\nfrom app import create_app\ncreate_app()"
+
+TARGETS = [
+    Target("exceptions", "import app.db.exceptions", ("flask", "sqlalchemy")),
+    Target("operations", f"import {OPERATIONS}", ("flask_migrate", "alembic")),
+    Target("cli", "import flask.cli, app.run"),
+    Target("worker", WORKER),
+]
+
+
+def parse_importtime(output):
+    """ Parse -X importtime report.
+
+        Args:
+            output(str): stderr of the process
+
+        Returns:
+            imports(dict): top level imported modules, mapped to their
+                           cumulative import time in microseconds
+            modules(list): names of all imported modules
+    """
+    imports = dict()
+    modules = list()
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "imported package" in line:
+            continue
+
+        _, cumulative, name = line[len("import time:") :].split("|")
+        modules.append(name.strip())
+        if not name.startswith("  "):
+            imports[name.strip()] = int(cumulative)
+    return imports, modules
+
+
+def run_target(target):
+    """ Run the target once.
+
+        Returns:
+            wall_ms(float): wall time of the process in milliseconds
+            imports(dict): top level imports with cumulative time (us)
+            modules(list): names of imported modules
+    """
+    start = time.perf_counter()
+    process = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", target.code],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+    wall_ms = (time.perf_counter() - start) * 1000
+    imports, modules = parse_importtime(process.stderr)
+    return wall_ms, imports, modules
+
+
+def measure(target, repeat, top):
+    """ Measure cold start of the target.
+
+        Args:
+            target(Target): measured target
+            repeat(int): number of measured runs
+            top(int): number of the heaviest top level imports to report
+
+        Returns:
+            result(dict): median wall and import times in milliseconds,
+                          number of modules, heaviest imports
+                          and imported forbidden packages
+    """
+    run_target(target)  # compiles bytecode of changed modules
+
+    walls = list()
+    import_times = list()
+    for _ in range(repeat):
+        wall_ms, imports, modules = run_target(target)
+        walls.append(wall_ms)
+        import_times.append(sum(imports.values()) / 1000)
+
+    heaviest = sorted(imports.items(), key=lambda item: item[1], reverse=True)
+    forbidden = sorted(
+        {
+            name.split(".")[0]
+            for name in modules
+            if name.split(".")[0] in target.forbidden
+        }
+    )
+    return {
+        "wall_ms": round(statistics.median(walls), 1),
+        "import_ms": round(statistics.median(import_times), 1),
+        "modules": len(modules),
+        "heaviest_ms": {name: round(us / 1000, 1) for name, us in heaviest[:top]},
+        "forbidden": forbidden,
+    }
+
+
+def parse_budget(value):
+    name, _, budget = value.partition("=")
+    return name, float(budget)
+
+
+def parse_args(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--top", type=int, default=5)
+    parser.add_argument(
+        "--target",
+        action="append",
+        choices=[target.name for target in TARGETS],
+        help="measure only given targets",
+    )
+    parser.add_argument(
+        "--budget",
+        action="append",
+        type=parse_budget,
+        default=list(),
+        help="maximum median wall time of the target in ms, e.g. cli=500",
+    )
+    parser.add_argument("--output", help="write JSON report to the file")
+    return parser.parse_args(args)
+
+
+def main():
+    args = parse_args()
+    budgets = dict(args.budget)
+
+    results = dict()
+    failures = list()
+    for target in TARGETS:
+        if args.target and target.name not in args.target:
+            continue
+
+        result = measure(target, args.repeat, args.top)
+        results[target.name] = result
+
+        if result["forbidden"]:
+            failures.append(f"{target.name} imports {', '.join(result['forbidden'])}")
+        if target.name in budgets and result["wall_ms"] > budgets[target.name]:
+            failures.append(
+                f"{target.name} takes {result['wall_ms']} ms, "
+                f"budget is {budgets[target.name]} ms"
+            )
+
+    output = json.dumps({"repeat": args.repeat, "targets": results}, indent=4)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+    else:
+        sys.stdout.write(output + "\n")
+
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,178 @@
+""" Benchmark scenarios of the basic Op layer.
+
+    Every scenario is one Op call with random arguments, drawn from
+    the synthetic fleet. Setup of the scenario (e.g. loading Server
+    object to update) is not measured.
+"""
+import random
+
+from app.db.operations.basic.admin import AdminOp
+from app.db.operations.basic.ip import IpOp
+from app.db.operations.basic.server import ServerOp
+from app.db.operations.basic.server_status import ServerStatusOp
+from app.db.operations.basic.server_type import ServerTypeOp
+from app.db.operations.basic.tag import TagOp
+
+
+class Scenario:
+    """ Measured operation with its unmeasured setup."""
+
+    def __init__(self, name, run, setup=None):
+        """ Constructor for Scenario.
+
+            Args:
+                name(str): scenario name, e.g. server.get.tags
+                run(callable): measured operation, called with
+                               arguments returned by setup
+                setup(callable): function returning tuple of run arguments,
+                                 None if run takes no arguments
+        """
+        self.name = name
+        self.run = run
+        self.setup = setup
+
+    def prepare(self):
+        """ Run setup of the scenario.
+
+            Returns:
+                args(tuple): arguments of run
+        """
+        if self.setup is None:
+            return tuple()
+        return self.setup()
+
+
+class FleetScenarios:
+    """ Scenarios drawing random arguments from the synthetic fleet."""
+
+    def __init__(self, fleet, seed=1):
+        """ Constructor for FleetScenarios.
+
+            Args:
+                fleet(Fleet): sizes of the fleet in the database
+                seed(int): seed of random arguments
+        """
+        self.fleet = fleet
+        self.rand = random.Random(seed)
+        self.added = 0
+
+    def server_number(self):
+        return self.rand.randint(1, self.fleet.servers)
+
+    def tag_names(self, count):
+        numbers = self.rand.sample(range(1, self.fleet.tags + 1), count)
+        return [self.fleet.tag_name(number) for number in numbers]
+
+    def admin_name(self):
+        return self.fleet.admin_name(self.rand.randint(1, self.fleet.admins))
+
+    def status_name(self):
+        return self.fleet.status_name(self.rand.randint(1, self.fleet.statuses))
+
+    def type_name(self):
+        return self.fleet.type_name(self.rand.randint(1, self.fleet.types))
+
+    def address(self):
+        return self.fleet.address(self.rand.randint(1, self.fleet.ips))
+
+    def network(self):
+        """ Random /24 network of the fleet addresses."""
+        address = self.fleet.address(self.rand.randint(1, self.fleet.ips))
+        return address.rsplit(".", 1)[0] + ".0/24"
+
+    def new_server(self):
+        """ Arguments of ServerOp.add for new server with unique name."""
+        self.added += 1
+        return (
+            f"bench{self.added}",
+            self.status_name(),
+            self.type_name(),
+            None,
+            [self.address()],
+            self.tag_names(min(2, self.fleet.tags)),
+            [self.admin_name()],
+        )
+
+    def existing_server(self):
+        """ Server object of random server."""
+        return ServerOp.get(id=self.server_number())[0]
+
+    def server_get(self):
+        """ ServerOp.get scenario for every filter."""
+        return [
+            Scenario("server.get.id", lambda: ServerOp.get(id=self.server_number())),
+            Scenario(
+                "server.get.name",
+                lambda: ServerOp.get(name=self.fleet.server_name(self.server_number())),
+            ),
+            Scenario(
+                "server.get.srv_status",
+                lambda: ServerOp.get(srv_status=self.status_name()),
+            ),
+            Scenario(
+                "server.get.srv_type", lambda: ServerOp.get(srv_type=self.type_name())
+            ),
+            Scenario("server.get.ip", lambda: ServerOp.get(ip=self.address())),
+            Scenario("server.get.tags", lambda: ServerOp.get(tags=self.tag_names(1))),
+            Scenario(
+                "server.get.admins", lambda: ServerOp.get(admins=[self.admin_name()])
+            ),
+            Scenario(
+                "server.get.network", lambda: ServerOp.get(network=self.network())
+            ),
+        ]
+
+    def server_changes(self):
+        """ ServerOp.add, update and delete scenarios."""
+        return [
+            Scenario("server.add", ServerOp.add, lambda: self.new_server()),
+            Scenario(
+                "server.update",
+                lambda server_obj, tags: ServerOp.update(
+                    server_obj, description="updated", tags=tags
+                ),
+                lambda: (self.existing_server(), self.tag_names(1)),
+            ),
+            Scenario(
+                "server.delete",
+                ServerOp.delete,
+                lambda: (ServerOp.add(*self.new_server()),),
+            ),
+        ]
+
+    def op_get(self):
+        """ get scenario of every other Op, by id and by name."""
+        fleet = self.fleet
+        return [
+            Scenario(
+                "admin.get.id",
+                lambda: AdminOp.get(id=self.rand.randint(1, fleet.admins)),
+            ),
+            Scenario("admin.get.name", lambda: AdminOp.get(name=self.admin_name())),
+            Scenario("ip.get.id", lambda: IpOp.get(id=self.rand.randint(1, fleet.ips))),
+            Scenario("ip.get.address", lambda: IpOp.get(address=self.address())),
+            Scenario("ip.get_in_network", lambda: IpOp.get_in_network(self.network())),
+            Scenario(
+                "tag.get.id", lambda: TagOp.get(id=self.rand.randint(1, fleet.tags))
+            ),
+            Scenario("tag.get.name", lambda: TagOp.get(name=self.tag_names(1)[0])),
+            Scenario(
+                "server_status.get.id",
+                lambda: ServerStatusOp.get(id=self.rand.randint(1, fleet.statuses)),
+            ),
+            Scenario(
+                "server_status.get.name",
+                lambda: ServerStatusOp.get(name=self.status_name()),
+            ),
+            Scenario(
+                "server_type.get.id",
+                lambda: ServerTypeOp.get(id=self.rand.randint(1, fleet.types)),
+            ),
+            Scenario(
+                "server_type.get.name", lambda: ServerTypeOp.get(name=self.type_name())
+            ),
+        ]
+
+    def all(self):
+        """ All scenarios, read-only ones first."""
+        return self.op_get() + self.server_get() + self.server_changes()
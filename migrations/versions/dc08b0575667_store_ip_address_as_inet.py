@@ -0,0 +1,82 @@
+"""store ip address as inet
+
+Revision ID: dc08b0575667
+Revises: 12a99e5072ba
+Create Date: 2026-10-18 02:49:45.478815
+
+"""
+import ipaddress
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = 'dc08b0575667'
+down_revision = '12a99e5072ba'
+branch_labels = None
+depends_on = None
+
+
+ip_table = sa.table(
+    "ip",
+    sa.column("id", sa.Integer),
+    sa.column("address"),
+    sa.column("address_new"),
+)
+
+
+def pack(address):
+    """ Pack address like app.db.types.IpAddressType does."""
+    address = ipaddress.ip_address(address)
+    return bytes([address.version]) + address.packed
+
+
+def unpack(packed):
+    """ Unpack address packed with pack function."""
+    return str(ipaddress.ip_address(bytes(packed[1:])))
+
+
+def convert_column(new_type, convert):
+    """ Replace ip.address column with column of new type,
+        converting every value in Python.
+    """
+    bind = op.get_bind()
+    op.add_column("ip", sa.Column("address_new", new_type, nullable=True))
+    rows = bind.execute(sa.select([ip_table.c.id, ip_table.c.address])).fetchall()
+    for row_id, address in rows:
+        bind.execute(
+            ip_table.update()
+            .where(ip_table.c.id == row_id)
+            .values(address_new=convert(address))
+        )
+
+    op.drop_index("ix_ip_address", table_name="ip")
+    with op.batch_alter_table("ip") as batch_op:
+        batch_op.drop_column("address")
+        batch_op.alter_column(
+            "address_new", new_column_name="address", nullable=False
+        )
+    op.create_index("ix_ip_address", "ip", ["address"], unique=True)
+
+
+def upgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "ip",
+            "address",
+            type_=postgresql.INET(),
+            postgresql_using="address::inet",
+        )
+    else:
+        convert_column(sa.LargeBinary(17), pack)
+
+
+def downgrade():
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "ip", "address", type_=sa.String(), postgresql_using="host(address)"
+        )
+    else:
+        convert_column(sa.String(), unpack)
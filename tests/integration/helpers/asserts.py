@@ -1,3 +1,8 @@
+from contextlib import contextmanager
+
+from app.db.statements import StatementCounter
+
+
 class Asserts:
     """ I don't like Python native assert keyword, so this class mimics
         asserts from unittest library.
@@ -50,3 +55,22 @@ class Asserts:
                 f"Element: {item if not quiet else '<hidden>'} exist "
                 f"in structure: {structure if not quiet else '<hidden>'}."
             )
+
+    @contextmanager
+    def assertQueryCount(self, max_n, quiet=False):
+        """ Checks if code run inside the context executes
+            at most max_n SQL statements.
+
+            Usage:
+                with self.assertQueryCount(2):
+                    ServerOp.get(tags=["tag"])
+        """
+        with StatementCounter() as counter:
+            yield counter
+
+        if counter.count > max_n:
+            statements = "\n".join(counter.statements) if not quiet else "<hidden>"
+            raise AssertionError(
+                f"{counter.count} SQL statements executed, "
+                f"expected at most {max_n}:\n{statements}"
+            )
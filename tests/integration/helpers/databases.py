@@ -0,0 +1,149 @@
+""" Databases of integration tests run in parallel.
+
+    With pytest-xdist (pytest -n auto) every worker uses separate
+    database. On PostgreSQL the worker database is cloned from template
+    database with the schema, created once by the controlling process.
+    SQLite file database gets separate file per worker, and in-memory
+    SQLite database (sqlite://) is separate in every process anyway.
+"""
+import os
+
+from sqlalchemy import create_engine
+from sqlalchemy.engine.url import make_url
+
+from app.extensions import DB
+from app.db.versions import init_versions
+
+
+MEMORY_URI = "sqlite://"
+TEMPLATE_SUFFIX = "template"
+
+
+def is_sqlite(url):
+    return url.drivername.startswith("sqlite")
+
+
+def is_memory(url):
+    """ Check if the URL points to in-memory SQLite database."""
+    return is_sqlite(url) and url.database in (None, "", ":memory:")
+
+
+def database_url(uri, suffix):
+    """ Get URL of the database named after the given one, with suffix.
+
+        Args:
+            uri(str): URI of the tests database
+            suffix(str): suffix of the new database name, e.g. worker ID
+
+        Returns:
+            url(URL): URL of the new database
+    """
+    url = make_url(uri)
+    if is_memory(url):
+        return url
+
+    if is_sqlite(url):
+        root, extension = os.path.splitext(url.database)
+        url.database = f"{root}_{suffix}{extension}"
+    else:
+        url.database = f"{url.database}_{suffix}"
+    return url
+
+
+def server_engine(url):
+    """ Engine connected to the maintenance database of PostgreSQL server,
+        in autocommit mode (databases can not be created in transaction).
+    """
+    server_url = make_url(str(url))
+    server_url.database = "postgres"
+    return create_engine(server_url, isolation_level="AUTOCOMMIT")
+
+
+def create_database(url, template=None):
+    """ Create (or recreate) PostgreSQL database.
+
+        Args:
+            url(URL): URL of the created database
+            template(str): name of the database to clone, empty by default
+    """
+    engine = server_engine(url)
+    try:
+        engine.execute(f'DROP DATABASE IF EXISTS "{url.database}"')
+        clone = f' TEMPLATE "{template}"' if template else ""
+        engine.execute(f'CREATE DATABASE "{url.database}"{clone}')
+    finally:
+        engine.dispose()
+
+
+def drop_database(url):
+    """ Drop PostgreSQL database, if it exists."""
+    engine = server_engine(url)
+    try:
+        engine.execute(f'DROP DATABASE IF EXISTS "{url.database}"')
+    finally:
+        engine.dispose()
+
+
+def uses_template(uri):
+    """ Check if workers databases are cloned from template database
+        (PostgreSQL only - SQLite databases are simply created by workers).
+    """
+    return make_url(uri).drivername.startswith("postgresql")
+
+
+def create_template(uri):
+    """ Create template database with the schema, cloned by workers.
+
+        Args:
+            uri(str): URI of the tests database
+    """
+    url = database_url(uri, TEMPLATE_SUFFIX)
+    create_database(url)
+
+    engine = create_engine(url)
+    try:
+        DB.metadata.create_all(engine)
+        init_versions(engine)
+    finally:
+        engine.dispose()
+
+
+def drop_template(uri):
+    drop_database(database_url(uri, TEMPLATE_SUFFIX))
+
+
+def create_worker_database(uri, worker):
+    """ Create database of the worker.
+
+        Args:
+            uri(str): URI of the tests database
+            worker(str): worker ID, e.g. gw0
+
+        Returns:
+            uri(str): URI of the worker database
+            schema(bool): True if database already has the schema
+    """
+    url = database_url(uri, worker)
+    if not uses_template(uri):
+        return str(url), False
+
+    template = database_url(uri, TEMPLATE_SUFFIX).database
+    create_database(url, template=template)
+    return str(url), True
+
+
+def drop_worker_database(uri, worker):
+    """ Drop database of the worker, after tests.
+
+        Args:
+            uri(str): URI of the tests database
+            worker(str): worker ID, e.g. gw0
+    """
+    DB.session.remove()
+    DB.engine.dispose()
+
+    url = database_url(uri, worker)
+    if uses_template(uri):
+        drop_database(url)
+    elif is_sqlite(url) and not is_memory(url) and os.path.exists(url.database):
+        os.remove(url.database)
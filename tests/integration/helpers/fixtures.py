@@ -1,6 +1,13 @@
+from flask import current_app
 from pytest import fixture
+from sqlalchemy import event
+from sqlalchemy.orm import scoped_session
 
-from app import DB
+from app.extensions import DB
+from app.db.statements import StatementCounter
+from app.db.versions import init_versions
+from app.db.operations.basic.server_status import ServerStatusOp
+from app.db.operations.basic.server_type import ServerTypeOp
 
 
 @fixture
@@ -11,6 +18,9 @@ def refresh_db_before():
     DB.session.remove()
     DB.drop_all()
     DB.create_all()
+    init_versions()
+    ServerStatusOp.CACHE.invalidate()
+    ServerTypeOp.CACHE.invalidate()
     yield refresh_db_before
 
 
@@ -23,3 +33,157 @@ def refresh_db_after():
     DB.session.remove()
     DB.drop_all()
     DB.create_all()
+    init_versions()
+    ServerStatusOp.CACHE.invalidate()
+    ServerTypeOp.CACHE.invalidate()
+
+
+@fixture
+def statement_counter():
+    """ Count SQL statements executed during test case run.
+        Use after refresh fixtures, so their statements are not counted.
+    """
+    with StatementCounter() as counter:
+        yield counter
+
+
+@fixture
+def api_client():
+    """ Test client of the application, requests use session
+        of the test case (use after rollback_db fixture).
+    """
+    yield current_app.test_client()
+
+
+SCHEMA = {"created": False}
+
+
+def sqlite_connect(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+
+def sqlite_begin(connection):
+    connection.execute("BEGIN")
+
+
+def use_sqlite_savepoints(engine):
+    """ Make pysqlite driver begin transactions explicitly, so savepoints
+        work as in other databases (by default the driver begins
+        transaction with first data change, so SAVEPOINT statement
+        run before it starts own transaction, committed on release).
+    """
+    if not event.contains(engine, "begin", sqlite_begin):
+        event.listen(engine, "connect", sqlite_connect)
+        event.listen(engine, "begin", sqlite_begin)
+        engine.dispose()
+
+
+def create_schema_once():
+    """ Drop and create all tables in database,
+        once per tests session.
+    """
+    if SCHEMA["created"]:
+        return
+
+    if DB.engine.dialect.name == "sqlite":
+        use_sqlite_savepoints(DB.engine)
+
+    DB.session.remove()
+    DB.drop_all()
+    DB.create_all()
+    init_versions()
+    SCHEMA["created"] = True
+
+
+def invalidate_caches():
+    """ Invalidate caches of lookup tables rows."""
+    ServerStatusOp.CACHE.invalidate()
+    ServerTypeOp.CACHE.invalidate()
+
+
+def reset_sequences(connection):
+    """ Restart PostgreSQL sequences of all tables, so IDs of new rows
+        start from 1 again (sequences are not rolled back
+        with transaction). Other databases reuse IDs of deleted rows.
+    """
+    if connection.dialect.name != "postgresql":
+        return
+
+    for table in DB.metadata.sorted_tables:
+        if "id" in table.c and table.c.id.autoincrement:
+            connection.execute(
+                f"SELECT setval(pg_get_serial_sequence('{table.name}', 'id'), "
+                f"1, false)"
+            )
+
+
+def truncate_tables():
+    """ Delete all rows from all tables and reset sequences."""
+    DB.session.remove()
+    tables = DB.metadata.sorted_tables
+    with DB.engine.begin() as connection:
+        if connection.dialect.name == "postgresql":
+            names = ", ".join(table.name for table in tables)
+            connection.execute(f"TRUNCATE TABLE {names} RESTART IDENTITY CASCADE")
+        else:
+            for table in reversed(tables):
+                connection.execute(table.delete())
+    init_versions()
+    invalidate_caches()
+
+
+@fixture
+def rollback_db():
+    """ Run test case in transaction rolled back after the case.
+        Schema is created once per tests session. Session used by
+        operations is bound to connection with outer transaction,
+        and works inside savepoint, restarted after every commit
+        or rollback done by operations - so nothing is committed.
+    """
+    create_schema_once()
+
+    connection = DB.engine.connect()
+    outer_transaction = connection.begin()
+    reset_sequences(connection)
+
+    session_factory = DB.create_session(
+        {"bind": connection, "binds": dict(), "query_cls": DB.Query}
+    )
+
+    def create_session():
+        session = session_factory()
+        session.begin_nested()
+        return session
+
+    def restart_savepoint(session, transaction):
+        if transaction.nested and not transaction._parent.nested:
+            session.expire_all()
+            session.begin_nested()
+
+    event.listen(session_factory, "after_transaction_end", restart_savepoint)
+
+    app_session = DB.session
+    DB.session = scoped_session(create_session)
+    invalidate_caches()
+    try:
+        yield rollback_db
+    finally:
+        event.remove(session_factory, "after_transaction_end", restart_savepoint)
+        DB.session.rollback()
+        DB.session.remove()
+        DB.session = app_session
+        outer_transaction.rollback()
+        connection.close()
+        invalidate_caches()
+
+
+@fixture
+def truncate_db():
+    """ Delete all rows from all tables before and after test case.
+        Schema is created once per tests session. For test cases which
+        must really commit, e.g. checking data from other connections.
+    """
+    create_schema_once()
+    truncate_tables()
+    yield truncate_db
+    truncate_tables()
@@ -0,0 +1,256 @@
+import gzip
+import json
+
+from pytest import mark
+
+from tests.integration.helpers.asserts import Asserts
+from tests.integration.helpers.fixtures import api_client
+from tests.integration.helpers.fixtures import rollback_db
+from tests.integration.helpers.fixtures import statement_counter
+
+from app.encoding import decode_msgpack
+from app.db.operations.basic.ip import IpOp
+from app.db.operations.basic.tag import TagOp
+from app.db.operations.basic.server import ServerOp
+from app.db.operations.basic.server_type import ServerTypeOp
+from app.db.operations.basic.server_status import ServerStatusOp
+
+
+def read_ndjson(response):
+    return [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+
+
+@mark.db_operations
+@mark.api
+class TestServersApi(Asserts):
+    """ Integration tests for /servers endpoint."""
+
+    def case_servers(self, rollback_db, api_client):
+        """ Stream all server rows as NDJSON."""
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        TagOp.add("web")
+        IpOp.add("10.0.0.1")
+        ServerOp.add("ServerOne", "Status", "Type", tags=["web"])
+        ServerOp.add("ServerTwo", "Status", "Type", description="Two", ips=["10.0.0.1"])
+
+        response = api_client.get("/servers")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, "application/x-ndjson")
+        self.assertEqual(response.headers["Vary"], "Accept, Accept-Encoding")
+        self.assertEqual(
+            read_ndjson(response),
+            [
+                {
+                    "id": 1,
+                    "name": "ServerOne",
+                    "description": None,
+                    "status": "Status",
+                    "type": "Type",
+                    "ips": [],
+                    "tags": ["web"],
+                    "admins": [],
+                },
+                {
+                    "id": 2,
+                    "name": "ServerTwo",
+                    "description": "Two",
+                    "status": "Status",
+                    "type": "Type",
+                    "ips": ["10.0.0.1"],
+                    "tags": [],
+                    "admins": [],
+                },
+            ],
+        )
+
+    def case_servers_encodings(self, rollback_db, api_client):
+        """ Stream server rows as msgpack, compressed."""
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        TagOp.add("web")
+        for number in range(20):
+            ServerOp.add(f"Server{number}", "Status", "Type", tags=["web"])
+
+        response = api_client.get("/servers", headers={"Accept-Encoding": "gzip"})
+        self.assertEqual(response.content_encoding, "gzip")
+        self.assertTrue(response.is_streamed)
+        ndjson = gzip.decompress(response.get_data())
+        self.assertEqual(len(ndjson.splitlines()), 20)
+
+        response = api_client.get("/servers", headers={"Accept": "application/msgpack"})
+        self.assertEqual(response.mimetype, "application/msgpack")
+        self.assertEqual(response.content_encoding, None)
+        records = decode_msgpack(response.get_data(), ("status", "type", "tags"))
+        self.assertEqual(records, [json.loads(line) for line in ndjson.splitlines()])
+        self.assertTrue(len(response.get_data()) < len(ndjson) / 2)
+
+    def case_servers_filters(self, rollback_db, api_client):
+        """ Stream server rows filtered by query string."""
+        ServerStatusOp.add("StatusOne")
+        ServerStatusOp.add("StatusTwo")
+        ServerTypeOp.add("Type")
+        TagOp.add("web")
+        TagOp.add("db")
+        IpOp.add("10.0.0.1")
+        ServerOp.add("ServerOne", "StatusOne", "Type", tags=["web", "db"])
+        ServerOp.add("ServerTwo", "StatusTwo", "Type", ips=["10.0.0.1"], tags=["db"])
+
+        def names(query_string):
+            response = api_client.get(f"/servers?{query_string}")
+            return [row["name"] for row in read_ndjson(response)]
+
+        self.assertEqual(names("id=2"), ["ServerTwo"])
+        self.assertEqual(names("name=ServerOne"), ["ServerOne"])
+        self.assertEqual(names("status=StatusTwo"), ["ServerTwo"])
+        self.assertEqual(names("type=Type"), ["ServerOne", "ServerTwo"])
+        self.assertEqual(names("ip=10.0.0.1"), ["ServerTwo"])
+        self.assertEqual(names("network=10.0.0.0/8"), ["ServerTwo"])
+        self.assertEqual(names("tags=db"), ["ServerOne", "ServerTwo"])
+        self.assertEqual(names("tags=web,db"), ["ServerOne"])
+        self.assertEqual(names("tags=web&tags=db"), ["ServerOne"])
+        self.assertEqual(names("name=ServerThree"), [])
+        self.assertEqual(names("id=0"), [])
+
+    def case_servers_not_valid(self, rollback_db, api_client):
+        """ Try to stream server rows with not valid filters."""
+        response = api_client.get("/servers?id=first")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "ServerIdNotValidError")
+
+        response = api_client.get("/servers?tags=web")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "ServerTagNotFoundError")
+
+    def case_servers_fields(self, rollback_db, api_client):
+        """ Stream server rows with chosen fields only."""
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        TagOp.add("web")
+        ServerOp.add("ServerOne", "Status", "Type", tags=["web"])
+        ServerOp.add("ServerTwo", "Status", "Type")
+
+        with self.assertQueryCount(2) as counter:
+            response = api_client.get("/servers?fields=id,name,status")
+            rows = read_ndjson(response)
+        self.assertEqual(
+            rows,
+            [
+                {"id": 1, "name": "ServerOne", "status": "Status"},
+                {"id": 2, "name": "ServerTwo", "status": "Status"},
+            ],
+        )
+        # change versions, then chosen columns only,
+        # without type join and collections queries
+        statement = counter.statements[-1]
+        self.assertNotIn("server_type", statement)
+        self.assertNotIn("description", statement)
+
+        response = api_client.get("/servers?fields=name&fields=tags")
+        self.assertEqual(
+            read_ndjson(response),
+            [{"name": "ServerOne", "tags": ["web"]}, {"name": "ServerTwo", "tags": []}],
+        )
+
+        response = api_client.get(
+            "/servers?fields=name,tags", headers={"Accept": "application/msgpack"}
+        )
+        records = decode_msgpack(response.get_data(), ("tags",))
+        self.assertEqual(records[0], {"name": "ServerOne", "tags": ["web"]})
+
+        response = api_client.get("/servers?fields=id,rack")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "ServerFieldsNotValidError")
+
+    def case_server_row(self, rollback_db, api_client):
+        """ Get one server row with chosen fields."""
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        IpOp.add("10.0.0.1")
+        ServerOp.add("ServerOne", "Status", "Type", ips=["10.0.0.1"])
+
+        response = api_client.get("/servers/1?fields=name,ips")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response.get_json(), {"name": "ServerOne", "ips": ["10.0.0.1"]}
+        )
+        self.assertIn("ETag", response.headers)
+
+        response = api_client.get("/servers/1")
+        self.assertEqual(response.get_json()["type"], "Type")
+        self.assertEqual(response.get_json()["admins"], [])
+
+        response = api_client.get("/servers/1?fields=")
+        self.assertEqual(response.get_json()["name"], "ServerOne")
+        self.assertEqual(response.get_json()["admins"], [])
+
+        for server_id in (0, 2):
+            response = api_client.get(f"/servers/{server_id}")
+            self.assertEqual(response.status_code, 404)
+            self.assertEqual(response.get_json()["error"], "ServerNotFoundError")
+
+    def case_servers_conditional(self, rollback_db, api_client, statement_counter):
+        """ Answer conditional requests with 304 until servers change."""
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        TagOp.add("web")
+        srv = ServerOp.add("ServerOne", "Status", "Type", tags=["web"])
+
+        response = api_client.get("/servers")
+        etag = response.headers["ETag"]
+        last_modified = response.headers["Last-Modified"]
+        self.assertTrue(etag.startswith('W/"'))
+        self.assertEqual(response.headers["Cache-Control"], "no-cache")
+
+        statement_counter.reset()
+        response = api_client.get("/servers", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.headers["ETag"], etag)
+        self.assertEqual(response.get_data(), b"")
+        # only change versions are read
+        self.assertEqual(statement_counter.count, 1)
+        self.assertIn("change_version", statement_counter.statements[0])
+        self.assertEqual(response.headers["Vary"], "Accept, Accept-Encoding")
+
+        # every representation has own tag
+        for headers in ({"Accept": "application/msgpack"}, {"Accept-Encoding": "gzip"}):
+            response = api_client.get(
+                "/servers", headers=dict(headers, **{"If-None-Match": etag})
+            )
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response.headers["ETag"], etag)
+
+        response = api_client.get(
+            "/servers", headers={"If-Modified-Since": last_modified}
+        )
+        self.assertEqual(response.status_code, 304)
+
+        TagOp.update(TagOp.get(name="web")[0], "www")
+        response = api_client.get("/servers", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(read_ndjson(response)[0]["tags"], ["www"])
+        self.assertNotEqual(response.headers["ETag"], etag)
+
+        etag = response.headers["ETag"]
+        ServerOp.update(srv, name="ServerTwo")
+        response = api_client.get("/servers", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+
+    def case_server_type_conditional(self, rollback_db, api_client):
+        """ Answer conditional request for server type."""
+        type_obj = ServerTypeOp.add("Type")
+
+        response = api_client.get("/server_type")
+        self.assertEqual(response.get_data(as_text=True), "Type")
+        etag = response.headers["ETag"]
+
+        response = api_client.get("/server_type", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        ServerStatusOp.add("Status")
+        response = api_client.get("/server_type", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+
+        ServerTypeOp.update(type_obj, "Other")
+        response = api_client.get("/server_type", headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
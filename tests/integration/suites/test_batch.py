@@ -0,0 +1,209 @@
+from unittest import mock
+
+from pytest import mark
+from sqlalchemy.exc import OperationalError
+
+from tests.integration.helpers.asserts import Asserts
+from tests.integration.helpers.fixtures import api_client
+from tests.integration.helpers.fixtures import rollback_db
+
+from app.extensions import DB
+from app.db.operations.batch import BatchOp
+from app.db.operations.basic.tag import TagOp
+from app.db.operations.basic.server import ServerOp
+from app.db.operations.basic.server_status import ServerStatusOp
+
+from app.db.exceptions import BatchModeNotValidError
+from app.db.exceptions import BatchOperationNotValidError
+
+
+PROVISIONING = [
+    {"model": "server_status", "action": "add", "params": {"name": "Active"}},
+    {"model": "server_type", "action": "add", "params": {"name": "Physical"}},
+    {"model": "tag", "action": "add", "params": {"name": "web"}},
+    {"model": "ip", "action": "add", "params": {"address": "10.0.0.1"}},
+    {
+        "model": "server",
+        "action": "add",
+        "params": {
+            "name": "web01",
+            "srv_status": "Active",
+            "srv_type": "Physical",
+            "ips": ["10.0.0.1"],
+            "tags": ["web"],
+        },
+    },
+]
+
+
+@mark.db_operations
+@mark.batch
+class TestBatchOp(Asserts):
+    """ Integration tests for BatchOp class."""
+
+    def case_atomic(self, rollback_db):
+        """ Run operations in one transaction."""
+        batch = BatchOp.run(
+            PROVISIONING
+            + [
+                {
+                    "model": "tag",
+                    "action": "update",
+                    "id": 1,
+                    "params": {"name": "www"},
+                },
+                {"model": "ip", "action": "delete", "id": 1},
+            ]
+        )
+
+        self.assertEqual(batch["committed"], True)
+        self.assertEqual(
+            batch["results"],
+            [
+                {"status": "ok", "id": 1},
+                {"status": "ok", "id": 1},
+                {"status": "ok", "id": 1},
+                {"status": "ok", "id": 1},
+                {"status": "ok", "id": 1},
+                {"status": "ok", "id": 1},
+                {"status": "ok", "id": 1},
+            ],
+        )
+        srv = ServerOp.get(name="web01")[0]
+        self.assertEqual([tag.name for tag in srv.tags], ["www"])
+        self.assertEqual(srv.ips, [])
+
+    def case_atomic_rolled_back(self, rollback_db):
+        """ Roll back all operations when one of them fails."""
+        batch = BatchOp.run(
+            PROVISIONING[:3]
+            + [
+                {"model": "tag", "action": "add", "params": {"name": "web"}},
+                {"model": "tag", "action": "add", "params": {"name": "db"}},
+            ]
+        )
+
+        results = batch["results"]
+        self.assertEqual(batch["committed"], False)
+        self.assertEqual(results[:3], [{"status": "rolled_back"}] * 3)
+        self.assertEqual(results[3]["status"], "error")
+        self.assertEqual(results[3]["error"], "IntegrityError")
+        self.assertEqual(results[4], {"status": "skipped"})
+        self.assertEqual(TagOp.get(), [])
+        self.assertEqual(ServerStatusOp.get(), [])
+
+    def case_best_effort(self, rollback_db):
+        """ Commit operations which did not fail."""
+        batch = BatchOp.run(
+            [
+                {"model": "tag", "action": "add", "params": {"name": "web"}},
+                {"model": "tag", "action": "add", "params": {"name": "web"}},
+                {"model": "tag", "action": "delete", "id": 7},
+                {"model": "tag", "action": "add", "params": {"name": "Not valid!"}},
+                {"model": "tag", "action": "add", "params": {"name": "db"}},
+            ],
+            mode="best_effort",
+        )
+
+        results = batch["results"]
+        self.assertEqual(batch["committed"], True)
+        self.assertEqual(results[0], {"status": "ok", "id": 1})
+        self.assertEqual(results[1]["error"], "IntegrityError")
+        self.assertEqual(
+            results[2],
+            {
+                "status": "error",
+                "error": "BatchRowNotFoundError",
+                "message": "Row: tag with id 7 not found.",
+            },
+        )
+        self.assertEqual(results[3]["error"], "TagNameNotValidError")
+        self.assertEqual(results[4]["status"], "ok")
+        self.assertEqual(sorted(tag.name for tag in TagOp.get()), ["db", "web"])
+
+    def case_params_type_not_valid(self, rollback_db):
+        """ Report params of wrong type as error of the operation."""
+        server = dict(PROVISIONING[4], params=dict(PROVISIONING[4]["params"], ips=5))
+
+        batch = BatchOp.run(PROVISIONING[:4] + [server])
+        self.assertEqual(batch["committed"], False)
+        self.assertEqual(batch["results"][4]["error"], "TypeError")
+        self.assertEqual(TagOp.get(), [])
+
+        batch = BatchOp.run(PROVISIONING[:4] + [server], mode="best_effort")
+        self.assertEqual(batch["committed"], True)
+        self.assertEqual(batch["results"][3], {"status": "ok", "id": 1})
+        self.assertEqual(batch["results"][4]["error"], "TypeError")
+        self.assertEqual(ServerOp.get(), [])
+
+    def case_commit_failed(self, rollback_db):
+        """ Report all operations rolled back when the commit fails."""
+        error = OperationalError("COMMIT", None, Exception("disk I/O error"))
+        with mock.patch.object(DB.session, "commit", side_effect=error):
+            batch = BatchOp.run(PROVISIONING[:2], mode="best_effort")
+
+        self.assertEqual(batch["committed"], False)
+        self.assertEqual(batch["results"], [{"status": "rolled_back"}] * 2)
+        self.assertEqual(batch["error"]["error"], "OperationalError")
+        self.assertEqual(ServerStatusOp.get(), [])
+
+    def case_not_valid(self, rollback_db):
+        """ Try to run not valid operations, nothing runs."""
+        not_valid = [
+            [],
+            [{"model": "rack", "action": "add"}],
+            [{"model": "tag", "action": "rename", "params": {"name": "web"}}],
+            [{"model": "tag", "action": "add", "params": {"title": "web"}}],
+            [{"model": "tag", "action": "add"}],
+            [{"model": "tag", "action": "update", "params": {"name": "web"}}],
+            [{"model": "tag", "action": "add", "id": 1, "params": {"name": "web"}}],
+            [{"model": "tag", "action": "add", "params": {"name": "web"}, "x": 1}],
+            [{"model": "tag", "action": "add", "params": {"name": "web"}}, "tag"],
+        ]
+        for operations in not_valid:
+            exception_raised = False
+            try:
+                BatchOp.run(operations)
+            except BatchOperationNotValidError:
+                exception_raised = True
+
+            self.assertTrue(exception_raised)
+
+        exception_raised = False
+        try:
+            BatchOp.run(PROVISIONING, mode="partial")
+        except BatchModeNotValidError:
+            exception_raised = True
+
+        self.assertTrue(exception_raised)
+        self.assertEqual(TagOp.get(), [])
+
+    def case_endpoint(self, rollback_db, api_client):
+        """ Run operations with POST /batch."""
+        response = api_client.post("/batch", json={"operations": PROVISIONING})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["committed"], True)
+        self.assertEqual(len(ServerOp.get(name="web01")), 1)
+
+        response = api_client.post(
+            "/batch", json={"operations": PROVISIONING[2:3] + PROVISIONING[:1]},
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["committed"], False)
+        self.assertEqual(response.get_json()["results"][1], {"status": "skipped"})
+
+        response = api_client.post(
+            "/batch", json={"operations": PROVISIONING[2:3], "mode": "best_effort"},
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["results"][0]["status"], "error")
+
+        params = dict(PROVISIONING[4]["params"], name="web02", ips=5)
+        server = dict(PROVISIONING[4], params=params)
+        response = api_client.post("/batch", json={"operations": [server]})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["results"][0]["error"], "TypeError")
+
+        response = api_client.post("/batch", data="[]")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "BatchOperationNotValidError")
@@ -1,9 +1,8 @@
 from pytest import mark
 
 from tests.integration.helpers.asserts import Asserts
-from tests.integration.helpers.fixtures import refresh_db_before
+from tests.integration.helpers.fixtures import rollback_db
 
-from app import run
 from app.db.models.admin import Admin
 from app.db.operations.basic.admin import AdminOp
 
@@ -15,7 +14,7 @@ class TestAdminOp(Asserts):
         Operations on Admin model.
     """
 
-    def case_add_records(self, refresh_db_before):
+    def case_add_records(self, rollback_db):
         """ Add new records to Admin table."""
         new_names = ["admin1", "admin2", "admin3"]
 
@@ -30,7 +29,7 @@ class TestAdminOp(Asserts):
             self.assertTrue(isinstance(record, Admin))
             self.assertEqual(record.name, exp_name)
 
-    def case_get_by_id(self, refresh_db_before):
+    def case_get_by_id(self, rollback_db):
         """ Create test records in Admin table and get them by id."""
         names_with_id = {"admin1": 1, "admin2": 2, "admin3": 3}
 
@@ -43,7 +42,7 @@ class TestAdminOp(Asserts):
             self.assertEqual(exp_name, admin_obj[0].name)
             self.assertEqual(exp_id, admin_obj[0].id)
 
-    def case_get_by_name_one_result(self, refresh_db_before):
+    def case_get_by_name_one_result(self, rollback_db):
         """ Create test records in Admin table and get them by name."""
         names_with_id = {"admin1": 1, "admin2": 2, "admin3": 3}
 
@@ -56,7 +55,7 @@ class TestAdminOp(Asserts):
             self.assertEqual(exp_name, admin_obj[0].name)
             self.assertEqual(exp_id, admin_obj[0].id)
 
-    def case_update_record(self, refresh_db_before):
+    def case_update_record(self, rollback_db):
         """ Create test record in Admin table and then update it."""
         original_name = "admin3"
         update_name = "admin33"
@@ -73,7 +72,7 @@ class TestAdminOp(Asserts):
         self.assertEqual(updated_admin_get[0].name, update_name)
         self.assertEqual(updated_admin_get[0].id, original_admin.id)
 
-    def case_delete_records(self, refresh_db_before):
+    def case_delete_records(self, rollback_db):
         """ Create new record in Admin table and then delete it."""
         new_name = "admin1"
 
@@ -1,9 +1,8 @@
 from pytest import mark
 
 from tests.integration.helpers.asserts import Asserts
-from tests.integration.helpers.fixtures import refresh_db_before
+from tests.integration.helpers.fixtures import rollback_db
 
-from app import run
 from app.db.models.ip import Ip
 from app.db.operations.basic.ip import IpOp
 
@@ -16,7 +15,7 @@ class TestIpOp(Asserts):
         Operations on Ip model.
     """
 
-    def case_add_records(self, refresh_db_before):
+    def case_add_records(self, rollback_db):
         """ Add new records to Ip table."""
         new_addresses = ["0.0.0.0", "11.11.11.11", "222.222.222.222"]
 
@@ -31,7 +30,7 @@ class TestIpOp(Asserts):
             self.assertTrue(isinstance(record, Ip))
             self.assertEqual(record.address, exp_name)
 
-    def case_get_by_id(self, refresh_db_before):
+    def case_get_by_id(self, rollback_db):
         """ Create test records in Ip table and get them by id."""
         addresses_with_id = {"0.0.0.0": 1, "11.11.11.11": 2, "222.222.222.222": 3}
 
@@ -44,7 +43,7 @@ class TestIpOp(Asserts):
             self.assertEqual(exp_address, ip_obj[0].address)
             self.assertEqual(exp_id, ip_obj[0].id)
 
-    def case_get_by_address_one_result(self, refresh_db_before):
+    def case_get_by_address_one_result(self, rollback_db):
         """ Create test records in Ip table and get them by name."""
         addresses_with_id = {"0.0.0.0": 1, "11.11.11.11": 2, "222.222.222.222": 3}
 
@@ -57,7 +56,7 @@ class TestIpOp(Asserts):
             self.assertEqual(exp_address, ip_obj[0].address)
             self.assertEqual(exp_id, ip_obj[0].id)
 
-    def case_update_record(self, refresh_db_before):
+    def case_update_record(self, rollback_db):
         """ Create test record in Ip table and then update it."""
         original_address = "0.0.0.0"
         update_address = "11.11.11.11"
@@ -74,7 +73,7 @@ class TestIpOp(Asserts):
         self.assertEqual(updated_ip_get[0].address, update_address)
         self.assertEqual(updated_ip_get[0].id, original_ip.id)
 
-    def case_delete_records(self, refresh_db_before):
+    def case_delete_records(self, rollback_db):
         """ Create new record in Ip table and then delete it."""
         new_address = "0.0.0.0"
 
@@ -88,3 +87,35 @@ class TestIpOp(Asserts):
 
         ip_obj = IpOp.get(address=new_address)
         self.assertFalse(ip_obj)
+
+    def case_add_normalized_address(self, rollback_db):
+        """ Add IPv6 record, address is stored in normalized form."""
+        ip_obj = IpOp.add("FE80:0000:0000::0001")
+
+        self.assertEqual(ip_obj.address, "fe80::1")
+        self.assertEqual(IpOp.get(address="fe80::1"), [ip_obj])
+
+    def case_get_in_network(self, rollback_db):
+        """ Create test records in Ip table and get them by network."""
+        addresses = [
+            "10.20.0.1",
+            "9.255.255.255",
+            "10.20.255.255",
+            "10.21.0.0",
+            "10.20.3.4",
+            "::1",
+        ]
+
+        for address in addresses:
+            IpOp.add(address)
+
+        ip_objs = IpOp.get_in_network("10.20.0.0/16")
+        self.assertEqual(
+            [ip_obj.address for ip_obj in ip_objs],
+            ["10.20.0.1", "10.20.3.4", "10.20.255.255"],
+        )
+
+        ip_objs = IpOp.get_in_network("::/64")
+        self.assertEqual([ip_obj.address for ip_obj in ip_objs], ["::1"])
+
+        self.assertFalse(IpOp.get_in_network("192.168.0.0/24"))
@@ -1,10 +1,19 @@
+from unittest import mock
+
+from flask import current_app
 from pytest import mark
+from sqlalchemy import update
 
 from tests.integration.helpers.asserts import Asserts
-from tests.integration.helpers.fixtures import refresh_db_before
+from tests.integration.helpers.fixtures import rollback_db
+from tests.integration.helpers.fixtures import statement_counter
 
-from app import run
+from app.extensions import DB
+from app.db.statements import StatementCounter
 from app.db.models.server import Server
+from app.db.models.server_status import ServerStatus
+from app.db.transaction import transaction
+from app.db.versions import bump_version
 from app.db.models.ip import Ip
 from app.db.operations.basic.ip import IpOp
 from app.db.operations.basic.tag import TagOp
@@ -13,11 +22,14 @@ from app.db.operations.basic.server import ServerOp
 from app.db.operations.basic.server_type import ServerTypeOp
 from app.db.operations.basic.server_status import ServerStatusOp
 
+from app.db.exceptions import DbError
+from app.db.exceptions import ServerLoadNotValidError
+from app.db.exceptions import ServerNameNotValidError
+from app.db.exceptions import ServerDescriptionNotValidError
 from app.db.exceptions import ServerStatusNotFoundError
 from app.db.exceptions import ServerTypeNotFoundError
 from app.db.exceptions import ServerIpNotFoundError
 from app.db.exceptions import ServerTagNotFoundError
-from app.db.exceptions import ServerAdminNotFoundError
 
 
 @mark.db_operations
@@ -27,7 +39,7 @@ class TestServerOp(Asserts):
         Operations on Server model.
     """
 
-    def case_resolve_status_positive(self, refresh_db_before):
+    def case_resolve_status_positive(self, rollback_db):
         """ Create ServerStatus rows, then resolve their names into ID."""
         statuses = {"Status_one": 1, "Status_two": 2}
         for status in statuses.keys():
@@ -37,7 +49,7 @@ class TestServerOp(Asserts):
             resolved_id = ServerOp.resolve_status(status_name)
             self.assertEqual(status_key, resolved_id)
 
-    def case_resolve_status_not_found(self, refresh_db_before):
+    def case_resolve_status_not_found(self, rollback_db):
         """ Try to resolve ServerStatus row which name does not exist."""
         exception_raised = False
         try:
@@ -47,7 +59,57 @@ class TestServerOp(Asserts):
 
         self.assertTrue(exception_raised)
 
-    def case_resolve_type_positive(self, refresh_db_before):
+    def case_resolve_status_cached(self, rollback_db):
+        """ Resolve ServerStatus names from the cache, which is refreshed
+            after every ServerStatus change.
+        """
+        status_obj = ServerStatusOp.add("Status_one")
+        ServerStatusOp.add("Status_two")
+
+        loads = ServerStatusOp.CACHE.stats()["loads"]
+        self.assertEqual(ServerOp.resolve_status("Status_one"), 1)
+        self.assertEqual(ServerOp.resolve_status("Status_two"), 2)
+        self.assertEqual(ServerStatusOp.CACHE.stats()["loads"], loads + 1)
+
+        ServerStatusOp.update(status_obj, "Status_three")
+        self.assertEqual(ServerOp.resolve_status("Status_three"), 1)
+
+        exception_raised = False
+        try:
+            ServerOp.resolve_status("Status_one")
+        except ServerStatusNotFoundError:
+            exception_raised = True
+
+        self.assertTrue(exception_raised)
+
+    def case_resolve_status_changed_by_other_process(self, rollback_db):
+        """ Resolve ServerStatus names from the cache, which is refreshed
+            after change version of ServerStatus table is changed
+            by other process.
+        """
+        ServerStatusOp.add("Status_one")
+        self.assertEqual(ServerOp.resolve_status("Status_one"), 1)
+
+        # change made by other process does not invalidate the cache
+        DB.session.execute(update(ServerStatus.__table__).values(name="Status_two"))
+        with transaction():
+            bump_version(ServerStatus.__tablename__)
+
+        config = current_app.config
+        interval = config["CATALOG_CACHE_CHECK_INTERVAL"]
+        config["CATALOG_CACHE_CHECK_INTERVAL"] = 0
+        try:
+            exception_raised = False
+            try:
+                ServerOp.resolve_status("Status_one")
+            except ServerStatusNotFoundError:
+                exception_raised = True
+            self.assertTrue(exception_raised)
+            self.assertEqual(ServerOp.resolve_status("Status_two"), 1)
+        finally:
+            config["CATALOG_CACHE_CHECK_INTERVAL"] = interval
+
+    def case_resolve_type_positive(self, rollback_db):
         """ Create ServerType rows, then resolve their names into ID."""
         types = {"Type one": 1, "Type two": 2}
         for srv_type in types.keys():
@@ -57,7 +119,7 @@ class TestServerOp(Asserts):
             resolved_id = ServerOp.resolve_type(srv_type_name)
             self.assertEqual(srv_type_id, resolved_id)
 
-    def case_resolve_type_not_found(self, refresh_db_before):
+    def case_resolve_type_not_found(self, rollback_db):
         """ Try to resolve ServerType row which name does not exist."""
         exception_raised = False
         try:
@@ -67,7 +129,7 @@ class TestServerOp(Asserts):
 
         self.assertTrue(exception_raised)
 
-    def case_resolve_ip_positive(self, refresh_db_before):
+    def case_resolve_ip_positive(self, rollback_db):
         """ Try to resolve Ip row."""
         ips = ["11.11.11.11", "22.22.22.22", "33.33.33.33"]
         for ip in ips:
@@ -79,7 +141,7 @@ class TestServerOp(Asserts):
             self.assertEqual(ip_obj.address, ip)
             self.assertTrue(isinstance(ip_obj, Ip))
 
-    def case_resolve_ip_not_found(self, refresh_db_before):
+    def case_resolve_ip_not_found(self, rollback_db):
         """ Try to resolve Ip row which does not exists."""
         exception_raised = False
         try:
@@ -89,45 +151,28 @@ class TestServerOp(Asserts):
 
         self.assertTrue(exception_raised)
 
-    def case_resolve_tag_positive(self, refresh_db_before):
-        """ Try to resolve existing Tag name."""
-        tag_name = "new tag"
-        tag_obj = TagOp.add(tag_name)
-
-        tag_res_obj = ServerOp.resolve_tag(tag_name)
-        self.assertEqual(tag_obj, tag_res_obj)
-        self.assertEqual(tag_res_obj.name, tag_name)
-
-    def case_resolve_tag_not_found(self, refresh_db_before):
-        """ Try to resolve non-existing tag name."""
-        exception_raised = False
-        try:
-            ServerOp.resolve_tag("not exist tag")
-        except ServerTagNotFoundError:
-            exception_raised = True
-
-        self.assertTrue(exception_raised)
+    def case_resolve_ips_positive(self, rollback_db):
+        """ Resolve many Ip rows at once."""
+        ips = ["11.11.11.11", "22.22.22.22", "33.33.33.33"]
+        for ip in ips:
+            IpOp.add(address=ip)
 
-    def case_resolve_admin_positive(self, refresh_db_before):
-        """ Try to resolve existing Admin name."""
-        adm_name = "New Admin"
-        adm_obj = AdminOp.add(adm_name)
+        ip_objs = ServerOp.resolve_ips(list(reversed(ips)))
+        self.assertEqual([ip_obj.address for ip_obj in ip_objs], list(reversed(ips)))
 
-        adm_res_obj = ServerOp.resolve_admin(adm_name)
-        self.assertEqual(adm_obj, adm_res_obj)
-        self.assertEqual(adm_res_obj.name, adm_name)
+    def case_resolve_tags_not_found(self, rollback_db):
+        """ Try to resolve many tag names, when part of them does not exist."""
+        TagOp.add("tag one")
 
-    def case_resolve_admin_not_found(self, refresh_db_before):
-        """ Try to resolve non-existing admin name."""
-        exception_raised = False
+        exception_message = None
         try:
-            ServerOp.resolve_admin("Adm")
-        except ServerAdminNotFoundError:
-            exception_raised = True
+            ServerOp.resolve_tags(["tag one", "tag two", "tag three"])
+        except ServerTagNotFoundError as exc:
+            exception_message = str(exc)
 
-        self.assertTrue(exception_raised)
+        self.assertEqual(exception_message, "Not found Tags: tag two, tag three.")
 
-    def case_add_with_description(self, refresh_db_before):
+    def case_add_with_description(self, rollback_db):
         """ Create new Server row with a description field."""
         description = "Some description made. - : *"
         server_name = "TestServer"
@@ -147,7 +192,7 @@ class TestServerOp(Asserts):
 
         self.assertEqual(get_servers[0], new_server)
 
-    def case_add_without_description(self, refresh_db_before):
+    def case_add_without_description(self, rollback_db):
         """ Create new Server row without description field."""
         server_name = "TestServer"
 
@@ -166,7 +211,7 @@ class TestServerOp(Asserts):
 
         self.assertEqual(get_servers[0], new_server)
 
-    def case_add_with_ips(self, refresh_db_before):
+    def case_add_with_ips(self, rollback_db):
         """ Create new Server row with ips many-to-many relation."""
         server_name = "TestServer"
         server_status = "TestStatus"
@@ -178,7 +223,8 @@ class TestServerOp(Asserts):
         for ip in ips:
             IpOp.add(ip)
 
-        new_server = ServerOp.add(server_name, server_status, server_type, ips=ips)
+        with self.assertQueryCount(6):
+            new_server = ServerOp.add(server_name, server_status, server_type, ips=ips)
 
         get_servers = ServerOp.get()
         self.assertTrue(len(get_servers) is 1)
@@ -190,7 +236,7 @@ class TestServerOp(Asserts):
         for srv_ip, exp_ip in zip(get_servers[0].ips, ips):
             self.assertEqual(srv_ip.address, exp_ip)
 
-    def case_add_with_tags(self, refresh_db_before):
+    def case_add_with_tags(self, rollback_db):
         """ Create new Server row with tags many-to-many relation."""
         server_name = "TestServer"
         server_status = "TestStatus"
@@ -202,7 +248,10 @@ class TestServerOp(Asserts):
         for tag in tags:
             TagOp.add(tag)
 
-        new_server = ServerOp.add(server_name, server_status, server_type, tags=tags)
+        with self.assertQueryCount(6):
+            new_server = ServerOp.add(
+                server_name, server_status, server_type, tags=tags
+            )
 
         get_servers = ServerOp.get()
         self.assertTrue(len(get_servers) is 1)
@@ -214,7 +263,7 @@ class TestServerOp(Asserts):
         for tag, exp_name in zip(get_servers[0].tags, tags):
             self.assertEqual(tag.name, exp_name)
 
-    def case_add_with_admins(self, refresh_db_before):
+    def case_add_with_admins(self, rollback_db):
         """ Create new Server row with admins many-to-many relation."""
         server_name = "TestServer"
         server_status = "TestStatus"
@@ -226,9 +275,10 @@ class TestServerOp(Asserts):
         for admin in admins:
             AdminOp.add(admin)
 
-        new_server = ServerOp.add(
-            server_name, server_status, server_type, admins=admins
-        )
+        with self.assertQueryCount(6):
+            new_server = ServerOp.add(
+                server_name, server_status, server_type, admins=admins
+            )
 
         get_servers = ServerOp.get()
         self.assertTrue(len(get_servers) is 1)
@@ -240,7 +290,125 @@ class TestServerOp(Asserts):
         for admin, exp_name in zip(get_servers[0].admins, admins):
             self.assertEqual(admin.name, exp_name)
 
-    def case_get_by_id(self, refresh_db_before):
+    def case_add_many(self, rollback_db):
+        """ Create many Server rows at once, in more than one chunk,
+            with part of records not valid.
+        """
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        IpOp.add("11.11.11.11")
+        IpOp.add("22.22.22.22")
+        TagOp.add("tag one")
+        AdminOp.add("Admin One")
+
+        records = [
+            {
+                "name": "ServerOne",
+                "srv_status": "Status",
+                "srv_type": "Type",
+                "ips": ["11.11.11.11", "22.22.22.22"],
+                "tags": ["tag one"],
+                "admins": ["Admin One"],
+            },
+            {"name": "Server Two", "srv_status": "Status", "srv_type": "Type"},
+            {"name": "ServerThree", "srv_status": "NoStatus", "srv_type": "Type"},
+            {
+                "name": "ServerFour",
+                "srv_status": "Status",
+                "srv_type": "Type",
+                "description": "Desc",
+                "tags": ["tag one", "tag two"],
+            },
+            {
+                "name": "ServerFive",
+                "srv_status": "Status",
+                "srv_type": "Type",
+                "ips": ["22.22.22.22"],
+            },
+            {"name": "ServerSix", "srv_status": "Status", "srv_type": "Type"},
+        ]
+
+        with self.assertQueryCount(13) as counter:
+            created_ids, errors = ServerOp.add_many(records, chunk_size=2)
+
+        # one executemany insert of servers per chunk
+        inserts = [
+            statement
+            for statement in counter.statements
+            if statement.startswith("INSERT INTO server ")
+        ]
+        self.assertEqual(len(inserts), 2)
+
+        self.assertEqual(created_ids, [1, 2, 3])
+        self.assertEqual(sorted(errors.keys()), [1, 2, 3])
+        self.assertTrue(isinstance(errors[1], ServerNameNotValidError))
+        self.assertTrue(isinstance(errors[2], ServerStatusNotFoundError))
+        self.assertTrue(isinstance(errors[3], ServerTagNotFoundError))
+
+        get_servers = ServerOp.get()
+        self.assertEqual(
+            [srv.name for srv in get_servers], ["ServerOne", "ServerFive", "ServerSix"]
+        )
+        self.assertEqual(
+            [ip.address for ip in get_servers[0].ips], ["11.11.11.11", "22.22.22.22"]
+        )
+        self.assertEqual([tag.name for tag in get_servers[0].tags], ["tag one"])
+        self.assertEqual([adm.name for adm in get_servers[0].admins], ["Admin One"])
+        self.assertEqual([ip.address for ip in get_servers[1].ips], ["22.22.22.22"])
+        self.assertFalse(get_servers[2].ips)
+
+    def case_add_many_atomic(self, rollback_db):
+        """ Add servers with the same names in order of records, validate
+            descriptions, add nothing when any chunk fails.
+        """
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        TagOp.add("web")
+        ServerOp.add("ServerOne", "Status", "Type")
+
+        records = [
+            {"name": "ServerOne", "srv_status": "Status", "srv_type": "Type"},
+            {"name": "ServerTwo", "srv_status": "Status", "srv_type": "Type"},
+            {
+                "name": "ServerOne",
+                "srv_status": "Status",
+                "srv_type": "Type",
+                "tags": ["web"],
+            },
+            {
+                "name": "ServerThree",
+                "srv_status": "Status",
+                "srv_type": "Type",
+                "description": "Not valid!",
+            },
+        ]
+        created_ids, errors = ServerOp.add_many(records)
+
+        self.assertEqual(created_ids, [2, 3, 4])
+        self.assertTrue(isinstance(errors[3], ServerDescriptionNotValidError))
+        self.assertEqual(ServerOp.get(id=2)[0].tags, [])
+        self.assertEqual([tag.name for tag in ServerOp.get(id=4)[0].tags], ["web"])
+
+        insert_rows = ServerOp.insert_rows
+        calls = list()
+
+        def fail_second_chunk(server_rows):
+            calls.append(server_rows)
+            if len(calls) == 2:
+                raise DbError("Insert failed.")
+            return insert_rows(server_rows)
+
+        with mock.patch.object(ServerOp, "insert_rows", fail_second_chunk):
+            exception_raised = False
+            try:
+                ServerOp.add_many(records[:3], chunk_size=2)
+            except DbError:
+                exception_raised = True
+
+        self.assertTrue(exception_raised)
+        self.assertEqual(len(ServerOp.get()), 4)
+
+    def case_get_by_id(self, rollback_db):
         """ Get server row with id keyword."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -259,7 +427,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_first_server[0].id, 1)
         self.assertNotEqual(get_first_server[0], new_second_server)
 
-    def case_get_by_name(self, refresh_db_before):
+    def case_get_by_name(self, rollback_db):
         """ Get server row with name keyword."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -278,7 +446,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_second_server[0].id, 2)
         self.assertNotEqual(get_second_server[0], new_server)
 
-    def case_get_by_srv_status(self, refresh_db_before):
+    def case_get_by_srv_status(self, rollback_db):
         """ Get server row with srv_status keyword."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -296,7 +464,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_first_status[0], srv_one)
         self.assertNotEqual(get_first_status[0], srv_two)
 
-    def case_get_by_srv_type(self, refresh_db_before):
+    def case_get_by_srv_type(self, rollback_db):
         """ Get server row with srv_type keyword."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -314,7 +482,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_first_type[0], srv_one)
         self.assertNotEqual(get_first_type[0], srv_two)
 
-    def case_get_by_ip(self, refresh_db_before):
+    def case_get_by_ip(self, rollback_db):
         """ Get server row with ip keyword."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -332,14 +500,35 @@ class TestServerOp(Asserts):
             server_second_name, server_status, server_type, ips=[ips[1]]
         )
 
-        get_first_ip = ServerOp.get(ip=ips[0])
+        with self.assertQueryCount(2):
+            get_first_ip = ServerOp.get(ip=ips[0])
         self.assertTrue(len(get_first_ip) is 1)
         self.assertEqual(get_first_ip[0], srv_one)
         self.assertNotEqual(get_first_ip[0], srv_two)
         self.assertTrue(len(get_first_ip[0].ips) is 1)
         self.assertEqual(get_first_ip[0].ips[0].address, ips[0])
 
-    def case_get_by_tags(self, refresh_db_before):
+    def case_get_by_network(self, rollback_db):
+        """ Get server rows with network keyword."""
+        server_status = "TestStatus"
+        server_type = "TestType"
+        ServerStatusOp.add(server_status)
+        ServerTypeOp.add(server_type)
+
+        ips = ["10.20.0.1", "10.20.0.2", "10.21.0.1", "fe80::1"]
+        for ip in ips:
+            IpOp.add(ip)
+
+        srv_one = ServerOp.add("ServerOne", server_status, server_type, ips=ips[:2])
+        srv_two = ServerOp.add("ServerTwo", server_status, server_type, ips=ips[2:])
+
+        with self.assertQueryCount(1):
+            self.assertEqual(ServerOp.get(network="10.20.0.0/16"), [srv_one])
+        self.assertEqual(ServerOp.get(network="fe80::/10"), [srv_two])
+        self.assertEqual(ServerOp.get(network="10.0.0.0/8"), [srv_one, srv_two])
+        self.assertFalse(ServerOp.get(network="192.168.0.0/16"))
+
+    def case_get_by_tags(self, rollback_db):
         """ Get server row with tags keyword."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -359,7 +548,8 @@ class TestServerOp(Asserts):
             server_second_name, server_status, server_type, tags=tags
         )
 
-        get_lonely = ServerOp.get(tags=[tags[2]])
+        with self.assertQueryCount(2):
+            get_lonely = ServerOp.get(tags=[tags[2]])
         self.assertTrue(len(get_lonely) is 1)
         self.assertEqual(get_lonely[0], srv_two)
         self.assertEqual(len(get_lonely[0].tags), len(tags))
@@ -367,7 +557,32 @@ class TestServerOp(Asserts):
         get_all = ServerOp.get(tags=[tags[0]])
         self.assertTrue(len(get_all) is 2)
 
-    def case_get_by_admins(self, refresh_db_before):
+    def case_get_by_many_tags(self, rollback_db):
+        """ Get server rows having all of given tags."""
+        server_status = "TestStatus"
+        server_type = "TestType"
+        ServerStatusOp.add(server_status)
+        ServerTypeOp.add(server_type)
+
+        tags = ["web", "prod", "dev"]
+        for tag in tags:
+            TagOp.add(tag)
+
+        srv_one = ServerOp.add(
+            "TestServer", server_status, server_type, tags=["web", "prod"]
+        )
+        ServerOp.add("TestServerTwo", server_status, server_type, tags=["web", "dev"])
+        ServerOp.add("TestServerThree", server_status, server_type, tags=["prod"])
+
+        with self.assertQueryCount(2):
+            get_both = ServerOp.get(tags=["web", "prod"])
+        self.assertTrue(len(get_both) is 1)
+        self.assertEqual(get_both[0], srv_one)
+
+        get_none = ServerOp.get(tags=["prod", "dev"])
+        self.assertFalse(get_none)
+
+    def case_get_by_admins(self, rollback_db):
         """ Get server row with admins keyword."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -387,7 +602,8 @@ class TestServerOp(Asserts):
             server_second_name, server_status, server_type, admins=admins
         )
 
-        get_lonely = ServerOp.get(admins=[admins[2]])
+        with self.assertQueryCount(2):
+            get_lonely = ServerOp.get(admins=[admins[2]])
         self.assertTrue(len(get_lonely) is 1)
         self.assertEqual(get_lonely[0], srv_two)
         self.assertEqual(len(get_lonely[0].admins), len(admins))
@@ -395,7 +611,7 @@ class TestServerOp(Asserts):
         get_all = ServerOp.get(admins=[admins[0]])
         self.assertTrue(len(get_all) is 2)
 
-    def case_get_by_all(self, refresh_db_before):
+    def case_get_by_all(self, rollback_db):
         """ Get server row with both srv_status
             srv_type keywords.
         """
@@ -467,7 +683,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_by_all[0], srv_one)
         self.assertEqual(get_by_all[1], srv_four)
 
-    def case_get_without_filters(self, refresh_db_before):
+    def case_get_without_filters(self, rollback_db):
         """ Get server rows without any filters."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -484,7 +700,199 @@ class TestServerOp(Asserts):
         self.assertEqual(get_all[0], srv_one)
         self.assertEqual(get_all[1], srv_two)
 
-    def case_update_name(self, refresh_db_before):
+    def count_statements(self, operation):
+        """ Run given operation and count SQL statements executed
+            during it, starting with empty session.
+        """
+        DB.session.expunge_all()
+        with StatementCounter() as counter:
+            operation()
+        return counter.count
+
+    def case_get_load_strategies(self, rollback_db):
+        """ Get server rows with every load strategy and count
+            SQL statements needed to get rows and read their collections.
+        """
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        IpOp.add("11.11.11.11")
+        TagOp.add("tag one")
+        AdminOp.add("Admin One")
+        for name in ("ServerOne", "ServerTwo"):
+            ServerOp.add(
+                name,
+                "Status",
+                "Type",
+                ips=["11.11.11.11"],
+                tags=["tag one"],
+                admins=["Admin One"],
+            )
+
+        def get_rows(load):
+            return lambda: ServerOp.get(load=load)
+
+        def get_and_read(load):
+            def operation():
+                for srv in ServerOp.get(load=load):
+                    self.assertEqual(len(srv.ips), 1)
+                    self.assertEqual(len(srv.tags), 1)
+                    self.assertEqual(len(srv.admins), 1)
+
+            return operation
+
+        # only rows are selected, every collection is loaded on access
+        self.assertEqual(self.count_statements(get_rows(None)), 1)
+        self.assertEqual(self.count_statements(get_rows("none")), 1)
+        self.assertEqual(self.count_statements(get_and_read("none")), 7)
+
+        # rows, then one statement per collection
+        self.assertEqual(self.count_statements(get_rows("selectin")), 4)
+        self.assertEqual(self.count_statements(get_and_read("selectin")), 4)
+        self.assertEqual(self.count_statements(get_and_read("subquery")), 4)
+
+        # rows joined with all collections
+        self.assertEqual(self.count_statements(get_rows("joined")), 1)
+        self.assertEqual(self.count_statements(get_and_read("joined")), 1)
+
+        # rows, then one statement per chosen collection
+        self.assertEqual(self.count_statements(get_rows(["tags"])), 2)
+        self.assertEqual(self.count_statements(get_rows(["tags", "admins"])), 3)
+
+    def case_get_load_not_valid(self, rollback_db):
+        """ Try to get server rows with unknown load strategy."""
+        exception_raised = False
+        try:
+            ServerOp.get(load="eager")
+        except ServerLoadNotValidError:
+            exception_raised = True
+
+        self.assertTrue(exception_raised)
+
+    def case_page(self, rollback_db):
+        """ Get server rows page by page."""
+        ServerStatusOp.add("StatusOne")
+        ServerStatusOp.add("StatusTwo")
+        ServerTypeOp.add("Type")
+        for number in range(7):
+            status = "StatusOne" if number % 2 == 0 else "StatusTwo"
+            ServerOp.add(f"Server{number}", status, "Type")
+
+        rows, cursor = ServerOp.page(limit=3)
+        self.assertEqual([srv.id for srv in rows], [1, 2, 3])
+        self.assertEqual(cursor, 3)
+
+        rows, cursor = ServerOp.page(after_id=cursor, limit=3)
+        self.assertEqual([srv.id for srv in rows], [4, 5, 6])
+        self.assertEqual(cursor, 6)
+
+        rows, cursor = ServerOp.page(after_id=cursor, limit=3)
+        self.assertEqual([srv.id for srv in rows], [7])
+        self.assertEqual(cursor, None)
+
+        rows, cursor = ServerOp.page(limit=3, srv_status="StatusOne")
+        self.assertEqual([srv.id for srv in rows], [1, 3, 5])
+        self.assertEqual(cursor, 5)
+
+        rows, cursor = ServerOp.page(after_id=cursor, limit=3, srv_status="StatusOne")
+        self.assertEqual([srv.id for srv in rows], [7])
+        self.assertEqual(cursor, None)
+
+    def case_iter(self, rollback_db, statement_counter):
+        """ Iterate over server rows in batches."""
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        TagOp.add("tag")
+        for number in range(5):
+            tags = ["tag"] if number != 2 else None
+            ServerOp.add(f"Server{number}", "Status", "Type", tags=tags)
+
+        statement_counter.reset()
+        all_ids = [srv.id for srv in ServerOp.iter(batch_size=2)]
+        self.assertEqual(all_ids, [1, 2, 3, 4, 5])
+        # one statement per batch
+        self.assertEqual(statement_counter.count, 3)
+
+        tagged_ids = [srv.id for srv in ServerOp.iter(batch_size=2, tags=["tag"])]
+        self.assertEqual(tagged_ids, [1, 2, 4, 5])
+
+        # filters are resolved when the method is called
+        exception_raised = False
+        try:
+            ServerOp.iter(tags=["other"])
+        except ServerTagNotFoundError:
+            exception_raised = True
+        self.assertTrue(exception_raised)
+
+    def case_get_rows(self, rollback_db):
+        """ Get server rows as records with chosen fields."""
+        ServerStatusOp.add("StatusOne")
+        ServerStatusOp.add("StatusTwo")
+        ServerTypeOp.add("Type")
+        TagOp.add("web")
+        TagOp.add("db")
+        IpOp.add("10.0.0.1")
+        ServerOp.add("ServerOne", "StatusOne", "Type", tags=["web", "db"])
+        ServerOp.add("ServerTwo", "StatusTwo", "Type", ips=["10.0.0.1"], tags=["db"])
+
+        rows = ServerOp.get_rows()
+        self.assertEqual(
+            [tuple(row) for row in rows],
+            [
+                (1, "ServerOne", "StatusOne", "Type"),
+                (2, "ServerTwo", "StatusTwo", "Type"),
+            ],
+        )
+        self.assertEqual(rows[0]._fields, ServerOp.ROW_FIELDS)
+
+        rows = ServerOp.get_rows(fields=["name", "tags", "ips", "admins"])
+        self.assertEqual(rows[0].name, "ServerOne")
+        self.assertEqual(rows[0].tags, ("db", "web"))
+        self.assertEqual(rows[0].ips, ())
+        self.assertEqual(rows[1].ips, ("10.0.0.1",))
+        self.assertEqual(rows[1].admins, ())
+
+        rows = ServerOp.get_rows(fields=["id", "tags"], tags=["web"])
+        self.assertEqual([tuple(row) for row in rows], [(1, ("db", "web"))])
+
+        rows = ServerOp.get_rows(fields=["name"], srv_status="StatusTwo")
+        self.assertEqual([tuple(row) for row in rows], [("ServerTwo",)])
+
+    def case_stream_rows(self, rollback_db, statement_counter):
+        """ Get server rows as records in batches."""
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        TagOp.add("web")
+        for number in range(5):
+            tags = ["web"] if number % 2 == 0 else None
+            ServerOp.add(f"Server{number}", "Status", "Type", tags=tags)
+
+        statement_counter.reset()
+        batches = ServerOp.stream_rows(fields=["id", "tags"], batch_size=2)
+        self.assertEqual(statement_counter.count, 0)
+
+        batches = [[tuple(row) for row in batch] for batch in batches]
+        self.assertEqual(
+            batches,
+            [[(1, ("web",)), (2, ())], [(3, ("web",)), (4, ())], [(5, ("web",))],],
+        )
+        # rows, then tags of every batch
+        self.assertEqual(statement_counter.count, 4)
+
+        batches = ServerOp.stream_rows(fields=["name"], tags=["web"], batch_size=2)
+        self.assertEqual(
+            [[row.name for row in batch] for batch in batches],
+            [["Server0", "Server2"], ["Server4"]],
+        )
+
+        exception_raised = False
+        try:
+            ServerOp.stream_rows(tags=["db"])
+        except ServerTagNotFoundError:
+            exception_raised = True
+
+        self.assertTrue(exception_raised)
+
+    def case_update_name(self, rollback_db):
         """ Update server name."""
         server_name = "TestServer"
         server_second_name = "TestServerTwo"
@@ -503,7 +911,7 @@ class TestServerOp(Asserts):
         self.assertTrue(len(get_srv) is 1)
         self.assertEqual(get_srv[0].id, 1)
 
-    def case_update_srv_status(self, refresh_db_before):
+    def case_update_srv_status(self, rollback_db):
         """ Update server status."""
         server_name = "TestServer"
         ServerStatusOp.add("StatusOne")
@@ -524,7 +932,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_srv[0].id, 1)
         self.assertEqual(get_srv[0].status.name, "StatusTwo")
 
-    def case_update_srv_type(self, refresh_db_before):
+    def case_update_srv_type(self, rollback_db):
         """ Update server type."""
         server_name = "TestServer"
         ServerStatusOp.add("Status")
@@ -545,7 +953,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_srv[0].id, 1)
         self.assertEqual(get_srv[0].type.name, "TypeTwo")
 
-    def case_update_description(self, refresh_db_before):
+    def case_update_description(self, rollback_db):
         """ Update server description."""
         server_name = "TestServer"
         ServerStatusOp.add("Status")
@@ -567,7 +975,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_srv[0].id, 1)
         self.assertEqual(get_srv[0].description, desc_two)
 
-    def case_update_ips(self, refresh_db_before):
+    def case_update_ips(self, rollback_db):
         """ Update ip addresses. """
         server_name = "TestServer"
         ServerStatusOp.add("Status")
@@ -589,7 +997,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_srv[0].id, 1)
         self.assertEqual(get_srv[0].ips, [ips_two])
 
-    def case_update_tags(self, refresh_db_before):
+    def case_update_tags(self, rollback_db):
         """ Update tags."""
         server_name = "TestServer"
         ServerStatusOp.add("Status")
@@ -605,14 +1013,15 @@ class TestServerOp(Asserts):
         self.assertEqual(get_before_update[0].id, 1)
         self.assertEqual(get_before_update[0].tags, [tag_one])
 
-        ServerOp.update(srv, tags=["tag two"])
+        with self.assertQueryCount(4):
+            ServerOp.update(srv, tags=["tag two"])
 
         get_srv = ServerOp.get()
         self.assertTrue(len(get_srv) is 1)
         self.assertEqual(get_srv[0].id, 1)
         self.assertEqual(get_srv[0].tags, [tag_two])
 
-    def case_update_admins(self, refresh_db_before):
+    def case_update_admins(self, rollback_db):
         """ Update admins."""
         server_name = "TestServer"
         ServerStatusOp.add("Status")
@@ -628,7 +1037,8 @@ class TestServerOp(Asserts):
         self.assertEqual(get_before_update[0].id, 1)
         self.assertEqual(get_before_update[0].admins, [admin_one])
 
-        ServerOp.update(srv, admins=["Admin Two"])
+        with self.assertQueryCount(4):
+            ServerOp.update(srv, admins=["Admin Two"])
 
         get_srv = ServerOp.get()
         self.assertTrue(len(get_srv) is 1)
@@ -636,7 +1046,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_srv[0].admins, [admin_two])
 
     @mark.one
-    def case_update_all(self, refresh_db_before):
+    def case_update_all(self, rollback_db):
         """ Update all fields."""
         server_name = "TestServer"
         server_name_two = "TestServerTwo"
@@ -674,16 +1084,17 @@ class TestServerOp(Asserts):
         self.assertEqual(get_before_update[0].tags, [tag_one])
         self.assertEqual(get_before_update[0].admins, [admin_one])
 
-        ServerOp.update(
-            srv,
-            name=server_name_two,
-            description=desc_two,
-            srv_status="StatusTwo",
-            srv_type="TypeTwo",
-            ips=["22.22.22.22"],
-            tags=["tag two"],
-            admins=["Admin Two"],
-        )
+        with self.assertQueryCount(11):
+            ServerOp.update(
+                srv,
+                name=server_name_two,
+                description=desc_two,
+                srv_status="StatusTwo",
+                srv_type="TypeTwo",
+                ips=["22.22.22.22"],
+                tags=["tag two"],
+                admins=["Admin Two"],
+            )
 
         get_srv = ServerOp.get()
         self.assertTrue(len(get_srv) is 1)
@@ -696,7 +1107,7 @@ class TestServerOp(Asserts):
         self.assertEqual(get_srv[0].tags, [tag_two])
         self.assertEqual(get_srv[0].admins, [admin_two])
 
-    def case_delete(self, refresh_db_before):
+    def case_delete(self, rollback_db):
         """ Delete record."""
         server_name = "TestServer"
         ServerStatusOp.add("Status")
@@ -708,6 +1119,7 @@ class TestServerOp(Asserts):
         self.assertTrue(len(get_srv) is 1)
         self.assertEqual(get_srv[0].name, server_name)
 
-        ServerOp.delete(get_srv[0])
+        with self.assertQueryCount(5):
+            ServerOp.delete(get_srv[0])
         get_empty = ServerOp.get()
         self.assertFalse(get_empty)
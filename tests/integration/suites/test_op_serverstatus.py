@@ -1,9 +1,8 @@
 from pytest import mark
 
 from tests.integration.helpers.asserts import Asserts
-from tests.integration.helpers.fixtures import refresh_db_before
+from tests.integration.helpers.fixtures import rollback_db
 
-from app import run
 from app.db.models.server_status import ServerStatus
 from app.db.operations.basic.server_status import ServerStatusOp
 
@@ -15,7 +14,7 @@ class TestServerStatusOp(Asserts):
         Operations on ServerStatus model.
     """
 
-    def case_add_records(self, refresh_db_before):
+    def case_add_records(self, rollback_db):
         """ Add new records to ServerStatus table."""
         new_statuses = ["Status_one", "Status_two"]
 
@@ -30,7 +29,7 @@ class TestServerStatusOp(Asserts):
             self.assertTrue(isinstance(record, ServerStatus))
             self.assertEqual(record.name, exp_status)
 
-    def case_get_by_id(self, refresh_db_before):
+    def case_get_by_id(self, rollback_db):
         """ Create test records in ServerStatus table and get them by id."""
         statuses_with_id = {"Status_one": 1, "Status_two": 2}
 
@@ -43,7 +42,7 @@ class TestServerStatusOp(Asserts):
             self.assertEqual(exp_status, stat_obj[0].name)
             self.assertEqual(exp_id, stat_obj[0].id)
 
-    def case_get_by_name_one_result(self, refresh_db_before):
+    def case_get_by_name_one_result(self, rollback_db):
         """ Create test records in ServerStatus table and get them by name."""
         statuses_with_id = {"Status_one": 1, "Status_two": 2}
 
@@ -56,7 +55,7 @@ class TestServerStatusOp(Asserts):
             self.assertEqual(exp_status, stat_obj[0].name)
             self.assertEqual(exp_id, stat_obj[0].id)
 
-    def case_update_record(self, refresh_db_before):
+    def case_update_record(self, rollback_db):
         """ Create test record in ServerStatus table and then update it."""
         original_status = "StatusOrig"
         update_status = "StatusUpdate"
@@ -73,7 +72,7 @@ class TestServerStatusOp(Asserts):
         self.assertEqual(updated_stat_get[0].name, update_status)
         self.assertEqual(updated_stat_get[0].id, original_stat_obj.id)
 
-    def case_delete_records(self, refresh_db_before):
+    def case_delete_records(self, rollback_db):
         """ Create new record in ServerStatus table and then delete it."""
         new_status = "NewStatus"
 
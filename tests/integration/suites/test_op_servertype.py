@@ -1,9 +1,8 @@
 from pytest import mark
 
 from tests.integration.helpers.asserts import Asserts
-from tests.integration.helpers.fixtures import refresh_db_before
+from tests.integration.helpers.fixtures import rollback_db
 
-from app import run
 from app.db.models.server_type import ServerType
 from app.db.operations.basic.server_type import ServerTypeOp
 
@@ -15,7 +14,7 @@ class TestServerTypeOp(Asserts):
         Operations on ServerType model.
     """
 
-    def case_add_records(self, refresh_db_before):
+    def case_add_records(self, rollback_db):
         """ Add new records to ServerType table."""
         new_types = ["Type one", "Type two"]
 
@@ -30,7 +29,7 @@ class TestServerTypeOp(Asserts):
             self.assertTrue(isinstance(record, ServerType))
             self.assertEqual(record.name, exp_status)
 
-    def case_get_by_id(self, refresh_db_before):
+    def case_get_by_id(self, rollback_db):
         """ Create test records in ServerType table and get them by id."""
         types_with_id = {"Type one": 1, "Type two": 2}
 
@@ -43,7 +42,7 @@ class TestServerTypeOp(Asserts):
             self.assertEqual(exp_type, type_obj[0].name)
             self.assertEqual(exp_id, type_obj[0].id)
 
-    def case_get_by_name_one_result(self, refresh_db_before):
+    def case_get_by_name_one_result(self, rollback_db):
         """ Create test records in ServerType table and get them by name."""
         types_with_id = {"Type one": 1, "Type two": 2}
 
@@ -56,7 +55,7 @@ class TestServerTypeOp(Asserts):
             self.assertEqual(exp_type, type_obj[0].name)
             self.assertEqual(exp_id, type_obj[0].id)
 
-    def case_update_record(self, refresh_db_before):
+    def case_update_record(self, rollback_db):
         """ Create test record in ServerType table and then update it."""
         original_type = "TypeOrig"
         update_type = "TypeUpdate"
@@ -73,7 +72,7 @@ class TestServerTypeOp(Asserts):
         self.assertEqual(updated_type_get[0].name, update_type)
         self.assertEqual(updated_type_get[0].id, original_type_obj.id)
 
-    def case_delete_records(self, refresh_db_before):
+    def case_delete_records(self, rollback_db):
         """ Create new record in ServerType table and then delete it."""
         new_type = "New type"
 
@@ -1,9 +1,8 @@
 from pytest import mark
 
 from tests.integration.helpers.asserts import Asserts
-from tests.integration.helpers.fixtures import refresh_db_before
+from tests.integration.helpers.fixtures import rollback_db
 
-from app import run
 from app.db.models.tag import Tag
 from app.db.operations.basic.tag import TagOp
 
@@ -15,7 +14,7 @@ class TestTagOp(Asserts):
         Operations on Tag model.
     """
 
-    def case_add_records(self, refresh_db_before):
+    def case_add_records(self, rollback_db):
         """ Add new records to Tag table."""
         new_names = ["tag1", "tag2", "tag3"]
 
@@ -30,7 +29,7 @@ class TestTagOp(Asserts):
             self.assertTrue(isinstance(record, Tag))
             self.assertEqual(record.name, exp_name)
 
-    def case_get_by_id(self, refresh_db_before):
+    def case_get_by_id(self, rollback_db):
         """ Create test records in Tag table and get them by id."""
         names_with_id = {"tag1": 1, "tag2": 2, "tag3": 3}
 
@@ -43,7 +42,7 @@ class TestTagOp(Asserts):
             self.assertEqual(exp_name, tag_obj[0].name)
             self.assertEqual(exp_id, tag_obj[0].id)
 
-    def case_get_by_name_one_result(self, refresh_db_before):
+    def case_get_by_name_one_result(self, rollback_db):
         """ Create test records in Tag table and get them by name."""
         names_with_id = {"tag1": 1, "tag2": 2, "tag3": 3}
 
@@ -56,7 +55,7 @@ class TestTagOp(Asserts):
             self.assertEqual(exp_name, tag_obj[0].name)
             self.assertEqual(exp_id, tag_obj[0].id)
 
-    def case_update_record(self, refresh_db_before):
+    def case_update_record(self, rollback_db):
         """ Create test record in Tag table and then update it."""
         original_name = "tag3"
         update_name = "tag33"
@@ -73,7 +72,7 @@ class TestTagOp(Asserts):
         self.assertEqual(updated_tag_get[0].name, update_name)
         self.assertEqual(updated_tag_get[0].id, original_tag.id)
 
-    def case_delete_records(self, refresh_db_before):
+    def case_delete_records(self, rollback_db):
         """ Create new record in Tag table and then delete it."""
         new_name = "tag1"
 
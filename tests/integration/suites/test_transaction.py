@@ -0,0 +1,82 @@
+from pytest import mark
+from pytest import raises
+
+from tests.integration.helpers.asserts import Asserts
+from tests.integration.helpers.fixtures import truncate_db
+
+from app.extensions import DB
+from app.db.transaction import transaction
+from app.db.exceptions import ServerIpNotFoundError
+from app.db.operations.basic.ip import IpOp
+from app.db.operations.basic.tag import TagOp
+from app.db.operations.basic.server import ServerOp
+from app.db.operations.basic.server_status import ServerStatusOp
+from app.db.operations.basic.server_type import ServerTypeOp
+
+
+@mark.db_operations
+@mark.transaction
+class TestTransaction(Asserts):
+
+    """ Integration tests for transaction context.
+        Many operations committed at once.
+    """
+
+    def case_commit_once(self, truncate_db):
+        """ Provision server in one transaction."""
+        ServerStatusOp.add("Active")
+        ServerTypeOp.add("Physical")
+
+        with transaction():
+            IpOp.add("10.0.0.1")
+            TagOp.add("web")
+            TagOp.add("prod")
+            server = ServerOp.add(
+                "web01", "Active", "Physical", ips=["10.0.0.1"], tags=["web", "prod"]
+            )
+            self.assertEqual(server.id, 1)
+
+        DB.session.remove()
+        server = ServerOp.get(name="web01")[0]
+        self.assertEqual([ip.address for ip in server.ips], ["10.0.0.1"])
+        self.assertEqual(sorted(tag.name for tag in server.tags), ["prod", "web"])
+
+    def case_rollback(self, truncate_db):
+        """ Exception raised in transaction rolls back all operations."""
+        ServerStatusOp.add("Active")
+        ServerTypeOp.add("Physical")
+
+        with raises(ServerIpNotFoundError):
+            with transaction():
+                TagOp.add("web")
+                ServerOp.add("web01", "Active", "Physical", ips=["10.0.0.1"])
+
+        self.assertFalse(TagOp.get())
+        self.assertFalse(ServerOp.get())
+
+    def case_nested_rollback(self, truncate_db):
+        """ Exception raised in nested transaction rolls back
+            only operations of the nested transaction.
+        """
+        with transaction():
+            TagOp.add("web")
+
+            with raises(ServerIpNotFoundError):
+                with transaction():
+                    TagOp.add("prod")
+                    ServerOp.resolve_ips(["10.0.0.1"])
+
+            TagOp.add("db")
+
+        DB.session.remove()
+        self.assertEqual([tag.name for tag in TagOp.get()], ["web", "db"])
+
+    def case_rollback_invalidates_cache(self, truncate_db):
+        """ Rolled back ServerStatus row is not found in cache."""
+        with raises(ValueError):
+            with transaction():
+                ServerStatusOp.add("Active")
+                self.assertEqual(ServerStatusOp.get_id("Active"), 1)
+                raise ValueError("wrong")
+
+        self.assertEqual(ServerStatusOp.get_id("Active"), None)
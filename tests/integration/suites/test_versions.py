@@ -0,0 +1,83 @@
+from pytest import mark
+
+from tests.integration.helpers.asserts import Asserts
+from tests.integration.helpers.fixtures import rollback_db
+from tests.integration.helpers.fixtures import statement_counter
+
+from app.db.transaction import transaction
+from app.db.versions import bump_version
+from app.db.versions import get_versions
+from app.db.versions import version_tag
+from app.db.operations.basic.tag import TagOp
+from app.db.operations.basic.server import ServerOp
+from app.db.operations.basic.server_type import ServerTypeOp
+from app.db.operations.basic.server_status import ServerStatusOp
+
+
+@mark.db_operations
+@mark.versions
+class TestVersions(Asserts):
+    """ Integration tests for change versions of tables."""
+
+    def case_bump(self, rollback_db):
+        """ Increase versions of tables changed by operations."""
+        before = get_versions(["server", "tag"])
+
+        ServerStatusOp.add("Status")
+        ServerTypeOp.add("Type")
+        srv = ServerOp.add("ServerOne", "Status", "Type")
+        ServerOp.update(srv, name="ServerTwo")
+        ServerOp.delete(srv)
+
+        after = get_versions(["server", "tag"])
+        self.assertEqual(after["server"][0], before["server"][0] + 3)
+        self.assertEqual(after["tag"], before["tag"])
+
+    def case_bump_at_commit(self, rollback_db, statement_counter):
+        """ Increase versions once per transaction, at commit,
+            in order of table names.
+        """
+        before = get_versions(["server", "server_status", "tag"])
+
+        with transaction():
+            TagOp.add("web")
+            ServerStatusOp.add("Status")
+            ServerTypeOp.add("Type")
+            ServerOp.add("ServerOne", "Status", "Type", tags=["web"])
+            TagOp.add("db")
+            self.assertEqual(get_versions(["tag"])["tag"], before["tag"])
+
+        after = get_versions(["server", "server_status", "tag"])
+        for table_name in after:
+            self.assertEqual(after[table_name][0], before[table_name][0] + 1)
+
+        updated = [
+            statement
+            for statement in statement_counter.statements
+            if statement.startswith("UPDATE change_version")
+        ]
+        self.assertEqual(len(updated), 4)
+
+    def case_bump_without_row(self, rollback_db, caplog):
+        """ Do not create version of table which has none."""
+        with transaction():
+            bump_version("other")
+
+        self.assertEqual(get_versions(["other"]), {"other": (0, None)})
+        self.assertIn("Table other has no change version row.", caplog.messages)
+
+    def case_rollback(self, rollback_db):
+        """ Roll back version together with changes."""
+        etag, _ = version_tag(["tag"])
+
+        try:
+            with transaction():
+                TagOp.add("web")
+                raise ValueError()
+        except ValueError:
+            pass
+
+        self.assertEqual(version_tag(["tag"])[0], etag)
+
+        TagOp.add("web")
+        self.assertNotEqual(version_tag(["tag"])[0], etag)
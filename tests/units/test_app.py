@@ -0,0 +1,74 @@
+import subprocess
+import sys
+from unittest import TestCase
+
+from app import create_app
+from app.config import Config
+from app.extensions import DB
+
+
+class TestCreateApp(TestCase):
+    """ Unit tests for create_app factory."""
+
+    def test_default_config(self):
+        """ Assumptions:
+                - Config is used by default
+                - extensions are bound to the application
+        """
+        app = create_app()
+
+        self.assertEqual(
+            app.config["SQLALCHEMY_DATABASE_URI"], Config.SQLALCHEMY_DATABASE_URI
+        )
+        self.assertFalse(app.config["SQLALCHEMY_TRACK_MODIFICATIONS"])
+        self.assertIs(app.extensions["sqlalchemy"].db, DB)
+        self.assertIs(app.extensions["migrate"].db, DB)
+        self.assertIn("views.hello", app.view_functions)
+
+    def test_settings(self):
+        """ Assumptions:
+                - settings override values of config object
+                - every call creates new application
+        """
+
+        class OtherConfig(Config):
+            CATALOG_CACHE_TTL = 5
+
+        app = create_app(OtherConfig, SQLALCHEMY_DATABASE_URI="sqlite://")
+
+        self.assertEqual(app.config["SQLALCHEMY_DATABASE_URI"], "sqlite://")
+        self.assertEqual(app.config["CATALOG_CACHE_TTL"], 5)
+        self.assertIsNot(app, create_app())
+
+    def test_debug_endpoints(self):
+        """ Assumptions:
+                - debug endpoints are registered with DEBUG
+                  or DEBUG_ENDPOINTS only
+        """
+
+        def rules(app):
+            return [rule.rule for rule in app.url_map.iter_rules()]
+
+        self.assertNotIn("/debug/pool", rules(create_app()))
+        self.assertNotIn("/debug/slow-queries", rules(create_app()))
+        self.assertIn("/debug/pool", rules(create_app(DEBUG=True)))
+        self.assertIn("/debug/pool", rules(create_app(DEBUG_ENDPOINTS=True)))
+        self.assertIn("/debug/slow-queries", rules(create_app(DEBUG=True)))
+
+    def test_lazy_imports(self):
+        """ Assumptions:
+                - exceptions are imported without Flask and SQLAlchemy
+                - operations are imported without Flask-Migrate
+        """
+        code = (
+            "import sys\n"
+            "import app.db.exceptions\n"
+            "print('flask' in sys.modules, 'sqlalchemy' in sys.modules)\n"
+            "import app.db.operations.basic.server\n"
+            "print('flask_migrate' in sys.modules)\n"
+        )
+        output = subprocess.check_output(
+            [sys.executable, "-W", "ignore", "-c", code], universal_newlines=True
+        )
+
+        self.assertEqual(output.split(), ["False", "False", "False"])
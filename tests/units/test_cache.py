@@ -0,0 +1,146 @@
+from unittest import TestCase
+from unittest import mock
+
+from app import create_app
+from app.db.cache import CatalogCache
+
+
+OP_PATH = "app.db.cache"
+
+
+class TestCatalogCache(TestCase):
+    """ Unit tests for CatalogCache class."""
+
+    def setUp(self):
+        self.mock_model = mock.MagicMock(name="MockModel")
+        self.cache = CatalogCache(self.mock_model)
+
+    @mock.patch(f"{OP_PATH}.DB")
+    def test_get_id_loads_once(self, mock_db):
+        """ Assumptions:
+                - table is loaded on first lookup only
+        """
+        mock_db.session.query.return_value = [(1, "One"), (2, "Two")]
+
+        self.assertEqual(self.cache.get_id("One"), 1)
+        self.assertEqual(self.cache.get_id("Two"), 2)
+        self.assertEqual(self.cache.get_id("One"), 1)
+
+        mock_db.session.query.assert_called_once_with(
+            self.mock_model.id, self.mock_model.name
+        )
+        stats = self.cache.stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["loads"], 1)
+        self.assertEqual(stats["size"], 2)
+
+    @mock.patch(f"{OP_PATH}.DB")
+    def test_get_id_not_found(self, mock_db):
+        """ Assumptions:
+                - name does not exist, table is loaded again to check it
+                - name exists more than once
+        """
+        mock_db.session.query.return_value = [(1, "One"), (2, "Two"), (3, "Two")]
+
+        self.assertEqual(self.cache.get_id("One"), 1)
+        self.assertEqual(self.cache.get_id("Three"), None)
+        self.assertEqual(self.cache.get_id("Two"), None)
+
+        self.assertEqual(mock_db.session.query.call_count, 2)
+        self.assertEqual(self.cache.stats()["misses"], 2)
+
+    @mock.patch(f"{OP_PATH}.DB")
+    def test_invalidate(self, mock_db):
+        """ Assumptions:
+                - table is loaded again after invalidation
+        """
+        mock_db.session.query.return_value = [(1, "One")]
+        self.cache.get_id("One")
+
+        mock_db.session.query.return_value = [(5, "One")]
+        self.cache.invalidate()
+
+        self.assertEqual(self.cache.get_id("One"), 5)
+        self.assertEqual(mock_db.session.query.call_count, 2)
+        self.assertEqual(self.cache.stats()["generation"], 1)
+
+    @mock.patch(f"{OP_PATH}.time")
+    @mock.patch(f"{OP_PATH}.DB")
+    def test_ttl(self, mock_db, mock_time):
+        """ Assumptions:
+                - table is loaded again when data is older than ttl
+        """
+        cache = CatalogCache(self.mock_model, ttl=10)
+        mock_db.session.query.return_value = [(1, "One")]
+
+        mock_time.monotonic.return_value = 100
+        cache.get_id("One")
+        mock_time.monotonic.return_value = 110
+        cache.get_id("One")
+        self.assertEqual(mock_db.session.query.call_count, 1)
+
+        mock_time.monotonic.return_value = 111
+        cache.get_id("One")
+        self.assertEqual(mock_db.session.query.call_count, 2)
+
+    @mock.patch(f"{OP_PATH}.version_column")
+    @mock.patch(f"{OP_PATH}.get_versions")
+    @mock.patch(f"{OP_PATH}.DB")
+    def test_version_row_missing(self, mock_db, mock_get_versions, mock_column):
+        """ Assumptions:
+                - table has no change version row
+                - version is checked on every lookup
+                - table is not loaded again while version does not change
+        """
+        self.mock_model.__tablename__ = "status"
+        cache = CatalogCache(self.mock_model, check_interval=0)
+        mock_db.session.query.return_value = [(1, "One", None)]
+        mock_get_versions.return_value = {"status": (0, None)}
+
+        cache.get_id("One")
+        cache.get_id("One")
+        cache.get_id("One")
+
+        self.assertEqual(mock_db.session.query.call_count, 1)
+        self.assertEqual(mock_get_versions.call_count, 2)
+        self.assertEqual(cache.stats()["hits"], 2)
+
+    @mock.patch(f"{OP_PATH}.version_column")
+    @mock.patch(f"{OP_PATH}.get_versions")
+    @mock.patch(f"{OP_PATH}.DB")
+    def test_version_empty_table(self, mock_db, mock_get_versions, mock_column):
+        """ Assumptions:
+                - table is empty, its version is read with separate query
+                - table is loaded again when version changes
+        """
+        self.mock_model.__tablename__ = "status"
+        cache = CatalogCache(self.mock_model, check_interval=0)
+        mock_db.session.query.return_value = list()
+        mock_get_versions.return_value = {"status": (3, None)}
+
+        self.assertEqual(cache.get_id("One"), None)
+        self.assertEqual(cache.loaded_version, 3)
+
+        mock_db.session.query.return_value = [(1, "One", 4)]
+        mock_get_versions.return_value = {"status": (4, None)}
+        self.assertEqual(cache.get_id("One"), 1)
+        self.assertEqual(cache.loaded_version, 4)
+        self.assertEqual(mock_db.session.query.call_count, 2)
+
+    def test_settings(self):
+        """ Assumptions:
+                - ttl and check interval are taken from config
+                  of the current application, unless given
+                - without application data never expires
+        """
+        app = create_app(
+            SQLALCHEMY_DATABASE_URI="sqlite://",
+            CATALOG_CACHE_TTL=7,
+            CATALOG_CACHE_CHECK_INTERVAL=2.0,
+        )
+        self.assertEqual(self.cache.settings(), (None, None))
+        with app.app_context():
+            self.assertEqual(self.cache.settings(), (7, 2.0))
+            cache = CatalogCache(self.mock_model, ttl=10, check_interval=0)
+            self.assertEqual(cache.settings(), (10, 0))
@@ -0,0 +1,46 @@
+import os
+from unittest import TestCase
+from unittest import mock
+
+from app.config import Config
+from app.config import ProductionConfig
+from app.config import environ
+from app.config import get_config
+
+
+class TestConfig(TestCase):
+    """ Unit tests for configuration classes."""
+
+    def test_environ(self):
+        """ Assumptions:
+                - default is used when variable is not set
+                - variable is converted to type of default
+        """
+        variables = {
+            "SMT_SIZE": "7",
+            "SMT_TIMEOUT": "2.5",
+            "SMT_FLAG": "yes",
+            "SMT_OFF": "0",
+            "SMT_NAME": "smt-worker",
+        }
+        with mock.patch.dict(os.environ, variables):
+            self.assertEqual(environ("SIZE", 5), 7)
+            self.assertEqual(environ("TIMEOUT", 1.0), 2.5)
+            self.assertIs(environ("FLAG", False), True)
+            self.assertIs(environ("OFF", True), False)
+            self.assertEqual(environ("NAME", "smt"), "smt-worker")
+            self.assertEqual(environ("MISSING", 3), 3)
+
+    def test_get_config(self):
+        """ Assumptions:
+                - config is chosen by name, or SMT_CONFIG variable
+                - Config is used by default
+                - unknown name raises ValueError
+        """
+        with mock.patch.dict(os.environ, {"SMT_CONFIG": "production"}):
+            self.assertIs(get_config(), ProductionConfig)
+        with mock.patch.dict(os.environ, clear=True):
+            self.assertIs(get_config(), Config)
+
+        with self.assertRaises(ValueError):
+            get_config("staging")
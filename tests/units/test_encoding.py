@@ -0,0 +1,118 @@
+import gzip
+import json
+import zlib
+from collections import namedtuple
+from unittest import TestCase
+
+import msgpack
+
+from app import create_app
+from app.encoding import MSGPACK
+from app.encoding import NDJSON
+from app.encoding import compress_chunks
+from app.encoding import decode_msgpack
+from app.encoding import row_chunks
+from app.encoding import stream_response
+
+
+Row = namedtuple("Row", ("id", "status", "tags"))
+
+BATCHES = [
+    [Row(1, "Active", ("web", "db")), Row(2, "Active", ())],
+    [Row(3, None, ("db", "prod"))],
+]
+
+RECORDS = [
+    {"id": 1, "status": "Active", "tags": ["web", "db"]},
+    {"id": 2, "status": "Active", "tags": []},
+    {"id": 3, "status": None, "tags": ["db", "prod"]},
+]
+
+
+class TestRowChunks(TestCase):
+    """ Unit tests for row formats."""
+
+    def test_ndjson(self):
+        """ Assumptions:
+                - one chunk per batch, one JSON object per line
+        """
+        chunks = list(row_chunks(BATCHES, NDJSON, Row._fields))
+
+        self.assertEqual(len(chunks), 2)
+        lines = b"".join(chunks).decode("utf-8").splitlines()
+        self.assertEqual([json.loads(line) for line in lines], RECORDS)
+
+    def test_msgpack(self):
+        """ Assumptions:
+                - header, then one chunk per batch
+                - batches carry only new dictionary strings
+                - strings of other fields are not encoded
+        """
+        chunks = list(row_chunks(BATCHES, MSGPACK, Row._fields, ("status", "tags")))
+
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(
+            msgpack.unpackb(chunks[0]), {"fields": ["id", "status", "tags"]}
+        )
+        self.assertEqual(
+            msgpack.unpackb(chunks[1]),
+            {
+                "dictionary": ["Active", "web", "db"],
+                "rows": [[1, 0, [1, 2]], [2, 0, []]],
+            },
+        )
+        self.assertEqual(
+            msgpack.unpackb(chunks[2]),
+            {"dictionary": ["prod"], "rows": [[3, None, [2, 3]]]},
+        )
+        self.assertEqual(decode_msgpack(b"".join(chunks), ("status", "tags")), RECORDS)
+
+        chunks = list(row_chunks(BATCHES, MSGPACK, Row._fields))
+        self.assertEqual(decode_msgpack(b"".join(chunks), ()), RECORDS)
+
+
+class TestCompression(TestCase):
+    """ Unit tests for response compression."""
+
+    def setUp(self):
+        self.app = create_app(
+            SQLALCHEMY_DATABASE_URI="sqlite://", COMPRESSION_THRESHOLD=10
+        )
+
+    def test_compress_chunks(self):
+        """ Assumptions:
+                - every chunk can be decoded when it is received
+        """
+        chunks = [b"first ", b"second ", b"third"]
+
+        compressed = list(compress_chunks(chunks, "gzip", 6))
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        self.assertEqual(decompressor.decompress(compressed[0]), b"first ")
+        self.assertEqual(gzip.decompress(b"".join(compressed)), b"".join(chunks))
+
+        compressed = b"".join(compress_chunks(chunks, "deflate", 1))
+        self.assertEqual(zlib.decompress(compressed), b"".join(chunks))
+
+    def test_stream_response(self):
+        """ Assumptions:
+                - response below threshold is sent whole, uncompressed
+                - longer response is streamed with accepted compression
+        """
+        headers = {"Accept-Encoding": "deflate;q=0.5, gzip"}
+        with self.app.test_request_context(headers=headers):
+            response = stream_response(iter([b"short"]), NDJSON)
+            self.assertFalse(response.is_streamed)
+            self.assertIsNone(response.content_encoding)
+            self.assertEqual(response.get_data(), b"short")
+            self.assertIn("Accept-Encoding", response.vary)
+
+            response = stream_response(iter([b"longer ", b"response"]), NDJSON)
+            self.assertTrue(response.is_streamed)
+            self.assertEqual(response.content_encoding, "gzip")
+            self.assertEqual(gzip.decompress(response.get_data()), b"longer response")
+
+        with self.app.test_request_context():
+            response = stream_response(iter([b"longer ", b"response"]), NDJSON)
+            self.assertTrue(response.is_streamed)
+            self.assertIsNone(response.content_encoding)
+            self.assertEqual(response.get_data(), b"longer response")
@@ -0,0 +1,158 @@
+import json
+from unittest import TestCase
+
+from sqlalchemy import create_engine
+
+from app.db.exceptions import TagNameNotValidError
+from app.db.instrumentation import LatencyHistogram
+from app.db.instrumentation import OpInstrumentation
+
+
+ENGINE = create_engine("sqlite://")
+
+
+class ExampleOp:
+    """ Op class instrumented in tests."""
+
+    @classmethod
+    def get(cls, count=1):
+        for _ in range(count):
+            ENGINE.execute("SELECT 1")
+        return count
+
+    @classmethod
+    def add(cls, name):
+        raise TagNameNotValidError("Field: name must be String.")
+
+    @classmethod
+    def iter(cls, count):
+        for number in range(count):
+            ENGINE.execute("SELECT 1")
+            yield number
+
+    @staticmethod
+    def helper():
+        return "helper"
+
+
+ORIGINAL_GET = ExampleOp.__dict__["get"].__func__
+
+
+class TestLatencyHistogram(TestCase):
+    """ Unit tests for LatencyHistogram class."""
+
+    def test_buckets(self):
+        """ Assumptions:
+                - values below 128 have own buckets
+                - bigger values keep 1/64 relative precision
+        """
+        for value in (0, 1, 63, 64, 127):
+            self.assertEqual(LatencyHistogram.bucket_range(value), (value, value))
+
+        for value in (128, 1000, 123456, 10 ** 9, LatencyHistogram.MAX_VALUE):
+            index = LatencyHistogram.bucket_index(value)
+            lowest, highest = LatencyHistogram.bucket_range(index)
+            self.assertLessEqual(lowest, value)
+            self.assertGreaterEqual(highest, value)
+            self.assertLessEqual(highest - lowest, value / 64)
+
+    def test_percentile(self):
+        """ Assumptions:
+                - percentiles are computed from buckets
+                - values above maximum are clamped
+        """
+        histogram = LatencyHistogram()
+        for value in range(1, 1001):
+            histogram.record(value)
+        histogram.record(10 ** 12)
+
+        self.assertEqual(histogram.count, 1001)
+        self.assertEqual(histogram.min, 1)
+        self.assertEqual(histogram.max, LatencyHistogram.MAX_VALUE)
+        self.assertAlmostEqual(histogram.percentile(50), 500, delta=500 / 64)
+        self.assertAlmostEqual(histogram.percentile(99), 990, delta=990 / 64)
+        self.assertEqual(histogram.percentile(100), LatencyHistogram.MAX_VALUE)
+        self.assertEqual(sum(count for _, count in histogram.buckets()), 1001)
+
+    def test_empty(self):
+        """ Assumptions:
+                - empty histogram has no percentiles
+        """
+        stats = LatencyHistogram().stats()
+
+        self.assertEqual(stats["count"], 0)
+        self.assertIsNone(stats["p99"])
+
+
+class TestOpInstrumentation(TestCase):
+    """ Unit tests for OpInstrumentation class."""
+
+    def setUp(self):
+        self.instrumentation = OpInstrumentation()
+        self.instrumentation.enable([ExampleOp])
+        self.addCleanup(self.instrumentation.disable)
+
+    def test_calls(self):
+        """ Assumptions:
+                - calls, latency and statements per call are recorded
+                - static methods are not instrumented
+        """
+        self.assertEqual(ExampleOp.get(2), 2)
+        ExampleOp.get(0)
+        self.assertEqual(ExampleOp.helper(), "helper")
+
+        stats = self.instrumentation.stats()
+        self.assertEqual(list(stats), ["ExampleOp.get"])
+        self.assertEqual(stats["ExampleOp.get"]["calls"], 2)
+        self.assertEqual(stats["ExampleOp.get"]["errors"], 0)
+        self.assertEqual(stats["ExampleOp.get"]["statements_mean"], 1)
+        self.assertEqual(stats["ExampleOp.get"]["statements_max"], 2)
+        self.assertEqual(stats["ExampleOp.get"]["latency_us"]["count"], 2)
+
+    def test_errors(self):
+        """ Assumptions:
+                - errors are counted by exception class
+        """
+        for _ in range(2):
+            with self.assertRaises(TagNameNotValidError):
+                ExampleOp.add(1)
+
+        stats = self.instrumentation.stats()["ExampleOp.add"]
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["errors"], 2)
+        self.assertEqual(stats["errors_by_class"], {"TagNameNotValidError": 2})
+
+    def test_generator(self):
+        """ Assumptions:
+                - generator call is recorded when iteration ends,
+                  also when it is stopped early
+        """
+        self.assertEqual(list(ExampleOp.iter(3)), [0, 1, 2])
+        iterator = ExampleOp.iter(3)
+        next(iterator)
+        iterator.close()
+
+        stats = self.instrumentation.stats()["ExampleOp.iter"]
+        self.assertEqual(stats["calls"], 2)
+        self.assertEqual(stats["statements_max"], 3)
+        self.assertEqual(stats["statements_mean"], 2)
+
+    def test_disable(self):
+        """ Assumptions:
+                - original methods are restored
+                - recorded metrics are kept, until reset
+        """
+        ExampleOp.get()
+        self.instrumentation.disable()
+        ExampleOp.get()
+
+        self.assertFalse(self.instrumentation.enabled)
+        self.assertIs(ExampleOp.__dict__["get"].__func__, ORIGINAL_GET)
+        self.assertEqual(self.instrumentation.stats()["ExampleOp.get"]["calls"], 1)
+
+        dump = json.loads(self.instrumentation.dump())
+        self.assertFalse(dump["enabled"])
+        self.assertEqual(list(dump["operations"]), ["ExampleOp.get"])
+
+        self.instrumentation.reset()
+        self.assertEqual(self.instrumentation.stats(), dict())
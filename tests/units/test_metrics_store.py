@@ -0,0 +1,91 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from app.metrics.store import INITIAL_SIZE
+from app.metrics.store import MmapStore
+from app.metrics.store import ProcessStores
+from app.metrics.store import read_file
+
+
+class TestMmapStore(TestCase):
+    """ Unit tests for MmapStore class."""
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "metrics_1.db")
+
+    def test_values(self):
+        """ Assumptions:
+                - values are added and set by key
+                - values are read from the file by other process,
+                  and by the store opened again
+        """
+        store = MmapStore(self.path)
+        store.add("requests", 1)
+        store.add("requests", 2.5)
+        store.set("connections", 4)
+        store.set("connections", 3)
+
+        self.assertEqual(
+            sorted(store.items()), [("connections", 3.0), ("requests", 3.5)]
+        )
+        self.assertEqual(sorted(read_file(self.path)), sorted(store.items()))
+        store.close()
+
+        store = MmapStore(self.path)
+        store.add("requests", 1)
+        self.assertEqual(dict(store.items())["requests"], 4.5)
+        store.close()
+
+    def test_grow(self):
+        """ Assumptions:
+                - file grows when entries do not fit in it
+        """
+        store = MmapStore(self.path)
+        keys = [f"metric_{'x' * 100}_{number}" for number in range(1000)]
+        for number, key in enumerate(keys):
+            store.set(key, number)
+
+        self.assertGreater(os.path.getsize(self.path), INITIAL_SIZE)
+        values = dict(read_file(self.path))
+        self.assertEqual(len(values), 1000)
+        self.assertEqual(values[keys[999]], 999)
+        store.close()
+
+
+class TestProcessStores(TestCase):
+    """ Unit tests for ProcessStores class."""
+
+    def test_memory(self):
+        """ Assumptions:
+                - without directory values are kept in memory
+        """
+        stores = ProcessStores()
+        stores.store().add("requests", 1)
+        stores.store(live=True).add("in_flight", 2)
+
+        self.assertEqual(stores.collect(), {"requests": 1.0, "in_flight": 2.0})
+
+    def test_directory(self):
+        """ Assumptions:
+                - values of all processes files are summed
+                - live values of dead process are removed
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            for pid in (101, 102):
+                store = MmapStore(os.path.join(directory, f"metrics_{pid}.db"))
+                store.add("requests", pid)
+                store.close()
+                live_store = MmapStore(os.path.join(directory, f"live_{pid}.db"))
+                live_store.add("in_flight", 1)
+                live_store.close()
+
+            stores = ProcessStores(directory)
+            stores.store().add("requests", 1)
+            self.assertEqual(stores.collect(), {"requests": 204.0, "in_flight": 2.0})
+
+            stores.mark_process_dead(101)
+            self.assertEqual(stores.collect(), {"requests": 204.0, "in_flight": 1.0})
+            stores.store().close()
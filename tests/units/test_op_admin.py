@@ -134,10 +134,38 @@ class TestOpAdmin(TestCase):
         exp_calls = [mock.call(id=test_id, name=test_name), mock.call().all()]
         mock_admin.query.filter_by.assert_has_calls(exp_calls)
 
+    @mock.patch(f"{OP_PATH}.basic.admin.AdminOp.validate_name")
+    @mock.patch(f"{OP_PATH}.basic.admin.Admin")
+    def test_get_many(self, mock_admin, mock_val_name):
+        """ Assumptions:
+                - list of name values given
+        """
+        test_values = ["Admin One", "Admin Two"]
+        result = AdminOp.get_many(test_values)
+
+        self.assertEqual(mock_val_name.call_count, len(test_values))
+        mock_admin.name.in_.assert_called_once_with(test_values)
+        mock_admin.query.filter.assert_called_once_with(mock_admin.name.in_())
+        self.assertEqual(result, mock_admin.query.filter().all())
+
+    @mock.patch(f"{OP_PATH}.basic.admin.AdminOp.validate_name")
+    @mock.patch(f"{OP_PATH}.basic.admin.Admin")
+    def test_get_many_empty(self, mock_admin, mock_val_name):
+        """ Assumptions:
+                - empty list given
+        """
+        result = AdminOp.get_many(list())
+
+        self.assertEqual(result, list())
+        self.assertFalse(mock_val_name.called)
+        self.assertFalse(mock_admin.query.filter.called)
+
+    @mock.patch(f"{OP_PATH}.basic.admin.commit")
     @mock.patch(f"{OP_PATH}.basic.admin.DB")
     @mock.patch(f"{OP_PATH}.basic.admin.AdminOp.validate_name")
     @mock.patch(f"{OP_PATH}.basic.admin.Admin")
-    def test_add(self, mock_admin, mock_val_name, mock_db):
+    @mock.patch(f"{OP_PATH}.basic.admin.bump_version")
+    def test_add(self, mock_bump, mock_admin, mock_val_name, mock_db, mock_commit):
         """ Assumptions:
                 - add method run
         """
@@ -151,14 +179,18 @@ class TestOpAdmin(TestCase):
 
         self.assertTrue(mock_val_name.called)
 
-        db_exp_calls = [mock.call.session.add(new_admin), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.add(new_admin)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("admin")
 
+    @mock.patch(f"{OP_PATH}.basic.admin.commit")
     @mock.patch(f"{OP_PATH}.basic.admin.DB")
     @mock.patch(f"{OP_PATH}.basic.admin.AdminOp.validate_name")
     @mock.patch(f"{OP_PATH}.basic.admin.Admin")
-    def test_update(self, mock_admin, mock_val_name, mock_db):
+    @mock.patch(f"{OP_PATH}.basic.admin.bump_version")
+    def test_update(self, mock_bump, mock_admin, mock_val_name, mock_db, mock_commit):
         """ Assumptions:
                 - update method run
         """
@@ -169,16 +201,17 @@ class TestOpAdmin(TestCase):
 
         self.assertTrue(mock_val_name.called)
 
-        db_exp_calls = [
-            mock.call.session.add(updated_admin),
-            mock.call.session.commit(),
-        ]
+        db_exp_calls = [mock.call.session.add(updated_admin)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("admin")
 
+    @mock.patch(f"{OP_PATH}.basic.admin.commit")
     @mock.patch(f"{OP_PATH}.basic.admin.DB")
     @mock.patch(f"{OP_PATH}.basic.admin.Admin")
-    def test_delete(self, mock_admin, mock_db):
+    @mock.patch(f"{OP_PATH}.basic.admin.bump_version")
+    def test_delete(self, mock_bump, mock_admin, mock_db, mock_commit):
         """ Assumptions:
                 - delete method run
         """
@@ -186,6 +219,8 @@ class TestOpAdmin(TestCase):
 
         AdminOp.delete(admin_obj)
 
-        db_exp_calls = [mock.call.session.delete(admin_obj), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.delete(admin_obj)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("admin")
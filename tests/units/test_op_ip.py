@@ -4,6 +4,7 @@ from unittest import mock
 from app.db.operations.basic.ip import IpOp
 from app.db.exceptions import IpIdNotValidError
 from app.db.exceptions import IpAddressNotValidError
+from app.db.exceptions import IpNetworkNotValidError
 from app.db.exceptions import IpError
 
 
@@ -39,9 +40,9 @@ class TestOpIp(TestCase):
         with self.assertRaisesRegex(IpAddressNotValidError, "must be String"):
             IpOp.validate_address(address)
 
-    def test_validate_address_regex_not_match(self):
+    def test_validate_address_not_valid(self):
         """ Assumptions:
-                - given address does not match respective regex for ip
+                - given address is not valid IPv4 or IPv6 address
         """
         wrong_addresses = [
             "0000.0.0.0",
@@ -52,22 +53,69 @@ class TestOpIp(TestCase):
             "0..0.0",
             "0.0..0",
             "0.0.0..",
+            "256.1.1.1",
+            "1.1.1",
+            "1.1.1.1/32",
+            "1::1::1",
         ]
         for wrong_address in wrong_addresses:
-            with self.assertRaisesRegex(IpAddressNotValidError, "does not match regex"):
+            with self.assertRaisesRegex(IpAddressNotValidError, "not valid IP address"):
                 IpOp.validate_address(wrong_address)
 
-    def test_validate_address_regex_match(self):
+    def test_validate_address_valid(self):
         """ Assumptions:
-                - given correct IP address match regex.
+                - given address is correct IPv4 or IPv6 address
         """
-        good_addresses = ["1.1.1.1", "11.11.11.11", "111.111.111.111"]
+        good_addresses = ["1.1.1.1", "11.11.11.11", "111.111.111.111", "::1", "fe80::1"]
         for good_address in good_addresses:
             try:
                 IpOp.validate_address(good_address)
             except IpAddressNotValidError:
                 self.fail("IpAddressNotValidError raised.")
 
+    def test_normalize_address(self):
+        """ Assumptions:
+                - given addresses are valid, IPv6 one is not normalized
+        """
+        self.assertEqual(IpOp.normalize_address("10.0.0.1"), "10.0.0.1")
+        self.assertEqual(IpOp.normalize_address("FE80:0:0::0001"), "fe80::1")
+
+    def test_validate_network_not_valid(self):
+        """ Assumptions:
+                - given network is not String or is not valid CIDR network
+        """
+        with self.assertRaisesRegex(IpNetworkNotValidError, "must be String"):
+            IpOp.validate_network(1)
+
+        for wrong_network in ["10.0.0.0/33", "10.0.0/8", "network"]:
+            with self.assertRaisesRegex(IpNetworkNotValidError, "not valid CIDR"):
+                IpOp.validate_network(wrong_network)
+
+    def test_network_range(self):
+        """ Assumptions:
+                - given networks are valid, with or without host bits
+        """
+        self.assertEqual(
+            IpOp.network_range("10.20.0.0/16"), ("10.20.0.0", "10.20.255.255")
+        )
+        self.assertEqual(
+            IpOp.network_range("10.20.1.1/24"), ("10.20.1.0", "10.20.1.255")
+        )
+        self.assertEqual(IpOp.network_range("fe80::/120"), ("fe80::", "fe80::ff"))
+
+    @mock.patch(f"{OP_PATH}.basic.ip.IpOp.network_filter")
+    @mock.patch(f"{OP_PATH}.basic.ip.Ip")
+    def test_get_in_network(self, mock_ip, mock_net_filter):
+        """ Assumptions:
+                - get_in_network method run
+        """
+        result = IpOp.get_in_network("10.20.0.0/16")
+
+        mock_net_filter.assert_called_once_with("10.20.0.0/16")
+        mock_ip.query.filter.assert_called_once_with(mock_net_filter())
+        mock_ip.query.filter().order_by.assert_called_once_with(mock_ip.address)
+        self.assertEqual(result, mock_ip.query.filter().order_by().all())
+
     @mock.patch(f"{OP_PATH}.basic.ip.IpOp.validate_address")
     @mock.patch(f"{OP_PATH}.basic.ip.IpOp.validate_id")
     @mock.patch(f"{OP_PATH}.basic.ip.Ip")
@@ -124,47 +172,86 @@ class TestOpIp(TestCase):
         exp_calls = [mock.call(id=test_id, address=test_address), mock.call().all()]
         mock_ip.query.filter_by.assert_has_calls(exp_calls)
 
-    @mock.patch(f"{OP_PATH}.basic.ip.DB")
     @mock.patch(f"{OP_PATH}.basic.ip.IpOp.validate_address")
     @mock.patch(f"{OP_PATH}.basic.ip.Ip")
-    def test_add(self, mock_ip, mock_val_address, mock_db):
+    def test_get_many(self, mock_ip, mock_val_address):
+        """ Assumptions:
+                - list of address values given
+        """
+        test_values = ["11.11.11.11", "22.22.22.22"]
+        result = IpOp.get_many(test_values)
+
+        self.assertEqual(mock_val_address.call_count, len(test_values))
+        mock_ip.address.in_.assert_called_once_with(test_values)
+        mock_ip.query.filter.assert_called_once_with(mock_ip.address.in_())
+        self.assertEqual(result, mock_ip.query.filter().all())
+
+    @mock.patch(f"{OP_PATH}.basic.ip.IpOp.validate_address")
+    @mock.patch(f"{OP_PATH}.basic.ip.Ip")
+    def test_get_many_empty(self, mock_ip, mock_val_address):
+        """ Assumptions:
+                - empty list given
+        """
+        result = IpOp.get_many(list())
+
+        self.assertEqual(result, list())
+        self.assertFalse(mock_val_address.called)
+        self.assertFalse(mock_ip.query.filter.called)
+
+    @mock.patch(f"{OP_PATH}.basic.ip.commit")
+    @mock.patch(f"{OP_PATH}.basic.ip.DB")
+    @mock.patch(f"{OP_PATH}.basic.ip.IpOp.normalize_address")
+    @mock.patch(f"{OP_PATH}.basic.ip.Ip")
+    @mock.patch(f"{OP_PATH}.basic.ip.bump_version")
+    def test_add(self, mock_bump, mock_ip, mock_norm_address, mock_db, mock_commit):
         """ Assumptions:
                 - add method run
         """
-        new_name = "Test Name"
-        new_ip = IpOp.add(new_name)
+        new_address = "FE80::1"
+        mock_norm_address.return_value = "fe80::1"
+        new_ip = IpOp.add(new_address)
 
-        exp_calls = [mock.call(new_name)]
+        exp_calls = [mock.call("fe80::1")]
         mock_ip.assert_has_calls(exp_calls)
 
         self.assertEqual(new_ip, mock_ip())
-        self.assertTrue(mock_val_address.called)
+        mock_norm_address.assert_called_once_with(new_address)
 
-        db_exp_calls = [mock.call.session.add(new_ip), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.add(new_ip)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("ip")
 
+    @mock.patch(f"{OP_PATH}.basic.ip.commit")
     @mock.patch(f"{OP_PATH}.basic.ip.DB")
-    @mock.patch(f"{OP_PATH}.basic.ip.IpOp.validate_address")
+    @mock.patch(f"{OP_PATH}.basic.ip.IpOp.normalize_address")
     @mock.patch(f"{OP_PATH}.basic.ip.Ip")
-    def test_update(self, mock_ip, mock_val_address, mock_db):
+    @mock.patch(f"{OP_PATH}.basic.ip.bump_version")
+    def test_update(self, mock_bump, mock_ip, mock_norm_address, mock_db, mock_commit):
         """ Assumptions:
                 - update method run
         """
-        new_name = "Test Name"
+        new_address = "FE80::1"
+        mock_norm_address.return_value = "fe80::1"
         ip_obj = mock_ip()
 
-        updated_ip = IpOp.update(ip_obj, new_name)
+        updated_ip = IpOp.update(ip_obj, new_address)
 
-        self.assertTrue(mock_val_address.called)
+        mock_norm_address.assert_called_once_with(new_address)
+        self.assertEqual(updated_ip.address, "fe80::1")
 
-        db_exp_calls = [mock.call.session.add(updated_ip), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.add(updated_ip)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("ip")
 
+    @mock.patch(f"{OP_PATH}.basic.ip.commit")
     @mock.patch(f"{OP_PATH}.basic.ip.DB")
     @mock.patch(f"{OP_PATH}.basic.ip.Ip")
-    def test_delete(self, mock_ip, mock_db):
+    @mock.patch(f"{OP_PATH}.basic.ip.bump_version")
+    def test_delete(self, mock_bump, mock_ip, mock_db, mock_commit):
         """ Assumptions:
                 - delete method run
         """
@@ -172,6 +259,8 @@ class TestOpIp(TestCase):
 
         IpOp.delete(ip_obj)
 
-        db_exp_calls = [mock.call.session.delete(ip_obj), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.delete(ip_obj)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("ip")
@@ -4,11 +4,17 @@ import string
 from unittest import TestCase
 from unittest import mock
 
+from app.db.models.server import server_ip
+from app.db.models.server import server_tag
+from app.db.models.server import server_admin
 from app.db.operations.basic.server import ServerOp
 
 from app.db.exceptions import ServerIdNotValidError
 from app.db.exceptions import ServerNameNotValidError
 from app.db.exceptions import ServerDescriptionNotValidError
+from app.db.exceptions import ServerLoadNotValidError
+from app.db.exceptions import ServerLimitNotValidError
+from app.db.exceptions import ServerFieldsNotValidError
 from app.db.exceptions import ServerStatusNotFoundError
 from app.db.exceptions import ServerTypeNotFoundError
 from app.db.exceptions import ServerIpNotFoundError
@@ -89,6 +95,63 @@ class TestServerOp(TestCase):
             ):
                 ServerOp.validate_name(wrong_char)
 
+    def test_validate_limit_positive(self):
+        """ Assumptions:
+                - given limit is Integer greater than 0
+        """
+        try:
+            ServerOp.validate_limit(1)
+        except ServerLimitNotValidError:
+            self.fail("ServerLimitNotValidError raised.")
+
+    def test_validate_limit_negative(self):
+        """ Assumptions:
+                - given limit is not Integer or is lower than 1
+        """
+        with self.assertRaisesRegex(ServerLimitNotValidError, "must be Integer"):
+            ServerOp.validate_limit("1")
+
+        with self.assertRaisesRegex(ServerLimitNotValidError, "greater than 0"):
+            ServerOp.validate_limit(0)
+
+    def test_validate_fields_positive(self):
+        """ Assumptions:
+                - given fields are known column and collection fields
+        """
+        try:
+            ServerOp.validate_fields(["id", "name", "status", "tags"])
+            ServerOp.validate_fields(("type", "ips", "admins", "description"))
+        except ServerFieldsNotValidError:
+            self.fail("ServerFieldsNotValidError raised.")
+
+    def test_validate_fields_negative(self):
+        """ Assumptions:
+                - given fields are not List, are empty or unknown
+        """
+        with self.assertRaisesRegex(ServerFieldsNotValidError, "non-empty List"):
+            ServerOp.validate_fields("name")
+
+        with self.assertRaisesRegex(ServerFieldsNotValidError, "non-empty List"):
+            ServerOp.validate_fields(list())
+
+        with self.assertRaisesRegex(
+            ServerFieldsNotValidError, "unknown fields: status_id, servers."
+        ):
+            ServerOp.validate_fields(["name", "status_id", "servers"])
+
+    def test_row_type(self):
+        """ Assumptions:
+                - records are namedtuples without instance dict
+                - record type is created once per fields
+        """
+        row_type = ServerOp.row_type(("id", "name"))
+
+        self.assertIs(ServerOp.row_type(("id", "name")), row_type)
+        row = row_type(id=1, name="Name")
+        self.assertEqual(row._fields, ("id", "name"))
+        self.assertEqual((row.id, row.name), (1, "Name"))
+        self.assertFalse(hasattr(row, "__dict__"))
+
     def test_validate_description_positive(self):
         """ Assumptions:
                 - given description is string with length >= 1 and <= 60
@@ -138,63 +201,122 @@ class TestServerOp(TestCase):
             ):
                 ServerOp.validate_description(wrong_char)
 
+    def test_load_options_none(self):
+        """ Assumptions:
+                - load is None or "none"
+        """
+        self.assertEqual(ServerOp.load_options(None), list())
+        self.assertEqual(ServerOp.load_options("none"), list())
+
+    @mock.patch(f"{OP_PATH}.Server")
+    def test_load_options_strategy(self, mock_server):
+        """ Assumptions:
+                - load is name of the loading strategy
+        """
+        for load in ("selectin", "joined", "subquery"):
+            mock_strategy = mock.MagicMock()
+            with mock.patch.dict(ServerOp.LOAD_STRATEGIES, {load: mock_strategy}):
+                options = ServerOp.load_options(load)
+
+            exp_calls = [
+                mock.call(mock_server.ips),
+                mock.call(mock_server.tags),
+                mock.call(mock_server.admins),
+            ]
+            mock_strategy.assert_has_calls(exp_calls)
+            self.assertEqual(options, [mock_strategy()] * 3)
+
+    @mock.patch(f"{OP_PATH}.selectinload")
+    @mock.patch(f"{OP_PATH}.Server")
+    def test_load_options_collections(self, mock_server, mock_selectin):
+        """ Assumptions:
+                - load is list of collections names
+        """
+        options = ServerOp.load_options(["admins", "ips"])
+
+        exp_calls = [mock.call(mock_server.ips), mock.call(mock_server.admins)]
+        self.assertEqual(mock_selectin.call_args_list, exp_calls)
+        self.assertEqual(len(options), 2)
+
+    def test_load_options_not_valid(self):
+        """ Assumptions:
+                - load is unknown strategy, contains unknown collection
+                  or has wrong type
+        """
+        with self.assertRaisesRegex(ServerLoadNotValidError, "must be one of"):
+            ServerOp.load_options("lazy")
+
+        with self.assertRaisesRegex(ServerLoadNotValidError, "unknown collections"):
+            ServerOp.load_options(["ips", "status"])
+
+        with self.assertRaisesRegex(ServerLoadNotValidError, "String or List"):
+            ServerOp.load_options(1)
+
+    @mock.patch(f"{OP_PATH}.Server")
+    @mock.patch(f"{OP_PATH}.ServerOp.load_options")
+    def test_get_with_load(self, mock_load_opts, mock_server):
+        """ Assumptions:
+                - used load parameter
+        """
+        mock_load_opts.return_value = ["opt_one", "opt_two"]
+
+        result = ServerOp.get(load="selectin")
+
+        mock_load_opts.assert_called_once_with("selectin")
+        mock_server.query.filter_by().options.assert_called_once_with(
+            "opt_one", "opt_two"
+        )
+        self.assertEqual(result, mock_server.query.filter_by().options().all())
+
     @mock.patch(f"{OP_PATH}.ServerStatusOp")
     def test_resolve_status_positive(self, mock_status_op):
         """ Assumptions:
-                - ServerStatusOp.get() returns one record
+                - ServerStatusOp.get_id() returns ID of one record
         """
-        mock_status = mock.MagicMock()
-        mock_status.id = 1
-        mock_status_op.get.return_value = [mock_status]
+        mock_status_op.get_id.return_value = 1
 
         status_id = ServerOp.resolve_status("status_name")
 
-        self.assertEqual(mock_status.id, status_id)
-        mock_status_get_calls = [mock.call(name="status_name")]
-
-        mock_status_op.get.assert_has_calls(mock_status_get_calls)
+        self.assertEqual(status_id, 1)
+        mock_status_op.get_id.assert_called_once_with("status_name")
+        self.assertFalse(mock_status_op.get.called)
 
     @mock.patch(f"{OP_PATH}.ServerStatusOp")
     def test_resolve_status_not_found(self, mock_status_op):
         """ Assumptions:
-                - ServerStatusOp.get() returns no records
+                - ServerStatusOp.get_id() does not find the record
         """
-        mock_status_op.get.return_value = list()
+        mock_status_op.get_id.return_value = None
 
         with self.assertRaisesRegex(ServerStatusNotFoundError, "Not found"):
             ServerOp.resolve_status("status_name")
 
-        mock_status_get_calls = [mock.call(name="status_name")]
-        mock_status_op.get.assert_has_calls(mock_status_get_calls)
+        mock_status_op.get_id.assert_called_once_with("status_name")
 
     @mock.patch(f"{OP_PATH}.ServerTypeOp")
     def test_resolve_type_positive(self, mock_type_op):
         """ Assumptions:
-                ServerTypeOp.get() returns one record
+                ServerTypeOp.get_id() returns ID of one record
         """
-        mock_type = mock.MagicMock()
-        mock_type.id = 1
-        mock_type_op.get.return_value = [mock_type]
-
-        status_id = ServerOp.resolve_type("TypeName")
+        mock_type_op.get_id.return_value = 1
 
-        self.assertEqual(mock_type.id, status_id)
-        mock_status_get_calls = [mock.call(name="TypeName")]
+        type_id = ServerOp.resolve_type("TypeName")
 
-        mock_type_op.get.assert_has_calls(mock_status_get_calls)
+        self.assertEqual(type_id, 1)
+        mock_type_op.get_id.assert_called_once_with("TypeName")
+        self.assertFalse(mock_type_op.get.called)
 
     @mock.patch(f"{OP_PATH}.ServerTypeOp")
     def test_resolve_type_not_found(self, mock_type_op):
         """ Assumptions:
-                - ServerTypeOp.get() returns no records
+                - ServerTypeOp.get_id() does not find the record
         """
-        mock_type_op.get.return_value = list()
+        mock_type_op.get_id.return_value = None
 
         with self.assertRaisesRegex(ServerTypeNotFoundError, "Not found"):
             ServerOp.resolve_type("TypeName")
 
-        mock_status_get_calls = [mock.call(name="TypeName")]
-        mock_type_op.get.assert_has_calls(mock_status_get_calls)
+        mock_type_op.get_id.assert_called_once_with("TypeName")
 
     @mock.patch(f"{OP_PATH}.IpOp")
     def test_resolve_ip_positive(self, mock_ip_op):
@@ -223,63 +345,147 @@ class TestServerOp(TestCase):
         mock_ip_get_calls = [mock.call(address="11.11.11.11")]
         mock_ip_op.get.assert_has_calls(mock_ip_get_calls)
 
-    @mock.patch(f"{OP_PATH}.TagOp")
-    def test_resolve_tag_positive(self, mock_tag_op):
+    @mock.patch(f"{OP_PATH}.IpOp.network_filter")
+    def test_network_filter(self, mock_net_filter):
+        """ Assumptions:
+                - clause is EXISTS subquery over server_ip joined with ip
+        """
+        mock_net_filter.return_value = server_ip.c.ip_id > 0
+
+        compiled = str(ServerOp.network_filter("10.20.0.0/16"))
+
+        mock_net_filter.assert_called_once_with("10.20.0.0/16")
+        self.assertRegex(compiled, r"^EXISTS \(SELECT")
+        self.assertIn("server_ip.server_id = server.id", compiled)
+        self.assertIn("server_ip.ip_id = ip.id", compiled)
+
+    @mock.patch(f"{OP_PATH}.Server")
+    @mock.patch(f"{OP_PATH}.ServerOp.network_filter")
+    def test_get_by_network(self, mock_net_filter, mock_server):
+        """ Assumptions:
+                - used filter: network
+        """
+        result = ServerOp.get(network="10.20.0.0/16")
+
+        mock_net_filter.assert_called_once_with("10.20.0.0/16")
+        mock_server.query.filter_by().filter.assert_called_once_with(mock_net_filter())
+        self.assertEqual(result, mock_server.query.filter_by().filter().all())
+
+    def test_match_rows(self):
         """ Assumptions:
-                - TagOp.get() returns one record
+                - one key matches exactly one row
+                - one key matches two rows
+                - one key does not match any row
+                - one key is duplicated
         """
-        mock_tag = mock.MagicMock()
-        mock_tag_op.get.return_value = [mock_tag]
+        row_one = mock.MagicMock(address="11.11.11.11")
+        row_two = mock.MagicMock(address="22.22.22.22")
+        row_three = mock.MagicMock(address="22.22.22.22")
+        keys = ["11.11.11.11", "22.22.22.22", "33.33.33.33", "11.11.11.11"]
 
-        resolved_tag_obj = ServerOp.resolve_tag("tag")
-        self.assertEqual(resolved_tag_obj, mock_tag)
+        matched, missing = ServerOp.match_rows(
+            keys, [row_one, row_two, row_three], "address"
+        )
 
-        mock_tag_get_calls = [mock.call(name="tag")]
-        mock_tag_op.get.assert_has_calls(mock_tag_get_calls)
+        self.assertEqual(matched, [row_one])
+        self.assertEqual(missing, ["22.22.22.22", "33.33.33.33"])
+
+    @mock.patch(f"{OP_PATH}.IpOp")
+    def test_resolve_ips_positive(self, mock_ip_op):
+        """ Assumptions:
+                - IpOp.get_many() returns one record for every address
+        """
+        mock_ip_one = mock.MagicMock(address="11.11.11.11")
+        mock_ip_two = mock.MagicMock(address="22.22.22.22")
+        mock_ip_op.get_many.return_value = [mock_ip_two, mock_ip_one]
+        mock_ip_op.normalize_address.side_effect = lambda address: address
+
+        resolved = ServerOp.resolve_ips(["11.11.11.11", "22.22.22.22"])
+        self.assertEqual(resolved, [mock_ip_one, mock_ip_two])
+
+        mock_ip_op.get_many.assert_called_once_with(["11.11.11.11", "22.22.22.22"])
+        self.assertFalse(mock_ip_op.get.called)
+
+    @mock.patch(f"{OP_PATH}.IpOp")
+    def test_resolve_ips_not_found(self, mock_ip_op):
+        """ Assumptions:
+                - IpOp.get_many() returns records only for part of addresses
+        """
+        mock_ip_op.get_many.return_value = [mock.MagicMock(address="11.11.11.11")]
+        mock_ip_op.normalize_address.side_effect = lambda address: address
+
+        with self.assertRaisesRegex(
+            ServerIpNotFoundError, "Not found IP addresses: 22.22.22.22, 33.33.33.33"
+        ):
+            ServerOp.resolve_ips(["11.11.11.11", "22.22.22.22", "33.33.33.33"])
 
     @mock.patch(f"{OP_PATH}.TagOp")
-    def test_resolve_tag_not_found(self, mock_tag_op):
+    def test_resolve_tags_positive(self, mock_tag_op):
         """ Assumptions:
-                - TagOp.get() returns no records
+                - TagOp.get_many() returns one record for every name
         """
-        mock_tag_op.get.return_value = list()
+        mock_tag_one = mock.MagicMock()
+        mock_tag_one.name = "tag1"
+        mock_tag_two = mock.MagicMock()
+        mock_tag_two.name = "tag2"
+        mock_tag_op.get_many.return_value = [mock_tag_one, mock_tag_two]
 
-        with self.assertRaisesRegex(ServerTagNotFoundError, "Not found"):
-            ServerOp.resolve_tag("tag")
+        resolved = ServerOp.resolve_tags(["tag1", "tag2"])
+        self.assertEqual(resolved, [mock_tag_one, mock_tag_two])
 
-        mock_tag_get_calls = [mock.call(name="tag")]
-        mock_tag_op.get.assert_has_calls(mock_tag_get_calls)
+        mock_tag_op.get_many.assert_called_once_with(["tag1", "tag2"])
+        self.assertFalse(mock_tag_op.get.called)
+
+    @mock.patch(f"{OP_PATH}.TagOp")
+    def test_resolve_tags_not_found(self, mock_tag_op):
+        """ Assumptions:
+                - TagOp.get_many() returns no records
+        """
+        mock_tag_op.get_many.return_value = list()
+
+        with self.assertRaisesRegex(ServerTagNotFoundError, "Not found Tags: t1, t2"):
+            ServerOp.resolve_tags(["t1", "t2"])
 
     @mock.patch(f"{OP_PATH}.AdminOp")
-    def test_resolve_admin_positive(self, mock_admin_op):
+    def test_resolve_admins_positive(self, mock_admin_op):
         """ Assumptions:
-                - AdminOp.get() returns one record
+                - AdminOp.get_many() returns one record for every name
         """
         mock_admin = mock.MagicMock()
-        mock_admin_op.get.return_value = [mock_admin]
+        mock_admin.name = "admin"
+        mock_admin_op.get_many.return_value = [mock_admin]
 
-        resolved_adm_obj = ServerOp.resolve_admin("admin")
-        self.assertEqual(resolved_adm_obj, mock_admin)
+        resolved = ServerOp.resolve_admins(["admin"])
+        self.assertEqual(resolved, [mock_admin])
 
-        mock_adm_get_calls = [mock.call(name="admin")]
-        mock_admin_op.get.assert_has_calls(mock_adm_get_calls)
+        mock_admin_op.get_many.assert_called_once_with(["admin"])
+        self.assertFalse(mock_admin_op.get.called)
 
     @mock.patch(f"{OP_PATH}.AdminOp")
-    def test_resolve_admin_not_found(self, mock_admin_op):
+    def test_resolve_admins_not_found(self, mock_admin_op):
         """ Assumptions:
-                - AdminOp.get() returns no records
+                - AdminOp.get_many() returns no records
         """
-        mock_admin_op.get.return_value = list()
+        mock_admin_op.get_many.return_value = list()
 
-        with self.assertRaisesRegex(ServerAdminNotFoundError, "Not found"):
-            ServerOp.resolve_admin("admin")
+        with self.assertRaisesRegex(ServerAdminNotFoundError, "Not found Admins: a1"):
+            ServerOp.resolve_admins(["a1"])
 
-        mock_adm_get_calls = [mock.call(name="admin")]
-        mock_admin_op.get.assert_has_calls(mock_adm_get_calls)
+    def test_related_filter(self):
+        """ Assumptions:
+                - clause is EXISTS subquery over association table only
+        """
+        clause = ServerOp.related_filter(server_tag.c.tag_id, 1)
+        compiled = str(clause)
+
+        self.assertRegex(compiled, r"^EXISTS \(SELECT")
+        self.assertIn("server_tag.server_id = server.id", compiled)
+        self.assertIn("server_tag.tag_id = ", compiled)
+        self.assertNotIn("FROM server_tag, tag", compiled)
 
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
@@ -312,8 +518,8 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
@@ -346,8 +552,8 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
@@ -380,8 +586,8 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
@@ -414,8 +620,9 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
+    @mock.patch(f"{OP_PATH}.ServerOp.related_filter")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
@@ -430,6 +637,7 @@ class TestServerOp(TestCase):
         mock_res_ip,
         mock_res_tag,
         mock_res_adm,
+        mock_rel_filter,
         mock_server,
     ):
         """ Assumptions:
@@ -439,12 +647,15 @@ class TestServerOp(TestCase):
         mock_res_ip.return_value = mock_ip_obj
 
         mock_srv = mock.MagicMock(name="MockSrv")
-        mock_srv.ips = [mock_ip_obj]
 
-        mock_server.query.filter_by().all.return_value = [mock_srv]
+        mock_server.query.filter_by().filter().all.return_value = [mock_srv]
 
         result = ServerOp.get(ip="11.11.11.11")
         self.assertEqual([mock_srv], result)
+        mock_rel_filter.assert_called_once_with(server_ip.c.ip_id, mock_ip_obj.id)
+        mock_server.query.filter_by().filter.assert_called_with(
+            mock_rel_filter.return_value
+        )
 
         self.assertFalse(mock_val_id.called)
         self.assertFalse(mock_val_name.called)
@@ -455,8 +666,9 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
+    @mock.patch(f"{OP_PATH}.ServerOp.related_filter")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
@@ -471,21 +683,25 @@ class TestServerOp(TestCase):
         mock_res_ip,
         mock_res_tag,
         mock_res_adm,
+        mock_rel_filter,
         mock_server,
     ):
         """ Assumptions:
                 - used filter: tags
         """
         mock_tag_obj = mock.MagicMock(name="MockTagObj")
-        mock_res_tag.return_value = mock_tag_obj
+        mock_res_tag.return_value = [mock_tag_obj]
 
         mock_srv = mock.MagicMock(name="MockSrv")
-        mock_srv.tags = [mock_tag_obj]
 
-        mock_server.query.filter_by().all.return_value = [mock_srv]
+        mock_server.query.filter_by().filter().all.return_value = [mock_srv]
 
         result = ServerOp.get(tags=["tag"])
         self.assertEqual([mock_srv], result)
+        mock_rel_filter.assert_called_once_with(server_tag.c.tag_id, mock_tag_obj.id)
+        mock_server.query.filter_by().filter.assert_called_with(
+            mock_rel_filter.return_value
+        )
 
         self.assertFalse(mock_val_id.called)
         self.assertFalse(mock_val_name.called)
@@ -496,8 +712,9 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
+    @mock.patch(f"{OP_PATH}.ServerOp.related_filter")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
@@ -512,21 +729,27 @@ class TestServerOp(TestCase):
         mock_res_ip,
         mock_res_tag,
         mock_res_adm,
+        mock_rel_filter,
         mock_server,
     ):
         """ Assumptions:
                 - used filter: admins
         """
         mock_adm_obj = mock.MagicMock(name="MockAdmObj")
-        mock_res_adm.return_value = mock_adm_obj
+        mock_res_adm.return_value = [mock_adm_obj]
 
         mock_srv = mock.MagicMock(name="MockSrv")
-        mock_srv.admins = [mock_adm_obj]
 
-        mock_server.query.filter_by().all.return_value = [mock_srv]
+        mock_server.query.filter_by().filter().all.return_value = [mock_srv]
 
         result = ServerOp.get(admins=["admin"])
         self.assertEqual([mock_srv], result)
+        mock_rel_filter.assert_called_once_with(
+            server_admin.c.admin_id, mock_adm_obj.id
+        )
+        mock_server.query.filter_by().filter.assert_called_with(
+            mock_rel_filter.return_value
+        )
 
         self.assertFalse(mock_val_id.called)
         self.assertFalse(mock_val_name.called)
@@ -537,8 +760,8 @@ class TestServerOp(TestCase):
         self.assertTrue(mock_res_adm.called)
 
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
@@ -578,16 +801,102 @@ class TestServerOp(TestCase):
         self.assertTrue(mock_res_tag.called)
         self.assertTrue(mock_res_adm.called)
 
+    @mock.patch(f"{OP_PATH}.Server")
+    def test_keyset_page_first(self, mock_server):
+        """ Assumptions:
+                - first page requested, more rows exist
+        """
+        mock_query = mock.MagicMock()
+        rows = [mock.MagicMock(id=1), mock.MagicMock(id=2), mock.MagicMock(id=3)]
+        mock_query.order_by().limit().all.return_value = rows
+
+        page_rows, cursor = ServerOp.keyset_page(mock_query, None, 2)
+
+        self.assertEqual(page_rows, rows[:2])
+        self.assertEqual(cursor, 2)
+        self.assertFalse(mock_query.filter.called)
+        mock_query.order_by.assert_called_with(mock_server.id)
+        mock_query.order_by().limit.assert_called_with(3)
+
+    def test_keyset_page_last(self):
+        """ Assumptions:
+                - page after given id requested, no more rows exist
+        """
+        mock_query = mock.MagicMock()
+        rows = [mock.MagicMock(id=3)]
+        mock_query.filter().order_by().limit().all.return_value = rows
+
+        page_rows, cursor = ServerOp.keyset_page(mock_query, 2, 2)
+
+        self.assertEqual(page_rows, rows)
+        self.assertEqual(cursor, None)
+        filter_clause = mock_query.filter.call_args[0][0]
+        self.assertEqual(str(filter_clause), "server.id > :id_1")
+
+    @mock.patch(f"{OP_PATH}.ServerOp.keyset_page")
+    @mock.patch(f"{OP_PATH}.ServerOp.build_query")
+    def test_page(self, mock_build_query, mock_keyset_page):
+        """ Assumptions:
+                - page requested with filters
+        """
+        result = ServerOp.page(after_id=10, limit=5, srv_status="Status")
+
+        mock_build_query.assert_called_once_with(srv_status="Status")
+        mock_keyset_page.assert_called_once_with(mock_build_query(), 10, 5)
+        self.assertEqual(result, mock_keyset_page())
+
+    def test_page_not_valid(self):
+        """ Assumptions:
+                - after_id or limit parameters are not valid
+        """
+        with self.assertRaises(ServerIdNotValidError):
+            ServerOp.page(after_id="1")
+
+        with self.assertRaises(ServerLimitNotValidError):
+            ServerOp.page(limit=0)
+
+    @mock.patch(f"{OP_PATH}.ServerOp.keyset_page")
+    @mock.patch(f"{OP_PATH}.ServerOp.build_query")
+    def test_iter(self, mock_build_query, mock_keyset_page):
+        """ Assumptions:
+                - rows are fetched in two batches
+        """
+        mock_keyset_page.side_effect = [(["one", "two"], 2), (["three"], None)]
+
+        result = list(ServerOp.iter(batch_size=2, tags=["tag"]))
+
+        self.assertEqual(result, ["one", "two", "three"])
+        mock_build_query.assert_called_once_with(tags=["tag"])
+        exp_calls = [
+            mock.call(mock_build_query(), None, 2),
+            mock.call(mock_build_query(), 2, 2),
+        ]
+        self.assertEqual(mock_keyset_page.call_args_list, exp_calls)
+
+    @mock.patch(f"{OP_PATH}.ServerOp.keyset_page")
+    def test_iter_not_valid(self, mock_keyset_page):
+        """ Assumptions:
+                - batch size is not valid, error is raised by the call,
+                  before rows are iterated
+        """
+        with self.assertRaises(ServerLimitNotValidError):
+            ServerOp.iter(batch_size=0)
+
+        self.assertFalse(mock_keyset_page.called)
+
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_add_basic(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -596,6 +905,7 @@ class TestServerOp(TestCase):
         mock_res_adm,
         mock_server,
         mock_db,
+        mock_commit,
     ):
         """ Add new Server record without ip and tags."""
         result = ServerOp.add("Name", "SrvStatus", "SrvType")
@@ -607,19 +917,23 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_ip.called)
         self.assertFalse(mock_res_tag.called)
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
         self.assertFalse(mock_res_adm.called)
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_add_with_ips(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -628,6 +942,7 @@ class TestServerOp(TestCase):
         mock_res_adm,
         mock_server,
         mock_db,
+        mock_commit,
     ):
         """ Add new Server record with ip."""
         result = ServerOp.add("Name", "SrvStatus", "SrvType", ips=["11.11.11.11"])
@@ -642,18 +957,22 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_add_with_tags(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -662,6 +981,7 @@ class TestServerOp(TestCase):
         mock_res_adm,
         mock_server,
         mock_db,
+        mock_commit,
     ):
         """ Add new Server record with tags."""
         result = ServerOp.add("Name", "SrvStatus", "SrvType", tags=["tags"])
@@ -676,18 +996,22 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
     @mock.patch(f"{OP_PATH}.Server")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_add_with_admins(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -696,6 +1020,7 @@ class TestServerOp(TestCase):
         mock_res_adm,
         mock_server,
         mock_db,
+        mock_commit,
     ):
         """ Add new Server record with admins."""
         result = ServerOp.add("Name", "SrvStatus", "SrvType", admins=["admin"])
@@ -710,18 +1035,177 @@ class TestServerOp(TestCase):
         self.assertTrue(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
+
+    def test_collect_values(self):
+        """ Assumptions:
+                - records have single and list values, some are missing
+        """
+        records = [
+            {"srv_status": "One", "ips": ["11.11.11.11", "22.22.22.22"]},
+            {"srv_status": "Two", "ips": None},
+            {"ips": ["33.33.33.33"]},
+        ]
+        self.assertEqual(ServerOp.collect_values(records, "srv_status"), ["One", "Two"])
+        self.assertEqual(
+            ServerOp.collect_values(records, "ips"),
+            ["11.11.11.11", "22.22.22.22", "33.33.33.33"],
+        )
+
+    def test_lookup_ids(self):
+        """ Assumptions:
+                - model operations class returns one row per value
+                - duplicated values are queried once
+        """
+        mock_op = mock.MagicMock()
+        mock_tag = mock.MagicMock(id=7)
+        mock_tag.name = "tag"
+        mock_op.get_many.return_value = [mock_tag]
+
+        ids = ServerOp.lookup_ids(mock_op, ["tag", "tag", "other"], "name")
+
+        self.assertEqual(ids, {"tag": 7})
+        mock_op.get_many.assert_called_once_with(["tag", "other"])
+
+    def test_find_ids(self):
+        """ Assumptions:
+                - part of values exist in the mapping
+        """
+        found, missing = ServerOp.find_ids(["a", "b", "a", "c"], {"a": 1, "c": 3})
+        self.assertEqual(found, [1, 3])
+        self.assertEqual(missing, ["b"])
 
+        found, missing = ServerOp.find_ids(None, {"a": 1})
+        self.assertEqual(found, list())
+        self.assertEqual(missing, list())
+
+    def test_resolve_record_positive(self):
+        """ Assumptions:
+                - all names exist in the lookups
+        """
+        lookups = {
+            "srv_status": {"Status": 1},
+            "srv_type": {"Type": 2},
+            "ips": {"11.11.11.11": 3},
+            "tags": {"tag": 4},
+            "admins": {"admin": 5},
+        }
+        record = {
+            "name": "Name",
+            "srv_status": "Status",
+            "srv_type": "Type",
+            "ips": ["11.11.11.11"],
+            "tags": ["tag"],
+        }
+
+        server_row, related = ServerOp.resolve_record(record, lookups)
+
+        exp_row = {"name": "Name", "description": None, "status_id": 1, "type_id": 2}
+        self.assertEqual(server_row, exp_row)
+        self.assertEqual(related, {"ips": [3], "tags": [4], "admins": list()})
+
+    def test_resolve_record_not_found(self):
+        """ Assumptions:
+                - status, type or admin names do not exist in the lookups
+        """
+        lookups = {
+            "srv_status": {"Status": 1},
+            "srv_type": {"Type": 2},
+            "ips": dict(),
+            "tags": dict(),
+            "admins": dict(),
+        }
+        record = {"name": "Name", "srv_status": "Other", "srv_type": "Type"}
+        with self.assertRaisesRegex(ServerStatusNotFoundError, "Not found"):
+            ServerOp.resolve_record(record, lookups)
+
+        record = {"name": "Name", "srv_status": "Status", "srv_type": "Other"}
+        with self.assertRaisesRegex(ServerTypeNotFoundError, "Not found"):
+            ServerOp.resolve_record(record, lookups)
+
+        record = {
+            "name": "Name",
+            "srv_status": "Status",
+            "srv_type": "Type",
+            "admins": ["a1", "a2"],
+        }
+        with self.assertRaisesRegex(ServerAdminNotFoundError, "a1, a2"):
+            ServerOp.resolve_record(record, lookups)
+
+    @mock.patch(f"{OP_PATH}.transaction")
+    @mock.patch(f"{OP_PATH}.commit")
+    @mock.patch(f"{OP_PATH}.server_admin")
+    @mock.patch(f"{OP_PATH}.server_tag")
+    @mock.patch(f"{OP_PATH}.server_ip")
     @mock.patch(f"{OP_PATH}.DB")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.insert_rows")
+    @mock.patch(f"{OP_PATH}.ServerOp.lookup_ids")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_record")
+    @mock.patch(f"{OP_PATH}.ServerOp.validate_record")
+    @mock.patch(f"{OP_PATH}.bump_version")
+    def test_add_many(
+        self,
+        mock_bump,
+        mock_val_record,
+        mock_res_record,
+        mock_lookup_ids,
+        mock_insert_rows,
+        mock_db,
+        mock_server_ip,
+        mock_server_tag,
+        mock_server_admin,
+        mock_commit,
+        mock_transaction,
+    ):
+        """ Assumptions:
+                - three records given, second one is not valid
+                - chunk size is 1
+                - all chunks are added in one transaction
+        """
+        mock_val_record.side_effect = [None, ServerNameNotValidError("wrong"), None]
+        mock_insert_rows.side_effect = lambda rows: [row["name"] for row in rows]
+        mock_res_record.side_effect = [
+            ({"name": 1}, {"ips": [5], "tags": list(), "admins": list()}),
+            ({"name": 3}, {"ips": list(), "tags": [6], "admins": list()}),
+        ]
+
+        records = [{"name": "One"}, {"name": "Two"}, {"name": "Three"}]
+        created_ids, errors = ServerOp.add_many(records, chunk_size=1)
+
+        self.assertEqual(created_ids, [1, 3])
+        self.assertEqual(list(errors.keys()), [1])
+        self.assertTrue(isinstance(errors[1], ServerNameNotValidError))
+
+        self.assertEqual(mock_lookup_ids.call_count, 5)
+        self.assertEqual(mock_res_record.call_count, 2)
+        mock_insert_rows.assert_has_calls(
+            [mock.call([{"name": 1}]), mock.call([{"name": 3}])]
+        )
+        mock_transaction.assert_called_once_with()
+        mock_commit.assert_not_called()
+        mock_bump.assert_called_once_with("server")
+
+        exp_execute_calls = [
+            mock.call(mock_server_ip.insert(), [{"server_id": 1, "ip_id": 5}]),
+            mock.call(mock_server_tag.insert(), [{"server_id": 3, "tag_id": 6}]),
+        ]
+        mock_db.session.execute.assert_has_calls(exp_execute_calls)
+        self.assertEqual(mock_db.session.execute.call_count, 2)
+
+    @mock.patch(f"{OP_PATH}.commit")
+    @mock.patch(f"{OP_PATH}.DB")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_description")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_update_name(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -730,6 +1214,7 @@ class TestServerOp(TestCase):
         mock_res_tag,
         mock_res_adm,
         mock_db,
+        mock_commit,
     ):
         """ Update name in the existing record."""
         mock_srv_obj = mock.MagicMock()
@@ -748,18 +1233,22 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_description")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_update_srv_status(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -768,6 +1257,7 @@ class TestServerOp(TestCase):
         mock_res_tag,
         mock_res_adm,
         mock_db,
+        mock_commit,
     ):
         """ Update srv_status in the existing record."""
         mock_res_status.return_value = 222
@@ -787,18 +1277,22 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_description")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_update_srv_type(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -807,6 +1301,7 @@ class TestServerOp(TestCase):
         mock_res_tag,
         mock_res_adm,
         mock_db,
+        mock_commit,
     ):
         """ Update srv_type in the existing record."""
         mock_res_type.return_value = 222
@@ -826,18 +1321,22 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_description")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_update_description(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -846,6 +1345,7 @@ class TestServerOp(TestCase):
         mock_res_tag,
         mock_res_adm,
         mock_db,
+        mock_commit,
     ):
         """ Update description in the existing record."""
         mock_srv_obj = mock.MagicMock()
@@ -864,18 +1364,22 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_description")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_update_ips(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -884,6 +1388,7 @@ class TestServerOp(TestCase):
         mock_res_tag,
         mock_res_adm,
         mock_db,
+        mock_commit,
     ):
         """ Update ip addresses in the existing record."""
         mock_srv_obj = mock.MagicMock()
@@ -891,7 +1396,7 @@ class TestServerOp(TestCase):
 
         mock_updated = ServerOp.update(mock_srv_obj, ips=["22.22.22.22"])
 
-        self.assertEqual(mock_updated.ips, [mock_res_ip()])
+        self.assertEqual(mock_updated.ips, mock_res_ip.return_value)
 
         self.assertFalse(mock_val_name.called)
         self.assertFalse(mock_res_status.called)
@@ -902,18 +1407,22 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_description")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_update_tags(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -922,6 +1431,7 @@ class TestServerOp(TestCase):
         mock_res_tag,
         mock_res_adm,
         mock_db,
+        mock_commit,
     ):
         """ Update tags in the existing record."""
         mock_srv_obj = mock.MagicMock()
@@ -929,7 +1439,7 @@ class TestServerOp(TestCase):
 
         mock_updated = ServerOp.update(mock_srv_obj, tags=["tag"])
 
-        self.assertEqual(mock_updated.tags, [mock_res_tag()])
+        self.assertEqual(mock_updated.tags, mock_res_tag.return_value)
 
         self.assertFalse(mock_val_name.called)
         self.assertFalse(mock_res_status.called)
@@ -940,18 +1450,22 @@ class TestServerOp(TestCase):
         self.assertFalse(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admin")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tag")
-    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ip")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_admins")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_tags")
+    @mock.patch(f"{OP_PATH}.ServerOp.resolve_ips")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_description")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_type")
     @mock.patch(f"{OP_PATH}.ServerOp.resolve_status")
     @mock.patch(f"{OP_PATH}.ServerOp.validate_name")
+    @mock.patch(f"{OP_PATH}.bump_version")
     def test_update_admins(
         self,
+        mock_bump,
         mock_val_name,
         mock_res_status,
         mock_res_type,
@@ -960,6 +1474,7 @@ class TestServerOp(TestCase):
         mock_res_tag,
         mock_res_adm,
         mock_db,
+        mock_commit,
     ):
         """ Update admins in the existing record."""
         mock_srv_obj = mock.MagicMock()
@@ -967,7 +1482,7 @@ class TestServerOp(TestCase):
 
         mock_updated = ServerOp.update(mock_srv_obj, admins=["adm"])
 
-        self.assertEqual(mock_updated.admins, [mock_res_adm()])
+        self.assertEqual(mock_updated.admins, mock_res_adm.return_value)
 
         self.assertFalse(mock_val_name.called)
         self.assertFalse(mock_res_status.called)
@@ -978,14 +1493,18 @@ class TestServerOp(TestCase):
         self.assertTrue(mock_res_adm.called)
 
         self.assertTrue(mock_db.session.add.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
 
+    @mock.patch(f"{OP_PATH}.commit")
     @mock.patch(f"{OP_PATH}.DB")
-    def test_detele(self, mock_db):
+    @mock.patch(f"{OP_PATH}.bump_version")
+    def test_detele(self, mock_bump, mock_db, mock_commit):
         """ Delete record."""
         mock_srv_obj = mock.MagicMock()
 
         ServerOp.delete(mock_srv_obj)
 
         self.assertTrue(mock_db.session.delete.called)
-        self.assertTrue(mock_db.session.commit.called)
+        self.assertTrue(mock_commit.called)
+        mock_bump.assert_called_once_with("server")
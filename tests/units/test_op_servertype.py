@@ -163,10 +163,63 @@ class TestServerTypeOp(TestCase):
         exp_calls = [mock.call(id=test_id, name=test_name), mock.call().all()]
         mock_servtype.query.filter_by.assert_has_calls(exp_calls)
 
+    @mock.patch(f"{OP_PATH}.ServerTypeOp.validate_name")
+    @mock.patch(f"{OP_PATH}.ServerType")
+    def test_get_many(self, mock_servtype, mock_val_name):
+        """ Assumptions:
+                - list of names given
+        """
+        test_names = ["NameOne", "NameTwo"]
+        result = ServerTypeOp.get_many(test_names)
+
+        self.assertEqual(mock_val_name.call_count, len(test_names))
+        mock_servtype.name.in_.assert_called_once_with(test_names)
+        mock_servtype.query.filter.assert_called_once_with(mock_servtype.name.in_())
+        self.assertEqual(result, mock_servtype.query.filter().all())
+
+    @mock.patch(f"{OP_PATH}.ServerTypeOp.validate_name")
+    @mock.patch(f"{OP_PATH}.ServerType")
+    def test_get_many_empty(self, mock_servtype, mock_val_name):
+        """ Assumptions:
+                - empty list given
+        """
+        result = ServerTypeOp.get_many(list())
+
+        self.assertEqual(result, list())
+        self.assertFalse(mock_val_name.called)
+        self.assertFalse(mock_servtype.query.filter.called)
+
+    @mock.patch(f"{OP_PATH}.ServerTypeOp.CACHE")
+    @mock.patch(f"{OP_PATH}.ServerTypeOp.validate_name")
+    def test_get_id(self, mock_val_name, mock_cache):
+        """ Assumptions:
+                - ID is taken from the cache
+        """
+        mock_cache.get_id.return_value = 5
+
+        row_id = ServerTypeOp.get_id("Name")
+
+        self.assertEqual(row_id, 5)
+        mock_val_name.assert_called_once_with("Name")
+        mock_cache.get_id.assert_called_once_with("Name")
+
+    @mock.patch(f"{OP_PATH}.after_rollback")
+    @mock.patch(f"{OP_PATH}.commit")
+    @mock.patch(f"{OP_PATH}.ServerTypeOp.CACHE")
     @mock.patch(f"{OP_PATH}.DB")
     @mock.patch(f"{OP_PATH}.ServerTypeOp.validate_name")
     @mock.patch(f"{OP_PATH}.ServerType")
-    def test_add(self, mock_servtype, mock_val_name, mock_db):
+    @mock.patch(f"{OP_PATH}.bump_version")
+    def test_add(
+        self,
+        mock_bump,
+        mock_servtype,
+        mock_val_name,
+        mock_db,
+        mock_cache,
+        mock_commit,
+        mock_after_rollback,
+    ):
         """ Assumptions:
                 - add method run
         """
@@ -179,14 +232,31 @@ class TestServerTypeOp(TestCase):
         self.assertEqual(new_ip, mock_servtype())
         self.assertTrue(mock_val_name.called)
 
-        db_exp_calls = [mock.call.session.add(new_ip), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.add(new_ip)]
 
         mock_db.assert_has_calls(db_exp_calls)
-
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("server_type")
+        self.assertTrue(mock_cache.invalidate.called)
+        mock_after_rollback.assert_called_once_with(mock_cache.invalidate)
+
+    @mock.patch(f"{OP_PATH}.after_rollback")
+    @mock.patch(f"{OP_PATH}.commit")
+    @mock.patch(f"{OP_PATH}.ServerTypeOp.CACHE")
     @mock.patch(f"{OP_PATH}.DB")
     @mock.patch(f"{OP_PATH}.ServerTypeOp.validate_name")
     @mock.patch(f"{OP_PATH}.ServerType")
-    def test_update(self, mock_servtype, mock_val_name, mock_db):
+    @mock.patch(f"{OP_PATH}.bump_version")
+    def test_update(
+        self,
+        mock_bump,
+        mock_servtype,
+        mock_val_name,
+        mock_db,
+        mock_cache,
+        mock_commit,
+        mock_after_rollback,
+    ):
         """ Assumptions:
                 - update method run
         """
@@ -197,13 +267,29 @@ class TestServerTypeOp(TestCase):
 
         self.assertTrue(mock_val_name.called)
 
-        db_exp_calls = [mock.call.session.add(updated_ip), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.add(updated_ip)]
 
         mock_db.assert_has_calls(db_exp_calls)
-
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("server_type")
+        self.assertTrue(mock_cache.invalidate.called)
+        mock_after_rollback.assert_called_once_with(mock_cache.invalidate)
+
+    @mock.patch(f"{OP_PATH}.after_rollback")
+    @mock.patch(f"{OP_PATH}.commit")
+    @mock.patch(f"{OP_PATH}.ServerTypeOp.CACHE")
     @mock.patch(f"{OP_PATH}.DB")
     @mock.patch(f"{OP_PATH}.ServerType")
-    def test_delete(self, mock_servtype, mock_db):
+    @mock.patch(f"{OP_PATH}.bump_version")
+    def test_delete(
+        self,
+        mock_bump,
+        mock_servtype,
+        mock_db,
+        mock_cache,
+        mock_commit,
+        mock_after_rollback,
+    ):
         """ Assumptions:
                 - delete method run
         """
@@ -211,6 +297,10 @@ class TestServerTypeOp(TestCase):
 
         ServerTypeOp.delete(ip_obj)
 
-        db_exp_calls = [mock.call.session.delete(ip_obj), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.delete(ip_obj)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("server_type")
+        self.assertTrue(mock_cache.invalidate.called)
+        mock_after_rollback.assert_called_once_with(mock_cache.invalidate)
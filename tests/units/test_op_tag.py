@@ -138,10 +138,38 @@ class TestOpTag(TestCase):
         exp_calls = [mock.call(id=test_id, name=test_name), mock.call().all()]
         mock_tag.query.filter_by.assert_has_calls(exp_calls)
 
+    @mock.patch(f"{OP_PATH}.basic.tag.TagOp.validate_name")
+    @mock.patch(f"{OP_PATH}.basic.tag.Tag")
+    def test_get_many(self, mock_tag, mock_val_name):
+        """ Assumptions:
+                - list of name values given
+        """
+        test_values = ["tag1", "tag2"]
+        result = TagOp.get_many(test_values)
+
+        self.assertEqual(mock_val_name.call_count, len(test_values))
+        mock_tag.name.in_.assert_called_once_with(test_values)
+        mock_tag.query.filter.assert_called_once_with(mock_tag.name.in_())
+        self.assertEqual(result, mock_tag.query.filter().all())
+
+    @mock.patch(f"{OP_PATH}.basic.tag.TagOp.validate_name")
+    @mock.patch(f"{OP_PATH}.basic.tag.Tag")
+    def test_get_many_empty(self, mock_tag, mock_val_name):
+        """ Assumptions:
+                - empty list given
+        """
+        result = TagOp.get_many(list())
+
+        self.assertEqual(result, list())
+        self.assertFalse(mock_val_name.called)
+        self.assertFalse(mock_tag.query.filter.called)
+
+    @mock.patch(f"{OP_PATH}.basic.tag.commit")
     @mock.patch(f"{OP_PATH}.basic.tag.DB")
     @mock.patch(f"{OP_PATH}.basic.tag.TagOp.validate_name")
     @mock.patch(f"{OP_PATH}.basic.tag.Tag")
-    def test_add(self, mock_tag, mock_val_name, mock_db):
+    @mock.patch(f"{OP_PATH}.basic.tag.bump_version")
+    def test_add(self, mock_bump, mock_tag, mock_val_name, mock_db, mock_commit):
         """ Assumptions:
                 - add method run
         """
@@ -155,14 +183,18 @@ class TestOpTag(TestCase):
 
         self.assertTrue(mock_val_name.called)
 
-        db_exp_calls = [mock.call.session.add(new_tag), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.add(new_tag)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("tag")
 
+    @mock.patch(f"{OP_PATH}.basic.tag.commit")
     @mock.patch(f"{OP_PATH}.basic.tag.DB")
     @mock.patch(f"{OP_PATH}.basic.tag.TagOp.validate_name")
     @mock.patch(f"{OP_PATH}.basic.tag.Tag")
-    def test_update(self, mock_tag, mock_val_name, mock_db):
+    @mock.patch(f"{OP_PATH}.basic.tag.bump_version")
+    def test_update(self, mock_bump, mock_tag, mock_val_name, mock_db, mock_commit):
         """ Assumptions:
                 - update method run
         """
@@ -173,16 +205,17 @@ class TestOpTag(TestCase):
 
         self.assertTrue(mock_val_name.called)
 
-        db_exp_calls = [
-            mock.call.session.add(updated_admin),
-            mock.call.session.commit(),
-        ]
+        db_exp_calls = [mock.call.session.add(updated_admin)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("tag")
 
+    @mock.patch(f"{OP_PATH}.basic.tag.commit")
     @mock.patch(f"{OP_PATH}.basic.tag.DB")
     @mock.patch(f"{OP_PATH}.basic.tag.Tag")
-    def test_delete(self, mock_tag, mock_db):
+    @mock.patch(f"{OP_PATH}.basic.tag.bump_version")
+    def test_delete(self, mock_bump, mock_tag, mock_db, mock_commit):
         """ Assumptions:
                 - delete method run
         """
@@ -190,6 +223,8 @@ class TestOpTag(TestCase):
 
         TagOp.delete(tag_obj)
 
-        db_exp_calls = [mock.call.session.delete(tag_obj), mock.call.session.commit()]
+        db_exp_calls = [mock.call.session.delete(tag_obj)]
 
         mock_db.assert_has_calls(db_exp_calls)
+        mock_commit.assert_called_once_with()
+        mock_bump.assert_called_once_with("tag")
@@ -0,0 +1,66 @@
+from unittest import TestCase
+
+from app import create_app
+from app.metrics.prometheus import METRICS
+from app.metrics.prometheus import cumulative_buckets
+from app.metrics.prometheus import format_labels
+
+
+class TestPrometheus(TestCase):
+    """ Unit tests for Prometheus metrics."""
+
+    def test_cumulative_buckets(self):
+        """ Assumptions:
+                - all buckets are reported, with cumulative counts
+        """
+        samples = [
+            ("latency_bucket", {"le": "0.1", "route": "/"}, 2.0),
+            ("latency_bucket", {"le": "+Inf", "route": "/"}, 1.0),
+            ("latency_count", {"route": "/"}, 3.0),
+        ]
+
+        self.assertEqual(
+            cumulative_buckets(samples, (0.1, 1.0)),
+            [
+                ("latency_bucket", {"le": "0.1", "route": "/"}, 2.0),
+                ("latency_bucket", {"le": "1.0", "route": "/"}, 2.0),
+                ("latency_bucket", {"le": "+Inf", "route": "/"}, 3.0),
+                ("latency_count", {"route": "/"}, 3.0),
+            ],
+        )
+
+    def test_format_labels(self):
+        """ Assumptions:
+                - labels are sorted and escaped
+        """
+        self.assertEqual(format_labels(dict()), "")
+        self.assertEqual(
+            format_labels({"route": "/", "error": 'a"b'}), '{error="a\\"b",route="/"}'
+        )
+
+    def test_endpoint(self):
+        """ Assumptions:
+                - requests are counted by route and status
+                - metrics are served in Prometheus text format
+        """
+        app = create_app(SQLALCHEMY_DATABASE_URI="sqlite://")
+        client = app.test_client()
+        client.get("/")
+        client.get("/missing")
+
+        response = client.get("/metrics")
+        text = response.get_data(as_text=True)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content_type.startswith("text/plain"))
+        self.assertIn("# TYPE smt_http_requests_total counter", text)
+        self.assertIn(
+            'smt_http_requests_total{method="GET",route="/",status="200"} 1', text
+        )
+        self.assertIn(
+            'smt_http_requests_total{method="GET",route="unmatched",status="404"} 1',
+            text,
+        )
+        self.assertIn("smt_http_requests_in_flight 1", text)
+        self.assertIn('smt_catalog_cache_hits_total{cache="server_status"}', text)
+        METRICS.configure()
@@ -0,0 +1,154 @@
+from unittest import TestCase
+
+from sqlalchemy import create_engine
+
+from app.db.slow_queries import SlowQueryLog
+from app.db.slow_queries import fingerprint
+from app.db.slow_queries import redact
+
+
+OPERATION_SOURCE = """
+class ExampleOp:
+    @classmethod
+    def get(cls, engine):
+        return engine.execute("SELECT ? AS value", (1,)).fetchall()
+"""
+
+
+def operations_module():
+    """ Namespace of Op class defined in app.db.operations package."""
+    namespace = {"__name__": "app.db.operations.example"}
+    exec(OPERATION_SOURCE, namespace)
+    return namespace
+
+
+class TestFingerprint(TestCase):
+    """ Unit tests for fingerprint and redact functions."""
+
+    def test_literals(self):
+        """ Assumptions:
+                - literals and parameters are replaced by ?
+                - lists of them are replaced by (?+)
+                - identifiers with digits and casts are kept
+        """
+        first, first_id = fingerprint(
+            "SELECT server1.id FROM server1\n  WHERE name = 'web''01' "
+            "AND id IN (1, 2, 3) AND ip = %(ip_1)s AND x::int > -1.5"
+        )
+        second, second_id = fingerprint(
+            "SELECT server1.id FROM server1 WHERE name = 'db' "
+            "AND id IN (4) AND ip = %(ip_1)s AND x::int > 7"
+        )
+
+        self.assertEqual(
+            first,
+            "SELECT server1.id FROM server1 WHERE name = ? "
+            "AND id IN (?+) AND ip = ? AND x::int > ?",
+        )
+        self.assertEqual(first_id, fingerprint(first)[1])
+        self.assertNotEqual(first_id, second_id)
+        self.assertEqual(fingerprint("SELECT :name, ?")[0], "SELECT ?, ?")
+
+    def test_redact(self):
+        """ Assumptions:
+                - values are replaced by their type names
+        """
+        self.assertEqual(redact({"name": "web", "id": 1}), {"name": "str", "id": "int"})
+        self.assertEqual(redact(("web", None)), ["str", "NoneType"])
+
+
+class TestSlowQueryLog(TestCase):
+    """ Unit tests for SlowQueryLog class."""
+
+    def setUp(self):
+        self.log = SlowQueryLog()
+        self.addCleanup(self.log.configure, None)
+
+    def test_record(self):
+        """ Assumptions:
+                - statements are aggregated by fingerprint
+                - parameters and plan of the slowest run are kept
+                - fingerprint with the lowest total is evicted
+        """
+        self.log.configure(10, size=2)
+        with self.assertLogs("app.db.slow_queries", "WARNING"):
+            self.log.record("A", "a", ("web",), 30.0, "ServerOp.get")
+            self.log.record("A", "a", ("web", 1), 50.0, "ServerOp.get", ["SCAN"])
+            self.log.record("A", "a", ("web",), 20.0, "TagOp.get")
+            self.log.record("B", "b", (), 90.0)
+            self.log.record("C", "c", (), 95.0)
+
+        top = self.log.top()
+        self.assertEqual([entry["fingerprint"] for entry in top], ["a", "c"])
+        self.assertEqual(top[0]["count"], 3)
+        self.assertEqual(top[0]["total_ms"], 100.0)
+        self.assertEqual(top[0]["mean_ms"], 33.333)
+        self.assertEqual(top[0]["max_ms"], 50.0)
+        self.assertEqual(top[0]["parameters"], ["str", "int"])
+        self.assertEqual(top[0]["plan"], ["SCAN"])
+        self.assertEqual(top[0]["operations"], ["ServerOp.get", "TagOp.get"])
+        self.assertEqual(len(self.log.top(1)), 1)
+
+        self.log.reset()
+        self.assertEqual(self.log.top(), list())
+
+    def test_engine(self):
+        """ Assumptions:
+                - statements above threshold are recorded with the calling
+                  Op method and query plan
+                - disabled log records nothing
+        """
+        engine = create_engine("sqlite://")
+        self.log.configure(0, redact_parameters=False, explain=True)
+        example_op = operations_module()["ExampleOp"]
+
+        with self.assertLogs("app.db.slow_queries", "WARNING"):
+            self.assertEqual(example_op.get(engine), [(1,)])
+            engine.execute("SELECT ? AS value", (2,))
+
+        (entry,) = self.log.top()
+        self.assertEqual(entry["statement"], "SELECT ? AS value")
+        self.assertEqual(entry["count"], 2)
+        self.assertEqual(entry["operations"], ["ExampleOp.get", None])
+        self.assertIsNotNone(entry["plan"])
+
+        self.log.configure(None)
+        self.log.reset()
+        engine.execute("SELECT 1")
+        self.assertEqual(self.log.top(), list())
+
+    def test_explain_plan(self):
+        """ Assumptions:
+                - SELECT, INSERT, UPDATE and DELETE statements are explained
+                - failed EXPLAIN leaves transaction of the caller usable
+        """
+        engine = create_engine("sqlite://")
+        with engine.connect() as conn:
+            conn.execute("CREATE TABLE item (id INTEGER)")
+            with conn.begin():
+                conn.execute("INSERT INTO item VALUES (1)")
+                with self.assertLogs("app.db.slow_queries", "WARNING"):
+                    plan = SlowQueryLog.explain_plan(conn, "SELECT * FROM missing", ())
+                self.assertIsNone(plan)
+
+                plan = SlowQueryLog.explain_plan(
+                    conn, "SELECT id FROM item WHERE id = ?", (1,), analyze=True
+                )
+                self.assertIsNotNone(plan)
+                plan = SlowQueryLog.explain_plan(conn, "CREATE TABLE other (id)", ())
+                self.assertIsNone(plan)
+
+                conn.execute("INSERT INTO item VALUES (2)")
+            self.assertEqual(
+                conn.execute("SELECT id FROM item").fetchall(), [(1,), (2,)]
+            )
+
+    def test_threshold(self):
+        """ Assumptions:
+                - statements faster than threshold are not recorded
+        """
+        engine = create_engine("sqlite://")
+        self.log.configure(10000)
+        engine.execute("SELECT 1")
+
+        self.assertEqual(self.log.top(), list())
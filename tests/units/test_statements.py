@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+from sqlalchemy import create_engine
+
+from app.db.statements import StatementCounter
+
+
+class TestStatementCounter(TestCase):
+    """ Unit tests for StatementCounter class."""
+
+    def setUp(self):
+        self.engine = create_engine("sqlite://")
+
+    def test_count(self):
+        """ Assumptions:
+                - statements executed inside the context are counted
+                - executemany is counted once
+        """
+        self.engine.execute("CREATE TABLE test (id INTEGER)")
+
+        with StatementCounter(self.engine) as counter:
+            self.engine.execute("INSERT INTO test VALUES (1)")
+            self.engine.execute("INSERT INTO test VALUES (?)", [(2,), (3,)])
+            self.engine.execute("SELECT id FROM test").fetchall()
+
+        self.engine.execute("SELECT id FROM test").fetchall()
+
+        self.assertEqual(counter.count, 3)
+        self.assertEqual(counter.statements[-1], "SELECT id FROM test")
+
+    def test_start_stop(self):
+        """ Assumptions:
+                - counting starts from zero on every start
+        """
+        counter = StatementCounter(self.engine)
+
+        counter.start()
+        self.engine.execute("SELECT 1")
+        counter.stop()
+        self.assertEqual(counter.count, 1)
+
+        counter.start()
+        counter.stop()
+        self.assertEqual(counter.count, 0)
+
+    def test_reset(self):
+        """ Assumptions:
+                - statements counted before reset are forgotten
+        """
+        with StatementCounter(self.engine) as counter:
+            self.engine.execute("SELECT 1")
+            counter.reset()
+            self.engine.execute("SELECT 2")
+
+        self.assertEqual(counter.statements, ["SELECT 2"])
+
+    def test_transaction_control_not_counted(self):
+        """ Assumptions:
+                - savepoint statements are not counted
+        """
+        connection = self.engine.connect()
+        with StatementCounter(self.engine) as counter:
+            transaction = connection.begin()
+            savepoint = connection.begin_nested()
+            connection.execute("SELECT 1")
+            savepoint.commit()
+            transaction.rollback()
+
+        self.assertEqual(counter.statements, ["SELECT 1"])
@@ -0,0 +1,107 @@
+from unittest import TestCase
+from unittest import mock
+
+from app.db.transaction import after_rollback
+from app.db.transaction import commit
+from app.db.transaction import in_transaction
+from app.db.transaction import transaction
+
+
+OP_PATH = "app.db.transaction"
+
+
+class TestTransaction(TestCase):
+    """ Unit tests for transaction context and commit helpers."""
+
+    def setUp(self):
+        patcher = mock.patch(f"{OP_PATH}.DB")
+        self.mock_db = patcher.start()
+        self.addCleanup(patcher.stop)
+        self.mock_db.session.info = dict()
+
+    def test_commit_outside_transaction(self):
+        """ Assumptions:
+                - commit is done by every operation
+        """
+        self.assertFalse(in_transaction())
+
+        commit()
+
+        self.mock_db.session.commit.assert_called_once_with()
+        self.assertFalse(self.mock_db.session.flush.called)
+
+    def test_commit_in_transaction(self):
+        """ Assumptions:
+                - operations only flush, commit is done at exit
+        """
+        with transaction():
+            self.assertTrue(in_transaction())
+            commit()
+            commit()
+            self.assertFalse(self.mock_db.session.commit.called)
+
+        self.assertFalse(in_transaction())
+        self.assertEqual(self.mock_db.session.flush.call_count, 2)
+        self.mock_db.session.commit.assert_called_once_with()
+        self.assertFalse(self.mock_db.session.begin_nested.called)
+
+    def test_transaction_rollback(self):
+        """ Assumptions:
+                - exception rolls back changes and is raised again
+                - rollback callbacks are called
+        """
+        callback = mock.MagicMock()
+        after_rollback(callback)
+
+        with self.assertRaises(ValueError):
+            with transaction():
+                commit()
+                after_rollback(callback)
+                raise ValueError("wrong")
+
+        self.mock_db.session.rollback.assert_called_once_with()
+        self.assertFalse(self.mock_db.session.commit.called)
+        callback.assert_called_once_with()
+        self.assertFalse(in_transaction())
+
+    def test_nested_transaction(self):
+        """ Assumptions:
+                - nested context uses savepoint
+                - exception in nested context rolls back savepoint only
+        """
+        savepoint = self.mock_db.session.begin_nested()
+        outer_callback = mock.MagicMock()
+        inner_callback = mock.MagicMock()
+
+        with transaction():
+            after_rollback(outer_callback)
+
+            with transaction():
+                pass
+            savepoint.commit.assert_called_once_with()
+
+            with self.assertRaises(ValueError):
+                with transaction():
+                    after_rollback(inner_callback)
+                    raise ValueError("wrong")
+            savepoint.rollback.assert_called_once_with()
+
+            self.assertTrue(in_transaction())
+
+        inner_callback.assert_called_once_with()
+        self.assertFalse(outer_callback.called)
+        self.assertFalse(self.mock_db.session.rollback.called)
+        self.mock_db.session.commit.assert_called_once_with()
+
+    def test_commit_error(self):
+        """ Assumptions:
+                - error raised by commit at exit rolls back changes
+        """
+        self.mock_db.session.commit.side_effect = ValueError("wrong")
+
+        with self.assertRaises(ValueError):
+            with transaction():
+                pass
+
+        self.mock_db.session.rollback.assert_called_once_with()
+        self.assertFalse(in_transaction())
@@ -0,0 +1,76 @@
+import ipaddress
+
+from unittest import TestCase
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.dialects import sqlite
+
+from app.db.types import IpAddressType
+
+
+class TestIpAddressType(TestCase):
+    """ Unit tests for IpAddressType class."""
+
+    def setUp(self):
+        self.ip_type = IpAddressType()
+        self.pg_dialect = postgresql.dialect()
+        self.sqlite_dialect = sqlite.dialect()
+
+    def test_pack_unpack(self):
+        """ Assumptions:
+                - IPv4 and IPv6 addresses are packed and unpacked
+        """
+        for address in ["10.20.0.1", "::1", "fe80::1"]:
+            ip = ipaddress.ip_address(address)
+            packed = IpAddressType.pack(ip)
+            self.assertEqual(packed[0], ip.version)
+            self.assertEqual(IpAddressType.unpack(packed), ip)
+
+    def test_pack_order(self):
+        """ Assumptions:
+                - packed addresses keep order of addresses,
+                  IPv4 addresses are lower than IPv6 ones
+        """
+        addresses = ["9.255.255.255", "10.0.0.0", "10.20.0.1", "200.0.0.1", "::1"]
+        packed = [IpAddressType.pack(ipaddress.ip_address(ip)) for ip in addresses]
+        self.assertEqual(packed, sorted(packed))
+
+    def test_bind_param(self):
+        """ Assumptions:
+                - inet string is bound for PostgreSQL, packed bytes for others
+        """
+        self.assertEqual(
+            self.ip_type.process_bind_param("FE80::0001", self.pg_dialect), "fe80::1"
+        )
+        self.assertEqual(
+            self.ip_type.process_bind_param("10.0.0.1", self.sqlite_dialect),
+            b"\x04\x0a\x00\x00\x01",
+        )
+        self.assertEqual(self.ip_type.process_bind_param(None, self.pg_dialect), None)
+
+    def test_result_value(self):
+        """ Assumptions:
+                - normalized address string is returned for every database
+        """
+        self.assertEqual(
+            self.ip_type.process_result_value("10.0.0.1", self.pg_dialect), "10.0.0.1"
+        )
+        self.assertEqual(
+            self.ip_type.process_result_value(
+                b"\x04\x0a\x00\x00\x01", self.sqlite_dialect
+            ),
+            "10.0.0.1",
+        )
+        self.assertEqual(
+            self.ip_type.process_result_value(None, self.sqlite_dialect), None
+        )
+
+    def test_dialect_impl(self):
+        """ Assumptions:
+                - inet type is used for PostgreSQL
+        """
+        pg_impl = self.ip_type.load_dialect_impl(self.pg_dialect)
+        sqlite_impl = self.ip_type.load_dialect_impl(self.sqlite_dialect)
+
+        self.assertTrue(isinstance(pg_impl, postgresql.INET))
+        self.assertFalse(isinstance(sqlite_impl, postgresql.INET))